@@ -0,0 +1,83 @@
+"""Time a multi-league, multi-season backtest sweep.
+
+Run from the repository root with ``python -m benchmarks.bench_backtest``.
+Synthetic seasons (``TEAMS`` teams playing ``GAMES`` games with lines
+snapshotted the evening before and closing lines) are generated for ``LEAGUES`` leagues over ``SEASONS``
+seasons and backtested serially and with one worker process per CPU.
+"""
+from __future__ import annotations
+
+import os
+import random
+import time
+from datetime import date, datetime, time as clock, timedelta
+from typing import Dict
+
+from saavygambler.models import Event, Odds
+from saavygambler.services.backtest import Backtester, BacktestReport, SeasonData
+from saavygambler.services.ratings import EloParameters
+
+LEAGUES = 5
+SEASONS = 6
+TEAMS = 30
+GAMES = 1_230
+
+
+def _season(seed: int) -> SeasonData:
+    rng = random.Random(seed)
+    strength = {f"T{index}": rng.gauss(0, 6) for index in range(TEAMS)}
+    teams = list(strength)
+    start = date(2020, 10, 20)
+    events, odds, closing = [], [], []
+    for index in range(GAMES):
+        home, away = rng.sample(teams, 2)
+        expected = strength[home] - strength[away] + 2.5
+        margin = round(rng.gauss(expected, 12))
+        total = round(rng.gauss(220, 18))
+        event_id = f"{seed}-{index}"
+        day = start + timedelta(days=index // 8)
+        snapshot = datetime.combine(day - timedelta(days=1), clock(20))
+        events.append(
+            Event(
+                event_id=event_id,
+                league_id=str(seed),
+                home_team_id=home,
+                away_team_id=away,
+                event_date=day,
+                status="Match Finished",
+                home_score=(total + margin) // 2,
+                away_score=(total - margin) // 2,
+            )
+        )
+        line = round(-(expected + rng.gauss(0, 2)) * 2) / 2
+        odds.append(Odds(event_id, -150 if line < 0 else 130, 130 if line < 0 else -150, line, -110, -110,
+                         219.5, -110, -110, last_updated=snapshot))
+        closing.append(Odds(event_id, -160 if line < 0 else 140, 140 if line < 0 else -160,
+                            line + rng.choice((-1.0, -0.5, 0.0, 0.5, 1.0)), -110, -110, 220.0, -110, -110))
+    return SeasonData(events, odds, closing)
+
+
+def main() -> None:
+    seasons: Dict[str, SeasonData] = {
+        f"L{league}/{2020 + season}": _season(league * 100 + season)
+        for league in range(LEAGUES)
+        for season in range(SEASONS)
+    }
+    games = sum(len(season.events) for season in seasons.values())
+    workers = os.cpu_count() or 1
+    print(f"{len(seasons)} seasons, {games:,} games, {workers} CPU(s)")
+    for processes in sorted({1, workers}):
+        backtester = Backtester(elo=EloParameters(), processes=processes)
+        started = time.perf_counter()
+        reports = backtester.run_many(seasons)
+        elapsed = time.perf_counter() - started
+        print(f"{processes:>2} process(es)  {elapsed:6.2f}s  {games / elapsed:10,.0f} games/s")
+    combined = BacktestReport.combine(reports.values())
+    for name in ("spread", "total", "moneyline"):
+        market = getattr(combined, name)
+        print(f"{name:<10} {market.record:>17}  ROI {market.roi:+.3f}  CLV {market.average_clv:+.3f}")
+    print(f"calibration brier {combined.calibration.brier:.4f}  log loss {combined.calibration.log_loss:.4f}")
+
+
+if __name__ == "__main__":
+    main()
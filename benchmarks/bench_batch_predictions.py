@@ -0,0 +1,80 @@
+"""Compare scalar and batch ``PredictionEngine`` throughput.
+
+Run from the repository root with ``python -m benchmarks.bench_batch_predictions``.
+One million random matchups are priced with :py:meth:`PredictionEngine.predict_spreads`,
+``predict_totals`` and ``predict_moneylines`` (exact and ``numpy.exp`` variants);
+the scalar methods are timed on a sample and extrapolated, and the sample is
+checked for bit-for-bit agreement with the batch results.
+"""
+from __future__ import annotations
+
+import random
+import time
+from datetime import date
+from typing import List, Optional, Tuple
+
+from saavygambler.models import Event, Odds, TeamStats
+from saavygambler.services.prediction import MatchupColumns, PredictionEngine
+
+MATCHUPS = 1_000_000
+SCALAR_SAMPLE = 20_000
+TEAMS = 500
+
+
+def _matchups(count: int) -> List[Tuple[TeamStats, TeamStats, Optional[Odds]]]:
+    rng = random.Random(7)
+    teams = [
+        TeamStats(
+            team_id=str(index),
+            name=f"Team {index}",
+            wins=rng.randint(0, 60),
+            losses=rng.randint(0, 60),
+            points_for=rng.uniform(90, 125),
+            points_against=rng.uniform(90, 125),
+        )
+        for index in range(TEAMS)
+    ]
+    odds = Odds("0", -140, 120, -2.5, -110, -110, 214.5, -110, -110)
+    return [(rng.choice(teams), rng.choice(teams), odds if index % 4 else None) for index in range(count)]
+
+
+def main() -> None:
+    engine = PredictionEngine()
+    matchups = _matchups(MATCHUPS)
+    started = time.perf_counter()
+    columns = MatchupColumns.from_matchups(matchups)
+    print(f"{'build columns':<28} {time.perf_counter() - started:7.3f}s")
+
+    timings = {}
+    for label, run in (
+        ("batch (exact)", lambda: engine.predict_moneylines(columns)),
+        ("batch (numpy.exp)", lambda: engine.predict_moneylines(columns, exact=False)),
+    ):
+        started = time.perf_counter()
+        spreads, totals, moneylines = engine.predict_spreads(columns), engine.predict_totals(columns), run()
+        timings[label] = time.perf_counter() - started
+
+    event = Event("0", "0", "h", "a", date.today())
+    sample = matchups[:SCALAR_SAMPLE]
+    started = time.perf_counter()
+    scalar = [
+        (
+            engine.predict_spread(event, home, away, odds).spread,
+            engine.predict_total(event, home, away, odds).total,
+            engine.predict_moneyline(event, home, away, odds).home_win_probability,
+        )
+        for home, away, odds in sample
+    ]
+    timings["scalar (extrapolated)"] = (time.perf_counter() - started) * MATCHUPS / SCALAR_SAMPLE
+
+    exact = engine.predict_moneylines(columns)
+    batch = zip(spreads.spread.tolist(), totals.total.tolist(), exact.home_win_probability.tolist())
+    assert scalar == list(batch)[:SCALAR_SAMPLE], "batch results diverge from the scalar methods"
+
+    print(f"{MATCHUPS:,} matchups (spread, total and moneyline)")
+    for label, elapsed in timings.items():
+        print(f"{label:<28} {elapsed:7.3f}s  {MATCHUPS / elapsed:12,.0f} matchups/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure per-record decode cost of TheSportsDB event payloads.
+
+Run from the repository root with ``python -m benchmarks.bench_decoding``. A
+synthetic ``events`` array of 100k records is decoded with the compiled
+:data:`~saavygambler.providers.thesportsdb.EVENT_DECODER` and with the previous
+``item.get``/``strptime`` implementation for comparison.
+"""
+from __future__ import annotations
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from saavygambler.models import Event
+from saavygambler.providers.thesportsdb import EVENT_DECODER
+
+RECORDS = 100_000
+ROUNDS = 3
+
+START = date(2024, 8, 1)
+EVENTS: List[Dict[str, Any]] = [
+    {
+        "idEvent": str(index),
+        "idLeague": "4328",
+        "idHomeTeam": str(index % 20),
+        "idAwayTeam": str((index + 1) % 20),
+        "dateEvent": (START + timedelta(days=index % 300)).isoformat(),
+        "strVenue": "Stadium",
+        "strStatus": "Match Finished",
+        "intHomeScore": str(index % 5),
+        "intAwayScore": None,
+        "strHomeTeam": "Home",
+        "strAwayTeam": "Away",
+    }
+    for index in range(RECORDS)
+]
+
+
+def _safe_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _legacy_date(value: Optional[str]) -> date:
+    if not value:
+        return date.today()
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return date.today()
+
+
+def legacy_decode(item: Dict[str, Any]) -> Event:
+    return Event(
+        event_id=item.get("idEvent", ""),
+        league_id=item.get("idLeague"),
+        home_team_id=item.get("idHomeTeam", ""),
+        away_team_id=item.get("idAwayTeam", ""),
+        event_date=_legacy_date(item.get("dateEvent")),
+        venue=item.get("strVenue"),
+        status=item.get("strStatus"),
+        home_score=_safe_int(item.get("intHomeScore")),
+        away_score=_safe_int(item.get("intAwayScore")),
+        home_team_name=item.get("strHomeTeam"),
+        away_team_name=item.get("strAwayTeam"),
+    )
+
+
+def _best(fn) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    legacy = _best(lambda: [legacy_decode(item) for item in EVENTS])
+    compiled = _best(lambda: EVENT_DECODER.decode_many(EVENTS))
+    assert [legacy_decode(item) for item in EVENTS[:1000]] == EVENT_DECODER.decode_many(EVENTS[:1000])
+
+    for label, seconds in (("item.get + strptime", legacy), ("compiled decoder", compiled)):
+        print(f"{label:<22} {seconds * 1e9 / RECORDS:8.0f} ns/record  ({seconds:.3f}s total)")
+    print(f"speed-up: {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
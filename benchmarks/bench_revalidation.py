@@ -0,0 +1,92 @@
+"""Measure conditional revalidation savings against a local stub server.
+
+Run from the repository root with ``python -m benchmarks.bench_revalidation``. The stub serves a large
+``eventsnextleague.php``-style payload and honours ``If-None-Match``; the
+benchmark compares downloaded bytes and latency with validators enabled and
+disabled.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The upstream is a local stub, so the client-side rate limit is explicitly switched
+# off (``0``); the default free-tier limit would otherwise dominate the timings.
+os.environ.setdefault("SAAVYGAMBLER_RATE_LIMIT_PER_SECOND", "0")
+
+from saavygambler.providers.api_client import APIClient
+
+EVENTS = 2000
+ROUNDS = 200
+
+PAYLOAD = json.dumps(
+    {
+        "events": [
+            {
+                "idEvent": str(index),
+                "idLeague": "4328",
+                "idHomeTeam": str(index % 20),
+                "idAwayTeam": str((index + 1) % 20),
+                "dateEvent": "2024-08-17",
+                "strVenue": "Stadium",
+                "strHomeTeam": "Home",
+                "strAwayTeam": "Away",
+            }
+            for index in range(EVENTS)
+        ]
+    }
+).encode("utf-8")
+ETAG = '"league-4328-v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    send_validators = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        if self.send_validators and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        if self.send_validators:
+            self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _run(send_validators: bool) -> None:
+    _Handler.send_validators = send_validators
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/eventsnextleague.php"
+    client = APIClient()
+    try:
+        client.get_json(url, cache_ttl=1e-6)
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            client.get_json(url, cache_ttl=1e-6)
+        elapsed = time.perf_counter() - started
+    finally:
+        client.close()
+        server.shutdown()
+    label = "validators" if send_validators else "no validators"
+    print(
+        f"{label:>14}: {elapsed / ROUNDS * 1000:7.3f} ms/request, "
+        f"{client.metrics.bytes_received / 1024:9.1f} KiB downloaded, "
+        f"{client.metrics.not_modified} x 304"
+    )
+
+
+if __name__ == "__main__":
+    _run(send_validators=False)
+    _run(send_validators=True)
@@ -0,0 +1,39 @@
+"""Time Monte Carlo simulation of a full slate, serially and on a process pool.
+
+Run from the repository root with ``python -m benchmarks.bench_simulation``.
+A slate of ``MATCHUPS`` random matchups is simulated ``SIMULATIONS`` times
+with one process and with one worker per CPU; the results are checked to be
+identical, since chunk seeds do not depend on the pool size.
+"""
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+
+from saavygambler.services.simulation import GameSimulator
+
+MATCHUPS = 500
+SIMULATIONS = 20_000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    home_mean = rng.uniform(100, 125, MATCHUPS)
+    away_mean = rng.uniform(100, 125, MATCHUPS)
+    workers = os.cpu_count() or 1
+    print(f"{MATCHUPS} matchups x {SIMULATIONS:,} simulations, {workers} CPU(s)")
+    results = []
+    for processes in sorted({1, workers}):
+        simulator = GameSimulator(simulations=SIMULATIONS, processes=processes, seed=11)
+        started = time.perf_counter()
+        results.append(simulator.simulate_scores(home_mean, away_mean))
+        elapsed = time.perf_counter() - started
+        games = MATCHUPS * SIMULATIONS
+        print(f"{processes:>2} process(es)  {elapsed:6.2f}s  {games / elapsed:14,.0f} games/s")
+    assert all(np.array_equal(results[0].margins, result.margins) for result in results)
+
+
+if __name__ == "__main__":
+    main()
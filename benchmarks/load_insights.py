@@ -0,0 +1,110 @@
+"""Load-test ``/leagues/{id}/insights`` against a stub upstream with fixed latency.
+
+Run from the repository root with ``python -m benchmarks.load_insights``. The
+upstream is an in-process ``httpx`` mock transport that sleeps ``LATENCY``
+seconds per call, and requests reach the app through ``httpx.ASGITransport``,
+so the numbers measure the service's own concurrency rather than the network.
+Every request targets a distinct league to defeat the response cache.
+
+For comparison the synchronous service is driven the way Starlette runs a
+plain ``def`` route: on the default 40-thread ``anyio`` pool.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+
+import anyio
+import httpx
+
+# The upstream is mocked, so the client-side rate limit is explicitly switched off
+# (``0``); the default free-tier limit would otherwise dominate the timings.
+os.environ.setdefault("SAAVYGAMBLER_RATE_LIMIT_PER_SECOND", "0")
+
+from saavygambler.app import main as app_main
+from saavygambler.providers.api_client import APIClient, AsyncAPIClient
+from saavygambler.providers.thesportsdb import AsyncTheSportsDBProvider, TheSportsDBProvider
+from saavygambler.services.analytics import AnalyticsService, AsyncAnalyticsService
+from saavygambler.services.entity_store import EntityStore
+
+REQUESTS = 400
+LATENCY = 0.25
+EVENTS_PER_LEAGUE = 2
+
+
+def _payload(request: httpx.Request) -> bytes:
+    endpoint = request.url.path.rsplit("/", 1)[-1]
+    ident = request.url.params.get("id", "0")
+    if endpoint == "eventsnextleague.php":
+        events = [
+            {
+                "idEvent": f"{ident}-{index}",
+                "idLeague": ident,
+                "idHomeTeam": f"{ident}-h{index}",
+                "idAwayTeam": f"{ident}-a{index}",
+                "dateEvent": "2024-09-01",
+            }
+            for index in range(EVENTS_PER_LEAGUE)
+        ]
+        return json.dumps({"events": events}).encode()
+    if endpoint == "lookupteam.php":
+        return json.dumps({"teams": [{"idTeam": ident, "strTeam": ident, "intWins": "5"}]}).encode()
+    return json.dumps({"odds": [{"homeWinOdds": "-120", "awayWinOdds": "110", "total": "210"}]}).encode()
+
+
+async def _async_upstream(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(LATENCY)
+    return httpx.Response(200, content=_payload(request))
+
+
+def _sync_upstream(request: httpx.Request) -> httpx.Response:
+    time.sleep(LATENCY)
+    return httpx.Response(200, content=_payload(request))
+
+
+async def run_async_app() -> float:
+    provider = AsyncTheSportsDBProvider(
+        client=AsyncAPIClient(transport=httpx.MockTransport(_async_upstream))
+    )
+
+    async def service() -> AsyncAnalyticsService:
+        return AsyncAnalyticsService(provider, store=EntityStore())
+
+    app_main.app.dependency_overrides[app_main.get_analytics_service] = service
+    transport = httpx.ASGITransport(app=app_main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get(f"/leagues/L{index}/insights") for index in range(REQUESTS))
+        )
+        elapsed = time.perf_counter() - started
+    app_main.app.dependency_overrides.clear()
+    await provider.aclose()
+    assert all(response.status_code == 200 for response in responses)
+    return elapsed
+
+
+async def run_threadpool_baseline() -> float:
+    provider = TheSportsDBProvider(
+        client=APIClient(transport=httpx.MockTransport(_sync_upstream))
+    )
+    service = AnalyticsService(provider, store=EntityStore())
+    started = time.perf_counter()
+    async with anyio.create_task_group() as group:
+        for index in range(REQUESTS):
+            group.start_soon(anyio.to_thread.run_sync, service.insights_for_league, f"S{index}")
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f"{REQUESTS} concurrent insight requests, {LATENCY * 1000:.0f} ms upstream latency")
+    scenarios = (("async def routes", run_async_app), ("def routes (threadpool)", run_threadpool_baseline))
+    for label, scenario in scenarios:
+        elapsed = asyncio.run(scenario())
+        print(f"{label:<24} {elapsed:6.2f}s  {REQUESTS / elapsed:7.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
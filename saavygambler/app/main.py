@@ -1,50 +1,161 @@
 """FastAPI application exposing SaavyGambler functionality."""
 from __future__ import annotations
 
+import asyncio
+import json
+from contextlib import asynccontextmanager
 from datetime import date
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
-from ..providers.thesportsdb import TheSportsDBProvider
-from ..services.analytics import AnalyticsService, EventInsights
-from .schemas import EventInsightsSchema, FantasyProjectionSchema
+from ..config import get_settings
+from ..providers.api_client import APIClient, AsyncAPIClient
+from ..providers.cache import MemoryCache
+from ..providers.thesportsdb import AsyncTheSportsDBProvider, TheSportsDBProvider
+from ..services.analytics import AsyncAnalyticsService, EventInsights
+from ..services.entity_store import get_entity_store
+from ..services.prefetch import PrefetchScheduler
+from .schemas import BatchInsightsRequest, BatchInsightsResponse, EventInsightsSchema, FantasyProjectionSchema
 
-app = FastAPI(title="SaavyGambler", version="1.0.0")
 
+@lru_cache()
+def get_memory_cache() -> MemoryCache:
+    """Response cache shared by the request path and the prefetch scheduler."""
 
-def get_analytics_service() -> AnalyticsService:
-    provider = TheSportsDBProvider()
-    return AnalyticsService(provider)
+    settings = get_settings()
+    return MemoryCache(
+        max_entries=settings.memory_cache_max_entries,
+        max_bytes=settings.memory_cache_max_bytes,
+    )
+
+
+@lru_cache()
+def get_provider() -> TheSportsDBProvider:
+    """Synchronous provider used by background work such as prefetching.
+
+    Its client always revalidates, so scheduled refreshes reach upstream and
+    update the cache shared with the request path instead of being answered
+    from it.
+    """
+
+    return TheSportsDBProvider(client=APIClient(memory_cache=get_memory_cache(), always_revalidate=True))
+
+
+@lru_cache()
+def get_async_provider() -> AsyncTheSportsDBProvider:
+    """Provider shared by all requests; created lazily on the serving event loop."""
+
+    return AsyncTheSportsDBProvider(client=AsyncAPIClient(memory_cache=get_memory_cache()))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the prefetch scheduler when ``prefetch_leagues`` is configured.
+
+    On shutdown the scheduler is stopped and both shared providers are closed.
+    """
+
+    settings = get_settings()
+    scheduler: Optional[PrefetchScheduler] = None
+    if settings.prefetch_leagues:
+        scheduler = PrefetchScheduler(
+            get_provider(),
+            settings.prefetch_leagues,
+            store=get_entity_store(),
+            horizon_days=settings.prefetch_horizon_days,
+            concurrency=settings.provider_concurrency,
+        )
+        scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            scheduler.stop(timeout=5)
+        if get_async_provider.cache_info().currsize:
+            await get_async_provider().aclose()
+            get_async_provider.cache_clear()
+        if get_provider.cache_info().currsize:
+            # Joins the client's refresh threads and closes its disk cache.
+            await asyncio.to_thread(get_provider().close)
+            get_provider.cache_clear()
+
+
+app = FastAPI(title="SaavyGambler", version="1.0.0", lifespan=lifespan)
+
+
+async def get_analytics_service() -> AsyncAnalyticsService:
+    return AsyncAnalyticsService(get_async_provider())
 
 
 @app.get("/health")
-def healthcheck() -> dict:
+async def healthcheck() -> dict:
     return {"status": "ok"}
 
 
 @app.get("/leagues/{league_id}/insights", response_model=List[EventInsightsSchema])
-def league_insights(
+async def league_insights(
     league_id: str,
     from_date: Optional[date] = Query(None, description="Only include events on or after this date"),
-    service: AnalyticsService = Depends(get_analytics_service),
+    service: AsyncAnalyticsService = Depends(get_analytics_service),
 ) -> List[EventInsightsSchema]:
     try:
-        insights = service.insights_for_league(league_id, from_date=from_date)
+        insights = await service.insights_for_league(league_id, from_date=from_date)
         return [EventInsightsSchema.parse_obj(_serialize_insight(insight)) for insight in insights]
     except Exception as exc:  # pragma: no cover - network errors bubble up
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
 
+@app.get("/leagues/{league_id}/insights/stream")
+async def league_insights_stream(
+    league_id: str,
+    from_date: Optional[date] = Query(None, description="Only include events on or after this date"),
+    service: AsyncAnalyticsService = Depends(get_analytics_service),
+) -> StreamingResponse:
+    """Stream insights as NDJSON, one line per event in the order they become ready."""
+
+    try:
+        events = await service.league_events(league_id, from_date=from_date)
+    except Exception as exc:  # pragma: no cover - network errors bubble up
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for insight in service.iter_insights_for_events(events):
+            yield json.dumps(_serialize_insight(insight), default=str).encode("utf-8") + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/insights/batch", response_model=BatchInsightsResponse)
+async def batch_insights(
+    request: BatchInsightsRequest,
+    service: AsyncAnalyticsService = Depends(get_analytics_service),
+) -> BatchInsightsResponse:
+    """Insights for many leagues in one response, with per-league errors."""
+
+    if not request.league_ids:
+        raise HTTPException(status_code=400, detail="league_ids cannot be empty")
+    batch = await service.insights_for_leagues(request.league_ids, from_date=request.from_date)
+    return BatchInsightsResponse(
+        results={
+            league_id: [EventInsightsSchema.parse_obj(_serialize_insight(insight)) for insight in insights]
+            for league_id, insights in batch.results.items()
+        },
+        errors=batch.errors,
+    )
+
+
 @app.post("/fantasy/projections", response_model=List[FantasyProjectionSchema])
-def fantasy_projections(
+async def fantasy_projections(
     player_ids: List[str],
-    service: AnalyticsService = Depends(get_analytics_service),
+    service: AsyncAnalyticsService = Depends(get_analytics_service),
 ) -> List[FantasyProjectionSchema]:
     if not player_ids:
         raise HTTPException(status_code=400, detail="player_ids cannot be empty")
     try:
-        projections = service.fantasy_projections(player_ids)
+        projections = await service.fantasy_projections(player_ids)
         return [FantasyProjectionSchema.parse_obj(projection.__dict__) for projection in projections]
     except Exception as exc:  # pragma: no cover - network errors bubble up
         raise HTTPException(status_code=502, detail=str(exc)) from exc
@@ -73,7 +73,19 @@ class FantasyProjectionSchema(BaseModel):
     metadata: Dict[str, float] = Field(default_factory=dict)
 
 
+class BatchInsightsRequest(BaseModel):
+    league_ids: List[str]
+    from_date: Optional[date] = None
+
+
+class BatchInsightsResponse(BaseModel):
+    results: Dict[str, List[EventInsightsSchema]] = Field(default_factory=dict)
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+
 __all__ = [
+    "BatchInsightsRequest",
+    "BatchInsightsResponse",
     "EventInsightsSchema",
     "FantasyProjectionSchema",
 ]
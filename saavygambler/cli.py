@@ -4,12 +4,18 @@ from __future__ import annotations
 import argparse
 import json
 from datetime import date
+from pathlib import Path
 from typing import List
 
 import httpx
 
+from .config import get_settings
+from .providers.api_client import APIClient
 from .providers.thesportsdb import TheSportsDBProvider
 from .services.analytics import AnalyticsService
+from .services.entity_store import get_entity_store
+from .services.prefetch import PrefetchScheduler
+from .services.ratings import EloRatings
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -24,18 +30,58 @@ def build_parser() -> argparse.ArgumentParser:
         help="Only include events on or after this ISO date",
     )
 
+    batch_parser = sub.add_parser("insights-batch", help="Fetch event insights for several leagues at once")
+    batch_parser.add_argument("league_ids", nargs="+", help="Identifiers of the leagues")
+    batch_parser.add_argument(
+        "--from-date",
+        type=date.fromisoformat,
+        help="Only include events on or after this ISO date",
+    )
+
     fantasy_parser = sub.add_parser("fantasy", help="Generate fantasy projections")
     fantasy_parser.add_argument("player_ids", nargs="+", help="One or more player IDs")
 
     events_parser = sub.add_parser("events", help="Lookup events by identifier")
     events_parser.add_argument("event_ids", nargs="+", help="One or more event IDs")
 
+    prefetch_parser = sub.add_parser("prefetch", help="Keep caches warm for upcoming events")
+    prefetch_parser.add_argument(
+        "league_ids",
+        nargs="*",
+        help="Leagues to prefetch (defaults to the prefetch_leagues setting)",
+    )
+    prefetch_parser.add_argument(
+        "--horizon-days",
+        type=int,
+        default=None,
+        help="Only warm events within this many days",
+    )
+    prefetch_parser.add_argument("--once", action="store_true", help="Warm the caches until nothing is due, then exit")
+
+    ratings_parser = sub.add_parser("ratings", help="Compute Elo ratings from a league's results")
+    ratings_parser.add_argument("league_id", help="Identifier of the league")
+    ratings_parser.add_argument(
+        "--seasons",
+        nargs="+",
+        help="Seasons to process in order (defaults to every season the league lists, "
+        "resuming from the checkpointed season)",
+    )
+    ratings_parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="Rating checkpoint to resume from and update (defaults to one in cache_dir)",
+    )
+
     return parser
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.command == "prefetch":
+        return _prefetch(parser, args)
+    if args.command == "ratings":
+        return _ratings(args)
     service = AnalyticsService(TheSportsDBProvider())
 
     if args.command == "insights":
@@ -49,6 +95,18 @@ def main(argv: List[str] | None = None) -> int:
         print(json.dumps([_serialize_insight(insight) for insight in insights], default=str, indent=2))
         return 0
 
+    if args.command == "insights-batch":
+        batch = service.insights_for_leagues(args.league_ids, from_date=args.from_date)
+        output = {
+            "results": {
+                league_id: [_serialize_insight(insight) for insight in insights]
+                for league_id, insights in batch.results.items()
+            },
+            "errors": batch.errors,
+        }
+        print(json.dumps(output, default=str, indent=2))
+        return 0 if batch.results else 1
+
     if args.command == "fantasy":
         try:
             projections = service.fantasy_projections(args.player_ids)
@@ -76,6 +134,65 @@ def main(argv: List[str] | None = None) -> int:
     return 1
 
 
+def _prefetch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    settings = get_settings()
+    league_ids = args.league_ids or list(settings.prefetch_leagues)
+    if not league_ids:
+        parser.error("prefetch needs league IDs or the prefetch_leagues setting")
+    scheduler = PrefetchScheduler(
+        TheSportsDBProvider(client=APIClient(always_revalidate=True)),
+        league_ids,
+        store=get_entity_store(),
+        horizon_days=args.horizon_days if args.horizon_days is not None else settings.prefetch_horizon_days,
+        concurrency=settings.provider_concurrency,
+    )
+    if args.once:
+        scheduler.run_until_idle()
+    else:
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            pass
+    stats = scheduler.stats
+    print(f"Prefetched {stats.fetched} items ({stats.failures} failed, {stats.queued} queued)")
+    return 0
+
+
+def _ratings(args: argparse.Namespace) -> int:
+    checkpoint = args.checkpoint
+    cache_dir = get_settings().cache_dir
+    if checkpoint is None and cache_dir is not None:
+        checkpoint = cache_dir / f"ratings-{args.league_id}.json"
+    ratings = EloRatings.load(checkpoint) if checkpoint is not None else EloRatings()
+    provider = TheSportsDBProvider()
+    applied = late = 0
+    try:
+        seasons = args.seasons or provider.list_seasons(args.league_id)
+        if ratings.season in seasons:
+            # Resume in the season the checkpoint stopped in; earlier seasons are fully applied.
+            seasons = seasons[seasons.index(ratings.season):]
+        for season in seasons:
+            events = provider.iter_season_events(args.league_id, [season])
+            summary = ratings.update_many(events, season=season)
+            applied += summary.applied
+            late += summary.late
+    except httpx.HTTPStatusError as exc:
+        print(f"⚠️ No data found for league {args.league_id} ({exc.response.status_code})")
+        return 1
+    if checkpoint is not None:
+        ratings.save()
+    table = sorted(ratings.ratings.items(), key=lambda item: item[1], reverse=True)
+    output = {
+        "applied": applied,
+        "late": late,
+        "ratings": [
+            {"team_id": team_id, "rating": rating, "games": ratings.games(team_id)} for team_id, rating in table
+        ],
+    }
+    print(json.dumps(output, indent=2))
+    return 0
+
+
 def _serialize_insight(insight):
     return {
         "event": insight.event.__dict__,
@@ -11,7 +11,7 @@ import os
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, Optional
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 
 
 ENV_PREFIX = "saavygambler_"
@@ -51,6 +51,12 @@ def _load_env_file(path: Path) -> Dict[str, str]:
     return entries
 
 
+def _parse_bool(value: str) -> bool:
+    """Interpret common truthy spellings such as ``1``, ``true`` or ``yes``."""
+
+    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _extract_prefixed(env: Mapping[str, str]) -> Dict[str, str]:
     """Return only entries prefixed with :data:`ENV_PREFIX`."""
 
@@ -72,11 +78,52 @@ class AppSettings:
     sportsdb_api_key: str = "1"
     http_timeout_seconds: float = 10.0
     cache_dir: Optional[Path] = None
+    cache_max_bytes: int = 64 * 1024 * 1024
+    memory_cache_max_entries: int = 1024
+    memory_cache_max_bytes: int = 16 * 1024 * 1024
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 5.0
+    http2: bool = False
+    # TheSportsDB's free tier allows 30 requests a minute; 0.4/s plus a burst
+    # of 5 stays under it in any 60-second window. ``0`` disables the limiter.
+    rate_limit_per_second: float = 0.4
+    rate_limit_burst: int = 5
+    json_backend: str = "auto"
+    provider_concurrency: int = 8
+    entity_max_age_seconds: float = 300.0
+    entity_max_entries: int = 50_000
+    prefetch_leagues: Tuple[str, ...] = ()
+    prefetch_horizon_days: int = 7
+    prediction_cache_size: int = 4096
     _source: Dict[str, str] = field(default_factory=dict, repr=False, init=False)
 
     def __post_init__(self) -> None:
         if self.http_timeout_seconds <= 0:
             raise ValueError("http_timeout_seconds must be greater than zero")
+        if self.cache_max_bytes <= 0:
+            raise ValueError("cache_max_bytes must be greater than zero")
+        if self.memory_cache_max_entries <= 0:
+            raise ValueError("memory_cache_max_entries must be greater than zero")
+        if self.memory_cache_max_bytes <= 0:
+            raise ValueError("memory_cache_max_bytes must be greater than zero")
+        if self.http_max_connections <= 0:
+            raise ValueError("http_max_connections must be greater than zero")
+        if self.http_max_keepalive_connections < 0:
+            raise ValueError("http_max_keepalive_connections cannot be negative")
+        if self.rate_limit_burst < 1:
+            raise ValueError("rate_limit_burst must be at least one")
+        if self.provider_concurrency < 1:
+            raise ValueError("provider_concurrency must be at least one")
+        if self.entity_max_age_seconds < 0:
+            raise ValueError("entity_max_age_seconds cannot be negative")
+        if self.entity_max_entries < 0:
+            raise ValueError("entity_max_entries cannot be negative")
+        if self.prefetch_horizon_days < 0:
+            raise ValueError("prefetch_horizon_days cannot be negative")
+        if self.prediction_cache_size < 0:
+            raise ValueError("prediction_cache_size cannot be negative")
+        self.prefetch_leagues = tuple(self.prefetch_leagues)
         if self.cache_dir is not None and not isinstance(self.cache_dir, Path):
             self.cache_dir = Path(self.cache_dir)
         if self.cache_dir is not None:
@@ -122,6 +169,37 @@ class AppSettings:
                 raise ValueError("http_timeout_seconds must be a number") from exc
         if "cache_dir" in scoped:
             data["cache_dir"] = Path(scoped["cache_dir"])
+        for name in (
+            "cache_max_bytes",
+            "memory_cache_max_entries",
+            "memory_cache_max_bytes",
+            "http_max_connections",
+            "http_max_keepalive_connections",
+            "rate_limit_burst",
+            "provider_concurrency",
+            "prefetch_horizon_days",
+            "prediction_cache_size",
+            "entity_max_entries",
+        ):
+            if name in scoped:
+                try:
+                    data[name] = int(scoped[name])
+                except ValueError as exc:  # pragma: no cover - defensive programming
+                    raise ValueError(f"{name} must be an integer") from exc
+        for name in ("http_keepalive_expiry", "rate_limit_per_second", "entity_max_age_seconds"):
+            if name in scoped:
+                try:
+                    data[name] = float(scoped[name])
+                except ValueError as exc:  # pragma: no cover - defensive programming
+                    raise ValueError(f"{name} must be a number") from exc
+        if "http2" in scoped:
+            data["http2"] = _parse_bool(scoped["http2"])
+        if "prefetch_leagues" in scoped:
+            data["prefetch_leagues"] = tuple(
+                league.strip() for league in scoped["prefetch_leagues"].split(",") if league.strip()
+            )
+        if "json_backend" in scoped:
+            data["json_backend"] = str(scoped["json_backend"]).strip().lower() or "auto"
 
         settings = cls(**data)
         settings._source = dict(scoped)
@@ -47,7 +47,7 @@ class Event:
 
     @property
     def is_final(self) -> bool:
-        return bool(self.status and self.status.lower() in {"final", "completed"})
+        return bool(self.status and self.status.lower() in {"final", "completed", "match finished", "ft"})
 
 
 @dataclass
@@ -1,52 +1,471 @@
 """HTTP client utilities for interacting with external data providers."""
 from __future__ import annotations
 
+import abc
+import asyncio
+import importlib.util
 import json
 import logging
+import math
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
 
 import httpx
 
 from ..config import get_settings
+from .cache import CachedResponse, CacheStats, DiskCache, MemoryCache, retained_headers
+from .codec import JSONDecoder, get_decoder
+from .rate_limit import TokenBucket, get_rate_limiter, parse_retry_after
+from .singleflight import AsyncSingleFlight, SingleFlight
 
 LOGGER = logging.getLogger(__name__)
 
+# Statuses that signal throttling or a transient upstream failure.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF_SECONDS = 60.0
+
+# Entries carrying an ETag or Last-Modified validator are kept this long past
+# expiry so they can be revalidated with a conditional request.
+REVALIDATION_WINDOW_SECONDS = 24 * 3600.0
+
 
 @dataclass
-class CachedResponse:
-    """Represents a cached HTTP response."""
+class ClientMetrics:
+    """Network counters for an API client."""
+
+    responses: int = 0
+    not_modified: int = 0
+    bytes_received: int = 0
+    bytes_saved: int = 0
+    parse_count: int = 0
+    parse_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class _Request:
+    """Everything needed to issue (or re-issue) one GET and cache its result."""
+
+    url: str
+    params: Optional[Dict[str, Any]]
+    headers: Optional[Dict[str, str]]
+    cache_key: str
+    flight_key: str
+    cache_ttl: Optional[float]
+    stale_while_revalidate: Optional[float]
+    stale_if_error: Optional[float]
+    max_retries: int
+    backoff_factor: float
+
+    @property
+    def retain_for(self) -> float:
+        return max(self.stale_while_revalidate or 0.0, self.stale_if_error or 0.0)
+
+
+class _BaseAPIClient(abc.ABC):
+    """Caching, retry, and connection-pool behaviour shared by both clients."""
+
+    def __init__(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        json_backend: Optional[str] = None,
+        always_revalidate: bool = False,
+    ) -> None:
+        settings = get_settings()
+        self._settings = settings
+        self._loads = get_decoder(json_backend or settings.json_backend)
+        self._timeout = timeout or settings.http_timeout_seconds
+        if memory_cache is None:
+            memory_cache = MemoryCache(
+                max_entries=settings.memory_cache_max_entries,
+                max_bytes=settings.memory_cache_max_bytes,
+            )
+        self._cache = memory_cache
+        if disk_cache is None and settings.cache_dir is not None:
+            disk_cache = DiskCache.in_directory(settings.cache_dir, max_bytes=settings.cache_max_bytes)
+        self._disk_cache = disk_cache
+        self._rate_limiter = rate_limiter or get_rate_limiter()
+        self._always_revalidate = always_revalidate
+        self._refreshing: Set[str] = set()
+        self.metrics = ClientMetrics()
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss, eviction, and expiration counters of the memory cache."""
+
+        return self._cache.stats
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of calls that piggybacked on an identical in-flight request."""
+
+        return self._inflight.shared
+
+    def _client_options(self, transport: Any) -> Dict[str, Any]:
+        """Keyword arguments for the underlying ``httpx`` client."""
+
+        settings = self._settings
+        http2 = settings.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            LOGGER.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+        return {
+            "timeout": self._timeout,
+            "limits": httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            "http2": http2,
+            "transport": transport,
+        }
+
+    def _build_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        cache_ttl: Optional[float],
+        stale_while_revalidate: Optional[float],
+        stale_if_error: Optional[float],
+        max_retries: int,
+        backoff_factor: float,
+    ) -> _Request:
+        return _Request(
+            url=url,
+            params=params,
+            headers=headers,
+            cache_key=self._cache_key(url, params),
+            flight_key=self._flight_key(url, params, headers),
+            cache_ttl=cache_ttl,
+            stale_while_revalidate=stale_while_revalidate,
+            stale_if_error=stale_if_error,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+        )
+
+    def _check_cache(self, request: _Request) -> Tuple[Optional[CachedResponse], Optional[CachedResponse]]:
+        """Return ``(entry to serve now, expired entry still on hand)``.
+
+        A fresh entry is served directly. A stale entry inside the
+        stale-while-revalidate window is served as well and a background
+        refresh is scheduled. Any other expired entry is handed back so the
+        refetch can revalidate it and fall back to it on errors; with
+        ``always_revalidate`` every entry is treated that way.
+        """
+
+        if not request.cache_ttl:
+            return None, None
+        return self._classify(request, self._cached_entry(request.cache_key, max_stale=math.inf))
+
+    def _classify(
+        self,
+        request: _Request,
+        cached: Optional[CachedResponse],
+    ) -> Tuple[Optional[CachedResponse], Optional[CachedResponse]]:
+        if cached is None:
+            return None, None
+        if self._always_revalidate:
+            return None, cached
+        if cached.is_valid():
+            return cached, None
+        if request.stale_while_revalidate and cached.staleness() <= request.stale_while_revalidate:
+            self._revalidate_in_background(request, cached)
+            return cached, None
+        return None, cached
+
+    @staticmethod
+    def _usable_after_error(request: _Request, stale: Optional[CachedResponse]) -> bool:
+        return bool(stale is not None and request.stale_if_error and stale.staleness() <= request.stale_if_error)
+
+    @abc.abstractmethod
+    def _revalidate_in_background(self, request: _Request, stale: CachedResponse) -> None:
+        """Refresh ``stale`` for ``request`` without blocking the caller."""
+
+    @staticmethod
+    def _conditional_headers(request: _Request, stale: Optional[CachedResponse]) -> Optional[Dict[str, str]]:
+        """Add ``If-None-Match``/``If-Modified-Since`` when ``stale`` carries validators."""
+
+        if stale is None or not request.cache_ttl:
+            return request.headers
+        etag = stale.headers.get("etag")
+        last_modified = stale.headers.get("last-modified")
+        if etag is None and last_modified is None:
+            return request.headers
+        headers = dict(request.headers or {})
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _store(self, request: _Request, entry: CachedResponse) -> None:
+        self._cache.set(request.cache_key, entry)
+        if self._disk_cache is not None:
+            self._store_on_disk(request.cache_key, entry)
+
+    def _store_on_disk(self, cache_key: str, entry: CachedResponse) -> None:
+        self._disk_cache.set(cache_key, entry)
+
+    def _retain_for(self, request: _Request, headers: Dict[str, str]) -> float:
+        if headers:
+            return max(request.retain_for, REVALIDATION_WINDOW_SECONDS)
+        return request.retain_for
+
+    def _handle_not_modified(
+        self,
+        response: httpx.Response,
+        request: _Request,
+        stale: CachedResponse,
+    ) -> CachedResponse:
+        """Refresh ``stale`` after a 304 without touching its body."""
+
+        headers = dict(stale.headers)
+        headers.update(retained_headers(response.headers))
+        entry = stale.renewed(
+            headers=headers,
+            timestamp=time.time(),
+            expires_in=request.cache_ttl,
+            retain_for=self._retain_for(request, headers),
+        )
+        self._store(request, entry)
+        self.metrics.not_modified += 1
+        self.metrics.bytes_saved += stale.size
+        return entry
+
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        request: _Request,
+        stale: Optional[CachedResponse] = None,
+    ) -> Optional[CachedResponse]:
+        """Wrap ``response`` in an undecoded entry and cache it when requested.
+
+        Returns ``None`` for a 404 so callers can substitute an empty payload.
+        A 304 without a cached entry to renew has no body to serve, so it is
+        raised as an :class:`httpx.HTTPStatusError` and never cached.
+        """
+
+        self.metrics.responses += 1
+        self.metrics.bytes_received += len(response.content)
+        if response.status_code == 304:
+            if stale is not None:
+                return self._handle_not_modified(response, request, stale)
+            raise httpx.HTTPStatusError(
+                f"Unexpected 304 Not Modified for {response.url} with no cached entry to renew",
+                request=response.request,
+                response=response,
+            )
+        if response.status_code == 404:
+            LOGGER.warning("[APIClient] 404 Not Found for %s", response.url)
+            return None
+        response.raise_for_status()
+        headers = retained_headers(response.headers)
+        entry = CachedResponse(
+            status_code=response.status_code,
+            headers=headers,
+            body=response.content,
+            timestamp=time.time(),
+            expires_in=request.cache_ttl,
+            retain_for=self._retain_for(request, headers),
+        )
+        if request.cache_ttl:
+            self._store(request, entry)
+        return entry
+
+    def _payload(self, entry: Optional[CachedResponse], decoder: Optional[JSONDecoder]) -> Any:
+        """Decode ``entry`` for a caller, recording parse time in :attr:`metrics`.
+
+        The client's own backend memoises its result on the entry; a custom
+        ``decoder`` always runs so it can pick out just the fields it needs.
+        """
+
+        if entry is None:
+            return {}
+        if decoder is None and entry.is_decoded:
+            return entry.decode(self._loads)
+        started = time.perf_counter()
+        data = decoder(entry.body) if decoder is not None else entry.decode(self._loads)
+        self.metrics.parse_seconds += time.perf_counter() - started
+        self.metrics.parse_count += 1
+        return data
+
+    def _serve_stale(
+        self,
+        request: _Request,
+        fallback: CachedResponse,
+        exc: Exception,
+        decoder: Optional[JSONDecoder],
+    ) -> Any:
+        LOGGER.warning(
+            "Serving cached response for %s (%.0fs stale) after upstream error: %s",
+            request.url,
+            fallback.staleness(),
+            exc,
+        )
+        return self._payload(fallback, decoder)
+
+    @staticmethod
+    def _backoff(attempt: int, backoff_factor: float, retry_after: Optional[float] = None) -> float:
+        """Exponential backoff with jitter that never undercuts ``retry_after``."""
+
+        base = backoff_factor * (2**attempt)
+        delay = base + random.uniform(0, base)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, MAX_BACKOFF_SECONDS)
+
+    def _should_retry_status(self, response: httpx.Response, attempt: int, max_retries: int) -> bool:
+        return response.status_code in RETRY_STATUSES and attempt < max_retries
+
+    def _status_retry_delay(
+        self,
+        response: httpx.Response,
+        attempt: int,
+        max_retries: int,
+        backoff_factor: float,
+    ) -> float:
+        """Return the wait before retrying a throttled or failed response."""
+
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if response.status_code == 429 and retry_after is not None and self._rate_limiter is not None:
+            self._rate_limiter.pause(retry_after)
+        sleep_time = self._backoff(attempt, backoff_factor, retry_after)
+        LOGGER.warning(
+            "Status %s for %s (attempt %s/%s), retrying in %.2fs",
+            response.status_code,
+            response.url,
+            attempt + 1,
+            max_retries,
+            sleep_time,
+        )
+        return sleep_time
+
+    def _retry_delay(
+        self,
+        url: str,
+        exc: Exception,
+        attempt: int,
+        max_retries: int,
+        backoff_factor: float,
+    ) -> float:
+        """Return how long to wait before retrying, or re-raise ``exc``."""
+
+        if attempt >= max_retries:
+            LOGGER.error("Max retries exceeded for %s: %s", url, exc)
+            raise exc
+        sleep_time = self._backoff(attempt, backoff_factor)
+        LOGGER.warning(
+            "Request error for %s (attempt %s/%s), retrying in %.2fs",
+            url,
+            attempt + 1,
+            max_retries,
+            sleep_time,
+        )
+        return sleep_time
+
+    def _close_caches(self) -> None:
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def _cached_entry(self, cache_key: str, *, max_stale: float = 0.0) -> Optional[CachedResponse]:
+        """Return a cached entry from memory or disk that is at most ``max_stale`` seconds stale."""
+
+        cached = self._cache.get(cache_key, max_stale=max_stale)
+        if cached is not None or self._disk_cache is None:
+            return cached
+        return self._disk_entry(cache_key, max_stale)
+
+    def _disk_entry(self, cache_key: str, max_stale: float) -> Optional[CachedResponse]:
+        """Read ``cache_key`` from the disk cache, promoting a usable entry to memory."""
+
+        cached = self._disk_cache.get(cache_key)
+        if cached is None or (not cached.is_valid() and cached.staleness() > max_stale):
+            return None
+        self._cache.set(cache_key, cached)
+        return cached
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        key = url
+        if params:
+            key += json.dumps(params, sort_keys=True)
+        return key
 
-    status_code: int
-    headers: Dict[str, str]
-    data: Any
-    timestamp: float
-    expires_in: Optional[float] = None
+    def _flight_key(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> str:
+        """Key for coalescing in-flight requests.
+
+        Unlike the cache key it covers the method and the caller's headers, so
+        requests that differ in credentials or validators such as
+        ``If-None-Match`` never share a response.
+        """
 
-    def is_valid(self) -> bool:
-        if self.expires_in is None:
-            return True
-        return (time.time() - self.timestamp) < self.expires_in
+        key = "GET " + self._cache_key(url, params)
+        if headers:
+            key += json.dumps(sorted((name.lower(), value) for name, value in headers.items()))
+        return key
 
 
-class APIClient:
+class APIClient(_BaseAPIClient):
     """Robust HTTP client with caching and error handling.
 
     The client exposes a :py:meth:`get_json` helper that retrieves JSON
     responses while honoring configurable timeouts, retry strategies, and an
     optional in-memory cache. This makes it well-suited for production-grade
     integrations with public sports APIs that may enforce rate limits.
+
+    Responses are held in a bounded :class:`MemoryCache` sized from the
+    application settings. When ``settings.cache_dir`` is configured (or
+    ``disk_cache`` is supplied) cached responses are also written to a
+    :class:`DiskCache` so they survive process restarts.
+
+    With ``always_revalidate`` cached entries are never served without asking
+    upstream first: each call is a (conditional, when the entry carries
+    validators) request whose result refreshes the cache. Cache warmers such
+    as the prefetch scheduler use this so their refreshes are never answered
+    from the very cache they are meant to refresh.
     """
 
-    def __init__(self, *, timeout: Optional[float] = None) -> None:
-        settings = get_settings()
-        self._timeout = timeout or settings.http_timeout_seconds
-        self._cache: Dict[str, CachedResponse] = {}
-        self._client = httpx.Client(timeout=self._timeout)
+    def __init__(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        json_backend: Optional[str] = None,
+        always_revalidate: bool = False,
+    ) -> None:
+        super().__init__(
+            timeout=timeout,
+            memory_cache=memory_cache,
+            disk_cache=disk_cache,
+            rate_limiter=rate_limiter,
+            json_backend=json_backend,
+            always_revalidate=always_revalidate,
+        )
+        self._client = httpx.Client(**self._client_options(transport))
+        self._inflight = SingleFlight()
+        self._refresh_lock = threading.Lock()
+        self._refresher: Optional[ThreadPoolExecutor] = None
 
     def close(self) -> None:
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=True)
         self._client.close()
+        self._close_caches()
 
     def get_json(
         self,
@@ -55,63 +474,241 @@ class APIClient:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         cache_ttl: Optional[float] = None,
+        stale_while_revalidate: Optional[float] = None,
+        stale_if_error: Optional[float] = None,
         max_retries: int = 2,
         backoff_factor: float = 0.5,
+        decoder: Optional[JSONDecoder] = None,
     ) -> Any:
         """Perform a GET request and return the parsed JSON body.
 
-        Retries transient failures with exponential backoff. When ``cache_ttl``
+        Retries transient failures, throttling (429), and 5xx responses with
+        jittered exponential backoff that honours ``Retry-After``. When ``cache_ttl``
         is provided, the response is cached for the specified duration in
-        seconds.
+        seconds. Concurrent calls for the same URL, parameters and headers
+        share a single upstream request.
+
+        ``stale_while_revalidate`` and ``stale_if_error`` (seconds past expiry)
+        let an expired entry be served instantly while a background refresh
+        runs, or in place of an upstream failure. Expired entries with an
+        ``ETag`` or ``Last-Modified`` are revalidated conditionally; a ``304``
+        renews the cached body without downloading or decoding it again.
+
+        Raw response bytes are cached and decoded lazily with the configured
+        ``json_backend``. Pass ``decoder`` to parse the body differently, for
+        example with :func:`~saavygambler.providers.codec.typed_decoder` to
+        materialise only a few fields.
         """
 
-        cache_key = self._cache_key(url, params)
-        if cache_ttl:
-            cached = self._cache.get(cache_key)
-            if cached and cached.is_valid():
-                return cached.data
+        request = self._build_request(
+            url,
+            params,
+            headers,
+            cache_ttl,
+            stale_while_revalidate,
+            stale_if_error,
+            max_retries,
+            backoff_factor,
+        )
+        cached, stale = self._check_cache(request)
+        if cached is not None:
+            return self._payload(cached, decoder)
+        try:
+            entry = self._inflight.do(request.flight_key, lambda: self._fetch(request, stale))
+        except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+            if not self._usable_after_error(request, stale):
+                raise
+            return self._serve_stale(request, stale, exc, decoder)
+        return self._payload(entry, decoder)
+
+    def _revalidate_in_background(self, request: _Request, stale: CachedResponse) -> None:
+        with self._refresh_lock:
+            if request.cache_key in self._refreshing:
+                return
+            self._refreshing.add(request.cache_key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="apiclient-refresh")
+        self._refresher.submit(self._background_refresh, request, stale)
+
+    def _background_refresh(self, request: _Request, stale: CachedResponse) -> None:
+        try:
+            self._inflight.do(request.flight_key, lambda: self._fetch(request, stale))
+        except Exception as exc:  # pragma: no cover - logged for visibility
+            LOGGER.warning("Background refresh failed for %s: %s", request.url, exc)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(request.cache_key)
 
+    def _fetch(self, request: _Request, stale: Optional[CachedResponse] = None) -> Optional[CachedResponse]:
+        url, max_retries, backoff_factor = request.url, request.max_retries, request.backoff_factor
+        headers = self._conditional_headers(request, stale)
         attempt = 0
         while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
             try:
-                response = self._client.get(url, params=params, headers=headers)
-                if response.status_code == 404:
-                    LOGGER.warning("[APIClient] 404 Not Found for %s", response.url)
-                    return {}
-                response.raise_for_status()
-                data = response.json()
-                if cache_ttl:
-                    self._cache[cache_key] = CachedResponse(
-                        status_code=response.status_code,
-                        headers=dict(response.headers),
-                        data=data,
-                        timestamp=time.time(),
-                        expires_in=cache_ttl,
-                    )
-                return data
-            except httpx.HTTPStatusError as exc:  # pragma: no cover - network
+                response = self._client.get(url, params=request.params, headers=headers)
+            except httpx.RequestError as exc:
+                time.sleep(self._retry_delay(url, exc, attempt, max_retries, backoff_factor))
+                attempt += 1
+                continue
+            if self._should_retry_status(response, attempt, max_retries):
+                time.sleep(self._status_retry_delay(response, attempt, max_retries, backoff_factor))
+                attempt += 1
+                continue
+            try:
+                return self._handle_response(response, request, stale)
+            except httpx.HTTPStatusError as exc:
                 LOGGER.error("Request failed with status %s: %s", exc.response.status_code, exc)
                 raise
+
+
+class AsyncAPIClient(_BaseAPIClient):
+    """Asyncio counterpart of :class:`APIClient` built on ``httpx.AsyncClient``.
+
+    Caching and retry semantics are identical to the synchronous client, but
+    backoff waits with :func:`asyncio.sleep` so a single event loop can keep
+    many lookups in flight. The memory cache is consulted inline; the SQLite
+    disk cache is read and written on worker threads so it never blocks the
+    loop. Pool size, keep-alive, and HTTP/2 come from the ``http_*`` settings.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        json_backend: Optional[str] = None,
+        always_revalidate: bool = False,
+    ) -> None:
+        super().__init__(
+            timeout=timeout,
+            memory_cache=memory_cache,
+            disk_cache=disk_cache,
+            rate_limiter=rate_limiter,
+            json_backend=json_backend,
+            always_revalidate=always_revalidate,
+        )
+        self._client = httpx.AsyncClient(**self._client_options(transport))
+        self._inflight = AsyncSingleFlight()
+        self._background: "Set[asyncio.Future[None]]" = set()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        while self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        await self._client.aclose()
+        self._close_caches()
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cache_ttl: Optional[float] = None,
+        stale_while_revalidate: Optional[float] = None,
+        stale_if_error: Optional[float] = None,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        decoder: Optional[JSONDecoder] = None,
+    ) -> Any:
+        """Asynchronously perform a GET request and return the parsed JSON body."""
+
+        request = self._build_request(
+            url,
+            params,
+            headers,
+            cache_ttl,
+            stale_while_revalidate,
+            stale_if_error,
+            max_retries,
+            backoff_factor,
+        )
+        cached, stale = await self._check_cache_async(request)
+        if cached is not None:
+            return self._payload(cached, decoder)
+        try:
+            entry = await self._inflight.do(request.flight_key, lambda: self._fetch(request, stale))
+        except (httpx.HTTPStatusError, httpx.RequestError) as exc:
+            if not self._usable_after_error(request, stale):
+                raise
+            return self._serve_stale(request, stale, exc, decoder)
+        return self._payload(entry, decoder)
+
+    async def _check_cache_async(
+        self, request: _Request
+    ) -> Tuple[Optional[CachedResponse], Optional[CachedResponse]]:
+        if not request.cache_ttl:
+            return None, None
+        cached = self._cache.get(request.cache_key, max_stale=math.inf)
+        if cached is None and self._disk_cache is not None:
+            cached = await asyncio.to_thread(self._disk_entry, request.cache_key, math.inf)
+        return self._classify(request, cached)
+
+    def _store_on_disk(self, cache_key: str, entry: CachedResponse) -> None:
+        # The entry is already in memory, so the write need not delay the response.
+        self._track(asyncio.to_thread(self._disk_cache.set, cache_key, entry), "Disk cache write")
+
+    def _track(self, coroutine: Any, description: str) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._background.add(task)
+
+        def _done(finished: "asyncio.Future[None]") -> None:
+            self._background.discard(finished)
+            if not finished.cancelled() and finished.exception() is not None:
+                LOGGER.warning("%s failed: %s", description, finished.exception())
+
+        task.add_done_callback(_done)
+
+    def _revalidate_in_background(self, request: _Request, stale: CachedResponse) -> None:
+        if request.cache_key in self._refreshing:
+            return
+        self._refreshing.add(request.cache_key)
+        self._track(self._background_refresh(request, stale), "Background refresh")
+
+    async def _background_refresh(self, request: _Request, stale: CachedResponse) -> None:
+        try:
+            await self._inflight.do(request.flight_key, lambda: self._fetch(request, stale))
+        except Exception as exc:  # pragma: no cover - logged for visibility
+            LOGGER.warning("Background refresh failed for %s: %s", request.url, exc)
+        finally:
+            self._refreshing.discard(request.cache_key)
+
+    async def _fetch(
+        self,
+        request: _Request,
+        stale: Optional[CachedResponse] = None,
+    ) -> Optional[CachedResponse]:
+        url, max_retries, backoff_factor = request.url, request.max_retries, request.backoff_factor
+        headers = self._conditional_headers(request, stale)
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            try:
+                response = await self._client.get(url, params=request.params, headers=headers)
             except httpx.RequestError as exc:
-                if attempt >= max_retries:
-                    LOGGER.error("Max retries exceeded for %s: %s", url, exc)
-                    raise
-                sleep_time = backoff_factor * (2**attempt)
-                LOGGER.warning(
-                    "Request error for %s (attempt %s/%s), retrying in %.2fs",
-                    url,
-                    attempt + 1,
-                    max_retries,
-                    sleep_time,
-                )
-                time.sleep(sleep_time)
+                await asyncio.sleep(self._retry_delay(url, exc, attempt, max_retries, backoff_factor))
                 attempt += 1
-
-    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
-        key = url
-        if params:
-            key += json.dumps(params, sort_keys=True)
-        return key
+                continue
+            if self._should_retry_status(response, attempt, max_retries):
+                await asyncio.sleep(self._status_retry_delay(response, attempt, max_retries, backoff_factor))
+                attempt += 1
+                continue
+            try:
+                return self._handle_response(response, request, stale)
+            except httpx.HTTPStatusError as exc:
+                LOGGER.error("Request failed with status %s: %s", exc.response.status_code, exc)
+                raise
 
 
-__all__ = ["APIClient", "CachedResponse"]
+__all__ = ["APIClient", "AsyncAPIClient", "CachedResponse", "ClientMetrics"]
@@ -3,13 +3,24 @@ from __future__ import annotations
 
 import abc
 from datetime import date
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..models import Event, Odds, PlayerStats, TeamStats
+from .batch import DEFAULT_CONCURRENCY, async_fan_out, fan_out
+
+
+def _unique(ids: Iterable[str]) -> List[str]:
+    """Drop duplicate and empty identifiers while keeping first-seen order."""
+
+    return [identifier for identifier in dict.fromkeys(ids) if identifier]
 
 
 class SportsDataProvider(abc.ABC):
-    """Interface that concrete provider implementations must follow."""
+    """Interface that concrete provider implementations must follow.
+
+    The ``*_many`` batch methods default to concurrent single-entity lookups;
+    providers with real bulk endpoints should override them.
+    """
 
     @abc.abstractmethod
     def search_teams(self, name: str) -> List[TeamStats]:
@@ -35,5 +46,97 @@ class SportsDataProvider(abc.ABC):
     def get_odds(self, event_id: str) -> Optional[Odds]:
         """Return betting odds for the specified event, when available."""
 
+    @property
+    def _concurrency(self) -> int:
+        return DEFAULT_CONCURRENCY
+
+    def get_teams(self, team_ids: Iterable[str]) -> Dict[str, TeamStats]:
+        """Return the known teams among ``team_ids`` keyed by identifier.
+
+        Unknown teams and failed lookups are omitted from the mapping.
+        """
+
+        batch = fan_out(self.get_team, _unique(team_ids), concurrency=self._concurrency, what="team")
+        return {team_id: team for team_id, team in batch.results if team is not None}
+
+    def get_odds_many(self, event_ids: Iterable[str]) -> Dict[str, Odds]:
+        """Return available odds for ``event_ids`` keyed by event identifier."""
+
+        batch = fan_out(self.get_odds, _unique(event_ids), concurrency=self._concurrency, what="odds")
+        return {event_id: odds for event_id, odds in batch.results if odds is not None}
+
+    def lookup_players_many(self, player_ids: Iterable[str]) -> Dict[str, PlayerStats]:
+        """Return statistics for ``player_ids`` keyed by player identifier."""
+
+        batch = fan_out(
+            lambda player_id: self.get_player_stats([player_id]),
+            _unique(player_ids),
+            concurrency=self._concurrency,
+            what="player",
+        )
+        return {player_id: stats[0] for player_id, stats in batch.results if stats}
+
+
+class AsyncSportsDataProvider(abc.ABC):
+    """Asyncio counterpart of :class:`SportsDataProvider`."""
+
+    @abc.abstractmethod
+    async def search_teams(self, name: str) -> List[TeamStats]:
+        """Search for teams by name."""
+
+    @abc.abstractmethod
+    async def get_events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
+        """Return upcoming or recent events for a league."""
+
+    @abc.abstractmethod
+    async def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
+        """Return detailed information for specific events."""
+
+    @abc.abstractmethod
+    async def get_team(self, team_id: str) -> Optional[TeamStats]:
+        """Return a single team by identifier when supported."""
+
+    @abc.abstractmethod
+    async def get_player_stats(self, player_ids: Iterable[str]) -> List[PlayerStats]:
+        """Return statistics for the given players."""
+
+    @abc.abstractmethod
+    async def get_odds(self, event_id: str) -> Optional[Odds]:
+        """Return betting odds for the specified event, when available."""
+
+    @property
+    def _concurrency(self) -> int:
+        return DEFAULT_CONCURRENCY
+
+    async def get_teams(self, team_ids: Iterable[str]) -> Dict[str, TeamStats]:
+        """Return the known teams among ``team_ids`` keyed by identifier."""
+
+        batch = await async_fan_out(
+            self.get_team, _unique(team_ids), concurrency=self._concurrency, what="team"
+        )
+        return {team_id: team for team_id, team in batch.results if team is not None}
+
+    async def get_odds_many(self, event_ids: Iterable[str]) -> Dict[str, Odds]:
+        """Return available odds for ``event_ids`` keyed by event identifier."""
+
+        batch = await async_fan_out(
+            self.get_odds, _unique(event_ids), concurrency=self._concurrency, what="odds"
+        )
+        return {event_id: odds for event_id, odds in batch.results if odds is not None}
+
+    async def lookup_players_many(self, player_ids: Iterable[str]) -> Dict[str, PlayerStats]:
+        """Return statistics for ``player_ids`` keyed by player identifier."""
+
+        batch = await async_fan_out(
+            lambda player_id: self.get_player_stats([player_id]),
+            _unique(player_ids),
+            concurrency=self._concurrency,
+            what="player",
+        )
+        return {player_id: stats[0] for player_id, stats in batch.results if stats}
+
+    async def aclose(self) -> None:
+        """Release network resources held by the provider."""
+
 
-__all__ = ["SportsDataProvider"]
+__all__ = ["AsyncSportsDataProvider", "SportsDataProvider"]
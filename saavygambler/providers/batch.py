@@ -0,0 +1,96 @@
+"""Bounded concurrent fan-out for per-identifier provider lookups."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Generic, Iterable, List, Tuple, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Outcome of a fan-out: successes in input order plus per-identifier errors."""
+
+    results: List[Tuple[str, T]] = field(default_factory=list)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+
+    def values(self) -> List[T]:
+        return [value for _, value in self.results]
+
+    def raise_if_empty(self) -> None:
+        """Re-raise the first error when every identifier failed."""
+
+        if self.errors and not self.results:
+            raise next(iter(self.errors.values()))
+
+
+def _collect(ids: List[str], outcomes: List[Tuple[bool, object]], what: str) -> BatchResult:
+    batch: BatchResult = BatchResult()
+    for identifier, (ok, value) in zip(ids, outcomes):
+        if ok:
+            batch.results.append((identifier, value))
+        else:
+            LOGGER.warning("Failed to fetch %s %s: %s", what, identifier, value)
+            batch.errors[identifier] = value  # type: ignore[assignment]
+    return batch
+
+
+def fan_out(
+    fn: Callable[[str], T],
+    ids: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    what: str = "item",
+) -> BatchResult[T]:
+    """Call ``fn`` for every identifier using at most ``concurrency`` threads.
+
+    Results keep the order of ``ids``; an exception raised for one identifier
+    is recorded in :attr:`BatchResult.errors` instead of aborting the batch.
+    """
+
+    ids = list(ids)
+
+    def call(identifier: str) -> Tuple[bool, object]:
+        try:
+            return True, fn(identifier)
+        except Exception as exc:
+            return False, exc
+
+    if len(ids) <= 1 or concurrency <= 1:
+        return _collect(ids, [call(identifier) for identifier in ids], what)
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(ids))) as executor:
+        outcomes = list(executor.map(call, ids))
+    return _collect(ids, outcomes, what)
+
+
+async def async_fan_out(
+    fn: Callable[[str], Awaitable[T]],
+    ids: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    what: str = "item",
+) -> BatchResult[T]:
+    """Asyncio counterpart of :func:`fan_out` bounded by a semaphore."""
+
+    ids = list(ids)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def call(identifier: str) -> Tuple[bool, object]:
+        async with semaphore:
+            try:
+                return True, await fn(identifier)
+            except Exception as exc:
+                return False, exc
+
+    outcomes = await asyncio.gather(*(call(identifier) for identifier in ids))
+    return _collect(ids, list(outcomes), what)
+
+
+__all__ = ["BatchResult", "DEFAULT_CONCURRENCY", "async_fan_out", "fan_out"]
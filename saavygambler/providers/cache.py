@@ -0,0 +1,446 @@
+"""Cache tiers used by :class:`~saavygambler.providers.api_client.APIClient`."""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DISK_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_MEMORY_CACHE_ENTRIES = 1024
+DEFAULT_MEMORY_CACHE_BYTES = 16 * 1024 * 1024
+DISK_CACHE_FILENAME = "http_cache.sqlite3"
+
+# Only headers that later requests can act upon are kept with a cached entry.
+RETAINED_HEADERS = ("etag", "last-modified")
+
+# Upper bound on expired entries purged during a single cache operation.
+_SWEEP_BATCH = 64
+
+_UNDECODED = object()
+
+
+def retained_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Return the subset of ``headers`` worth storing alongside a cached body."""
+
+    kept: Dict[str, str] = {}
+    for name in RETAINED_HEADERS:
+        value = headers.get(name)
+        if value is not None:
+            kept[name] = value
+    return kept
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness rules for one endpoint.
+
+    ``ttl`` is how long a response is fresh. Within ``stale_while_revalidate``
+    seconds after that, the stale body is served immediately while a refresh
+    runs in the background; within ``stale_if_error`` seconds it is served when
+    the upstream request fails.
+    """
+
+    ttl: float
+    stale_while_revalidate: Optional[float] = None
+    stale_if_error: Optional[float] = None
+
+    def as_kwargs(self) -> Dict[str, Optional[float]]:
+        return {
+            "cache_ttl": self.ttl,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "stale_if_error": self.stale_if_error,
+        }
+
+
+@dataclass
+class CachedResponse:
+    """Represents a cached HTTP response.
+
+    The raw ``body`` bytes are what gets cached and persisted; decoding is
+    deferred until a caller asks for the payload and the decoded object is
+    memoised so repeated hits do not parse the body again.
+    """
+
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+    timestamp: float
+    expires_in: Optional[float] = None
+    retain_for: float = 0.0
+    _data: Any = field(default=_UNDECODED, init=False, repr=False, compare=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._data is not _UNDECODED
+
+    def decode(self, loads: Callable[[bytes], Any]) -> Any:
+        """Return the body decoded with ``loads``, parsing it at most once."""
+
+        if self._data is _UNDECODED:
+            self._data = loads(self.body)
+        return self._data
+
+    def renewed(
+        self,
+        *,
+        headers: Dict[str, str],
+        timestamp: float,
+        expires_in: Optional[float],
+        retain_for: float,
+    ) -> "CachedResponse":
+        """Copy of this entry with new freshness metadata and the same body."""
+
+        entry = CachedResponse(
+            status_code=self.status_code,
+            headers=headers,
+            body=self.body,
+            timestamp=timestamp,
+            expires_in=expires_in,
+            retain_for=retain_for,
+        )
+        entry._data = self._data
+        return entry
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        if self.expires_in is None:
+            return None
+        return self.timestamp + self.expires_in
+
+    @property
+    def purge_at(self) -> Optional[float]:
+        """Moment after which the entry is useless, even as a stale fallback."""
+
+        expires_at = self.expires_at
+        if expires_at is None:
+            return None
+        return expires_at + self.retain_for
+
+    def is_valid(self) -> bool:
+        if self.expires_in is None:
+            return True
+        return (time.time() - self.timestamp) < self.expires_in
+
+    def staleness(self) -> float:
+        """Seconds elapsed since the entry expired; ``0`` while still fresh."""
+
+        expires_at = self.expires_at
+        if expires_at is None:
+            return 0.0
+        return max(0.0, time.time() - expires_at)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache has been used."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoryCache:
+    """Bounded, thread-safe LRU cache of :class:`CachedResponse` objects.
+
+    The cache is capped both by number of entries and by the summed ``size`` of
+    the stored responses. Expired entries are tracked in a heap ordered by
+    expiry time and purged a few at a time on every read and write, so the
+    cost of sweeping is amortised across normal traffic instead of requiring a
+    background thread. An entry's ``retain_for`` keeps it around past expiry
+    so it can still be served stale.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MEMORY_CACHE_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_MEMORY_CACHE_BYTES,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than zero")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str, *, max_stale: float = 0.0) -> Optional[CachedResponse]:
+        """Return the entry for ``key`` and mark it as recently used.
+
+        Expired entries are only returned when they expired at most
+        ``max_stale`` seconds ago.
+        """
+
+        with self._lock:
+            self._sweep(time.time())
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if not entry.is_valid():
+                if not max_stale or entry.staleness() > max_stale:
+                    self.stats.misses += 1
+                    return None
+                self.stats.stale_hits += 1
+            else:
+                self.stats.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._sweep(time.time())
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                self._remove(key)
+                return
+            self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            purge_at = entry.purge_at
+            if purge_at is not None:
+                heapq.heappush(self._expiry_heap, (purge_at, key))
+                if len(self._expiry_heap) > 2 * len(self._entries) + _SWEEP_BATCH:
+                    self._rebuild_heap()
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._bytes = 0
+
+    def purge_expired(self) -> int:
+        """Remove every expired entry and return how many were dropped."""
+
+        with self._lock:
+            return self._sweep(time.time(), limit=None)
+
+    def _sweep(self, now: float, limit: Optional[int] = _SWEEP_BATCH) -> int:
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now and (limit is None or removed < limit):
+            purge_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is None or entry.purge_at != purge_at:
+                continue  # superseded by a newer write
+            self._remove(key)
+            self.stats.expirations += 1
+            removed += 1
+        return removed
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _rebuild_heap(self) -> None:
+        self._expiry_heap = [
+            (entry.purge_at, key)
+            for key, entry in self._entries.items()
+            if entry.purge_at is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+
+
+class DiskCache:
+    """Durable response cache stored in a SQLite database.
+
+    Entries are keyed on the same string produced by
+    :py:meth:`APIClient._cache_key` so that a response cached by one process is
+    visible to the next CLI run, GUI launch, or service restart. The total size
+    of stored payloads is bounded by ``max_bytes``; expired rows are dropped
+    first and the least recently used rows after that.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            status_code INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            timestamp REAL NOT NULL,
+            expires_in REAL,
+            size INTEGER NOT NULL,
+            accessed_at REAL NOT NULL,
+            retain_for REAL NOT NULL DEFAULT 0
+        )
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int = DEFAULT_DISK_CACHE_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than zero")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(self._SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "retain_for" not in columns:
+                self._conn.execute("ALTER TABLE responses ADD COLUMN retain_for REAL NOT NULL DEFAULT 0")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+
+    @classmethod
+    def in_directory(cls, directory: Path, *, max_bytes: int = DEFAULT_DISK_CACHE_BYTES) -> "DiskCache":
+        """Open the cache database that lives inside ``directory``."""
+
+        return cls(Path(directory) / DISK_CACHE_FILENAME, max_bytes=max_bytes)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry stored for ``key`` or ``None`` when it is missing."""
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT status_code, headers, body, timestamp, expires_in, retain_for "
+                    "FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+        except sqlite3.Error as exc:
+            LOGGER.warning("[DiskCache] read failed for %s: %s", key, exc)
+            return None
+        status_code, headers, body, timestamp, expires_in, retain_for = row
+        return CachedResponse(
+            status_code=status_code,
+            headers=json.loads(headers),
+            body=bytes(body),
+            timestamp=timestamp,
+            expires_in=expires_in,
+            retain_for=retain_for,
+        )
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """Store ``entry`` and evict old rows if the size budget is exceeded."""
+
+        body = entry.body
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, status_code, headers, body, timestamp, expires_in, size, accessed_at, retain_for) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.status_code,
+                        json.dumps(entry.headers),
+                        body,
+                        entry.timestamp,
+                        entry.expires_in,
+                        size,
+                        time.time(),
+                        entry.retain_for,
+                    ),
+                )
+                self._evict()
+        except sqlite3.Error as exc:
+            LOGGER.warning("[DiskCache] write failed for %s: %s", key, exc)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return int(total)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """Trim the database back under ``max_bytes``; caller holds the lock."""
+
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_in IS NOT NULL AND timestamp + expires_in + retain_for < ?",
+            (time.time(),),
+        )
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+
+__all__ = [
+    "CachePolicy",
+    "CacheStats",
+    "CachedResponse",
+    "DEFAULT_DISK_CACHE_BYTES",
+    "DEFAULT_MEMORY_CACHE_BYTES",
+    "DEFAULT_MEMORY_CACHE_ENTRIES",
+    "DiskCache",
+    "MemoryCache",
+    "retained_headers",
+]
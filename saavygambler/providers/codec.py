@@ -0,0 +1,81 @@
+"""Pluggable JSON decoding backends for cached response bodies."""
+from __future__ import annotations
+
+import json
+from importlib import import_module
+from typing import Any, Callable, Dict, List
+
+JSONDecoder = Callable[[bytes], Any]
+
+# Order in which ``"auto"`` probes the optional fast decoders.
+_PREFERRED_BACKENDS = ("orjson", "msgspec")
+
+
+def _load_backend(name: str) -> JSONDecoder:
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        return import_module("orjson").loads
+    if name == "msgspec":
+        return import_module("msgspec.json").decode
+    raise ValueError(f"Unknown JSON backend {name!r}")
+
+
+_DECODERS: Dict[str, JSONDecoder] = {}
+
+
+def available_backends() -> List[str]:
+    """Return the names of JSON backends that can be imported here."""
+
+    names = []
+    for name in (*_PREFERRED_BACKENDS, "json"):
+        try:
+            _load_backend(name)
+        except ModuleNotFoundError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(name: str = "auto") -> JSONDecoder:
+    """Return a ``bytes -> object`` decoder for the requested backend.
+
+    ``"auto"`` picks the fastest installed backend (``orjson``, then
+    ``msgspec``) and falls back to the standard library.
+    """
+
+    if name in _DECODERS:
+        return _DECODERS[name]
+    if name == "auto":
+        decoder = _load_backend(available_backends()[0])
+    else:
+        try:
+            decoder = _load_backend(name)
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                f"Optional dependency {name!r} is required for the {name!r} JSON backend",
+            ) from exc
+    _DECODERS[name] = decoder
+    return decoder
+
+
+def typed_decoder(model: Any) -> JSONDecoder:
+    """Return a decoder that only materialises the fields declared on ``model``.
+
+    ``model`` is a :class:`msgspec.Struct` (or any type msgspec understands);
+    unknown keys in the payload are skipped without building Python objects
+    for them, which is much cheaper than decoding the full tree when a caller
+    needs only a handful of fields.
+    """
+
+    try:
+        msgspec_json = import_module("msgspec.json")
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "Optional dependency 'msgspec' is required for typed decoding "
+            "(install the 'fast-json' extra)",
+        ) from exc
+    return msgspec_json.Decoder(model).decode
+
+
+__all__ = ["JSONDecoder", "available_backends", "get_decoder", "typed_decoder"]
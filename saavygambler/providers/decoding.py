@@ -0,0 +1,158 @@
+"""Declarative, compiled decoders that turn provider payloads into models.
+
+A :class:`RecordDecoder` is described by a list of :class:`FieldSpec` entries
+mapping payload keys to model fields. The specification is compiled once
+into a single Python function that performs every lookup and conversion
+inline, avoiding the per-field method calls and dictionary rebuilding of a
+hand-written ``item.get`` chain.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+Converter = Callable[[Any], Any]
+
+
+def to_int(value: Any) -> Optional[int]:
+    """Convert ``value`` to ``int``; blanks and malformed values become ``None``."""
+
+    if value is None or value == "":
+        return None
+    if type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_float(value: Any) -> Optional[float]:
+    """Convert ``value`` to ``float``; blanks and malformed values become ``None``."""
+
+    if value is None or value == "":
+        return None
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> Optional[date]:
+    """Parse an ISO ``YYYY-MM-DD`` string, memoising results per distinct value.
+
+    A season of fixtures only spans a few hundred distinct dates, so caching
+    turns almost every conversion into a dictionary hit. Unparseable values
+    return ``None``; reporting them is left to the caller, since a cached
+    call would only report each distinct value once.
+    """
+
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_date(value: Any) -> Optional[date]:
+    """Parse ``value`` as a date; missing and malformed values become ``None``."""
+
+    if not value or not isinstance(value, str):
+        return None
+    return parse_date(value)
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Map payload key ``source`` onto model attribute ``target``.
+
+    ``convert`` is applied to the raw value (including ``None`` for missing
+    keys); without a converter the raw value or ``default`` is used as is.
+    When ``required`` is set, a record whose value ends up ``None`` is
+    rejected: it is logged and left out of the decoded results.
+    """
+
+    target: str
+    source: str
+    convert: Optional[Converter] = None
+    default: Any = None
+    required: bool = False
+
+
+class RecordDecoder:
+    """Compiled converter from payload dictionaries to ``model`` instances.
+
+    ``decode`` returns ``None`` for records rejected by a ``required`` field;
+    :py:meth:`decode_many` and :py:meth:`iter_decode` skip them.
+    """
+
+    def __init__(self, model: Callable[..., Any], fields: Sequence[FieldSpec]) -> None:
+        self.model = model
+        self.fields = tuple(fields)
+        self.decode: Callable[[Dict[str, Any]], Any] = self._compile()
+
+    def _compile(self) -> Callable[[Dict[str, Any]], Any]:
+        namespace: Dict[str, Any] = {"_model": self.model, "_reject": self._reject}
+        arguments: List[str] = []
+        checks: List[str] = []
+        for index, spec in enumerate(self.fields):
+            namespace[f"_default{index}"] = spec.default
+            lookup = f"_get({spec.source!r}, _default{index})"
+            if spec.convert is not None:
+                namespace[f"_convert{index}"] = spec.convert
+                lookup = f"_convert{index}({lookup})"
+            if spec.required:
+                checks.append(
+                    f"    _value{index} = {lookup}\n"
+                    f"    if _value{index} is None:\n"
+                    f"        return _reject(item, {spec.target!r}, {spec.source!r})\n"
+                )
+                lookup = f"_value{index}"
+            arguments.append(f"{spec.target}={lookup}")
+        source = (
+            "def decode(item):\n"
+            "    _get = item.get\n"
+            f"{''.join(checks)}"
+            f"    return _model({', '.join(arguments)})\n"
+        )
+        exec(compile(source, f"<decoder {getattr(self.model, '__name__', self.model)}>", "exec"), namespace)
+        return namespace["decode"]
+
+    def _reject(self, item: Dict[str, Any], target: str, source: str) -> None:
+        LOGGER.warning(
+            "Skipping %s record with missing or invalid %s (%s=%r)",
+            getattr(self.model, "__name__", self.model),
+            target,
+            source,
+            item.get(source),
+        )
+        return None
+
+    def decode_many(self, items: Optional[Iterable[Dict[str, Any]]]) -> List[Any]:
+        """Decode a whole payload array, treating ``None`` as empty."""
+
+        if not items:
+            return []
+        return [record for record in map(self.decode, items) if record is not None]
+
+    def iter_decode(self, items: Optional[Iterable[Dict[str, Any]]]) -> Iterator[Any]:
+        """Lazily decode a payload array, one record per iteration."""
+
+        return (record for record in map(self.decode, items or ()) if record is not None)
+
+
+__all__ = [
+    "FieldSpec",
+    "RecordDecoder",
+    "parse_date",
+    "to_date",
+    "to_float",
+    "to_int",
+]
@@ -0,0 +1,100 @@
+"""Client-side rate limiting for outbound API requests."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Optional
+
+from ..config import get_settings
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by synchronous and asyncio callers.
+
+    ``rate`` tokens are added per second up to ``burst``. Each request reserves
+    one token; when the bucket is empty the caller waits until its reservation
+    matures, which keeps callers in arrival order without a queue. A server
+    supplied ``Retry-After`` can :py:meth:`pause` the whole bucket so every
+    client in the process backs off together.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        if burst < 1:
+            raise ValueError("burst must be at least one")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait."""
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(0.0, self._paused_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Block new reservations for ``seconds`` from now."""
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Interpret a ``Retry-After`` header given in seconds or as an HTTP date."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+@lru_cache()
+def get_rate_limiter() -> Optional[TokenBucket]:
+    """Return the process-wide limiter configured by the settings, if enabled."""
+
+    settings = get_settings()
+    if settings.rate_limit_per_second <= 0:
+        return None
+    return TokenBucket(settings.rate_limit_per_second, settings.rate_limit_burst)
+
+
+__all__ = ["TokenBucket", "get_rate_limiter", "parse_retry_after"]
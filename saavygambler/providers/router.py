@@ -0,0 +1,257 @@
+"""Composite provider that routes, hedges and fails over between backends."""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..models import Event, Odds, PlayerStats, TeamStats
+from .base import SportsDataProvider
+
+LOGGER = logging.getLogger(__name__)
+
+_LATENCY_WINDOW = 128
+_MIN_SAMPLES = 5
+
+
+@dataclass
+class BackendStats:
+    name: str
+    latency_ewma: Optional[float]
+    hedge_deadline: float
+    calls: int
+    failures: int
+    circuit: str
+
+
+class _Backend:
+    """Latency and circuit-breaker bookkeeping for one wrapped provider."""
+
+    def __init__(self, provider: SportsDataProvider, name: str) -> None:
+        self.provider = provider
+        self.name = name
+        self.ewma: Optional[float] = None
+        self.samples: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        with self.lock:
+            if len(self.samples) < _MIN_SAMPLES:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(math.ceil(fraction * len(ordered))) - 1)]
+
+
+class RoutingProvider(SportsDataProvider):
+    """Serve :class:`SportsDataProvider` calls from an ordered set of backends.
+
+    Each call goes to the healthy backend with the lowest latency EWMA
+    (backends without measurements keep their configured order behind
+    measured ones). If it has not answered once its ``hedge_percentile``
+    latency has elapsed, the same call is *hedged* to the next backend and the
+    first successful answer wins. Errors fail over to the next backend
+    immediately.
+
+    ``failure_threshold`` consecutive errors open a backend's circuit; it is
+    skipped for ``reset_timeout`` seconds and then admits a single trial call
+    (half-open) whose outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[SportsDataProvider],
+        *,
+        names: Optional[Sequence[str]] = None,
+        hedge_percentile: float = 0.95,
+        initial_hedge_delay: float = 0.5,
+        min_hedge_delay: float = 0.01,
+        alpha: float = 0.2,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        max_workers: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not backends:
+            raise ValueError("RoutingProvider requires at least one backend")
+        if not 0 < hedge_percentile <= 1:
+            raise ValueError("hedge_percentile must be within (0, 1]")
+        names = list(names or [type(backend).__name__ for backend in backends])
+        self._backends = [_Backend(backend, name) for backend, name in zip(backends, names)]
+        self.hedge_percentile = hedge_percentile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provider-router")
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def backend_stats(self) -> List[BackendStats]:
+        stats = []
+        for backend in self._backends:
+            hedge_deadline = self._hedge_delay(backend)
+            with backend.lock:
+                stats.append(
+                    BackendStats(
+                        name=backend.name,
+                        latency_ewma=backend.ewma,
+                        hedge_deadline=hedge_deadline,
+                        calls=backend.calls,
+                        failures=backend.failures,
+                        circuit=self._circuit_state_locked(backend),
+                    )
+                )
+        return stats
+
+    # ------------------------------------------------------------------
+    # SportsDataProvider API
+    def search_teams(self, name: str) -> List[TeamStats]:
+        return self._call("search_teams", name)
+
+    def get_events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
+        return self._call("get_events", league_id, from_date=from_date)
+
+    def lookup_events(self, event_ids) -> List[Event]:
+        return self._call("lookup_events", list(event_ids))
+
+    def get_team(self, team_id: str) -> Optional[TeamStats]:
+        return self._call("get_team", team_id)
+
+    def get_player_stats(self, player_ids) -> List[PlayerStats]:
+        return self._call("get_player_stats", list(player_ids))
+
+    def get_odds(self, event_id: str) -> Optional[Odds]:
+        return self._call("get_odds", event_id)
+
+    # ------------------------------------------------------------------
+    # Routing
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        candidates, forced = self._candidates()
+        pending: Dict["Future[Any]", _Backend] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch() -> None:
+            while candidates:
+                backend = candidates.pop(0)
+                if forced or self._admit(backend):
+                    future = self._executor.submit(self._timed, backend, method, args, kwargs)
+                    pending[future] = backend
+                    return
+
+        launch()
+        while pending:
+            leader = next(reversed(pending.values()))
+            timeout = self._hedge_delay(leader) if candidates else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                LOGGER.debug("Hedging %s after %.3fs on %s", method, timeout, leader.name)
+                launch()
+                continue
+            for future in done:
+                backend = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                LOGGER.warning("Provider %s failed for %s: %s", backend.name, method, error)
+                last_error = error
+            if not pending:
+                launch()
+        if last_error is None:
+            raise RuntimeError(f"No provider backend available for {method}")
+        raise last_error
+
+    def _timed(self, backend: _Backend, method: str, args: tuple, kwargs: dict) -> Any:
+        started = self._clock()
+        try:
+            result = getattr(backend.provider, method)(*args, **kwargs)
+        except Exception:
+            self._record_failure(backend)
+            raise
+        self._record_success(backend, self._clock() - started)
+        return result
+
+    def _candidates(self) -> Tuple[List[_Backend], bool]:
+        """Backends to try in order, and whether circuits are being ignored."""
+
+        available = [backend for backend in self._backends if self._circuit_state(backend) != "open"]
+        forced = not available
+        if forced:
+            # Every circuit is open: trying anyway beats failing outright.
+            available = list(self._backends)
+        order = {id(backend): index for index, backend in enumerate(self._backends)}
+        available.sort(
+            key=lambda backend: (math.inf if backend.ewma is None else backend.ewma, order[id(backend)])
+        )
+        return available, forced
+
+    def _hedge_delay(self, backend: _Backend) -> float:
+        observed = backend.percentile(self.hedge_percentile)
+        if observed is None:
+            return self.initial_hedge_delay
+        return max(self.min_hedge_delay, observed)
+
+    # ------------------------------------------------------------------
+    # Circuit breaker
+    def _circuit_state(self, backend: _Backend) -> str:
+        with backend.lock:
+            return self._circuit_state_locked(backend)
+
+    def _circuit_state_locked(self, backend: _Backend) -> str:
+        """Circuit state of ``backend``; the caller must hold ``backend.lock``."""
+
+        opened_at = backend.opened_at
+        if opened_at is None:
+            return "closed"
+        if self._clock() - opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def _admit(self, backend: _Backend) -> bool:
+        with backend.lock:
+            state = self._circuit_state_locked(backend)
+            if state == "closed":
+                return True
+            if state == "half-open" and not backend.trial_in_flight:
+                backend.trial_in_flight = True
+                return True
+            return False
+
+    def _record_success(self, backend: _Backend, elapsed: float) -> None:
+        with backend.lock:
+            backend.calls += 1
+            backend.samples.append(elapsed)
+            backend.ewma = elapsed if backend.ewma is None else (
+                self.alpha * elapsed + (1 - self.alpha) * backend.ewma
+            )
+            backend.consecutive_failures = 0
+            backend.opened_at = None
+            backend.trial_in_flight = False
+
+    def _record_failure(self, backend: _Backend) -> None:
+        with backend.lock:
+            backend.calls += 1
+            backend.failures += 1
+            backend.consecutive_failures += 1
+            reopen = backend.trial_in_flight
+            backend.trial_in_flight = False
+            if reopen or backend.consecutive_failures >= self.failure_threshold:
+                if backend.opened_at is None or reopen:
+                    LOGGER.warning("Opening circuit for provider %s", backend.name)
+                backend.opened_at = self._clock()
+
+
+__all__ = ["BackendStats", "RoutingProvider"]
@@ -1,28 +1,101 @@
 """Implementation of :class:`SportsDataProvider` using TheSportsDB."""
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Iterable, List, Optional
+from datetime import date
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional
 
 from ..config import get_settings
 from ..models import Event, Odds, PlayerStats, TeamStats
-from .api_client import APIClient
-from .base import SportsDataProvider
+from .api_client import APIClient, AsyncAPIClient
+from .base import AsyncSportsDataProvider, SportsDataProvider
+from .batch import DEFAULT_CONCURRENCY, BatchResult, async_fan_out, fan_out
+from .cache import CachePolicy
+from .codec import get_decoder
+from .decoding import FieldSpec, RecordDecoder, to_date, to_float, to_int
 
 BASE_URL = "https://www.thesportsdb.com/api/v1/json"
 
+# Team and player profiles change rarely, so they may be served stale for a
+# while; odds move quickly and only get a short grace period.
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "searchteams.php": CachePolicy(ttl=3600, stale_while_revalidate=3600, stale_if_error=86400),
+    "eventsnextleague.php": CachePolicy(ttl=600, stale_while_revalidate=300, stale_if_error=3600),
+    "lookupevent.php": CachePolicy(ttl=600, stale_while_revalidate=300, stale_if_error=3600),
+    "lookupteam.php": CachePolicy(ttl=3600, stale_while_revalidate=3600, stale_if_error=86400),
+    "lookupplayer.php": CachePolicy(ttl=3600, stale_while_revalidate=3600, stale_if_error=86400),
+    "lookupeventodds.php": CachePolicy(ttl=300, stale_while_revalidate=60, stale_if_error=600),
+    "search_all_seasons.php": CachePolicy(ttl=86400, stale_while_revalidate=86400, stale_if_error=604800),
+    "eventsseason.php": CachePolicy(ttl=3600, stale_while_revalidate=86400, stale_if_error=604800),
+    "eventspastleague.php": CachePolicy(ttl=600, stale_while_revalidate=300, stale_if_error=3600),
+}
 
-class TheSportsDBProvider(SportsDataProvider):
-    """Fetch data from TheSportsDB public API."""
+TEAM_DECODER = RecordDecoder(
+    TeamStats,
+    [
+        FieldSpec("team_id", "idTeam", default=""),
+        FieldSpec("name", "strTeam", default=""),
+        FieldSpec("league", "strLeague"),
+        FieldSpec("season", "strSeason"),
+        FieldSpec("wins", "intWins", to_int),
+        FieldSpec("losses", "intLosses", to_int),
+        FieldSpec("points_for", "intPointsFor", to_float),
+        FieldSpec("points_against", "intPointsAgainst", to_float),
+    ],
+)
 
-    def __init__(self, *, client: Optional[APIClient] = None) -> None:
-        self._settings = get_settings()
-        self._client = client or APIClient()
+EVENT_DECODER = RecordDecoder(
+    Event,
+    [
+        FieldSpec("event_id", "idEvent", default=""),
+        FieldSpec("league_id", "idLeague"),
+        FieldSpec("home_team_id", "idHomeTeam", default=""),
+        FieldSpec("away_team_id", "idAwayTeam", default=""),
+        FieldSpec("event_date", "dateEvent", to_date, required=True),
+        FieldSpec("venue", "strVenue"),
+        FieldSpec("status", "strStatus"),
+        FieldSpec("home_score", "intHomeScore", to_int),
+        FieldSpec("away_score", "intAwayScore", to_int),
+        FieldSpec("home_team_name", "strHomeTeam"),
+        FieldSpec("away_team_name", "strAwayTeam"),
+    ],
+)
+
+PLAYER_DECODER = RecordDecoder(
+    PlayerStats,
+    [
+        FieldSpec("player_id", "idPlayer", default=""),
+        FieldSpec("name", "strPlayer", default=""),
+        FieldSpec("team_id", "idTeam"),
+        FieldSpec("position", "strPosition"),
+        FieldSpec("games_played", "intGamesPlayed", to_int),
+        FieldSpec("points_per_game", "strPointsPG", to_float),
+        FieldSpec("rebounds_per_game", "strReboundsPG", to_float),
+        FieldSpec("assists_per_game", "strAssistsPG", to_float),
+    ],
+)
+
+
+class _TheSportsDBPayloads:
+    """URL construction and payload parsing shared by the sync and async providers."""
+
+    _settings: Any
+    _cache_policies: Mapping[str, CachePolicy] = CACHE_POLICIES
 
     @property
     def _base_url(self) -> str:
         return f"{BASE_URL}/{self._resolve_api_key()}"
 
+    def _request(self, endpoint: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """Keyword arguments for ``get_json`` on ``endpoint``, including its cache policy."""
+
+        options: Dict[str, Any] = {"url": f"{self._base_url}/{endpoint}", "params": params}
+        options.update(self._cache_policies[endpoint].as_kwargs())
+        return options
+
+    @property
+    def _concurrency(self) -> int:
+        return int(getattr(self._settings, "provider_concurrency", DEFAULT_CONCURRENCY))
+
     def _resolve_api_key(self) -> str:
         value = getattr(self._settings, "sportsdb_api_key", None)
         if value is None:
@@ -30,158 +103,229 @@ class TheSportsDBProvider(SportsDataProvider):
         key = str(value).strip()
         return key or "1"
 
-    def search_teams(self, name: str) -> List[TeamStats]:
-        payload = self._client.get_json(
-            f"{self._base_url}/searchteams.php",
-            params={"t": name},
-            cache_ttl=3600,
+    def _parse_teams(self, payload: Dict[str, Any]) -> List[TeamStats]:
+        return TEAM_DECODER.decode_many(payload.get("teams"))
+
+    def _parse_events(self, payload: Dict[str, Any]) -> List[Event]:
+        return EVENT_DECODER.decode_many(payload.get("events"))
+
+    def _stream_request(self, endpoint: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """Like :py:meth:`_request`, but decoded per call instead of memoised in the cache.
+
+        Season payloads are large; decoding them afresh keeps only the raw
+        bytes in the bounded HTTP cache rather than every decoded season.
+        """
+
+        options = self._request(endpoint, params)
+        options["decoder"] = get_decoder(getattr(self._settings, "json_backend", "auto"))
+        return options
+
+    @staticmethod
+    def _parse_seasons(payload: Dict[str, Any]) -> List[str]:
+        return [item["strSeason"] for item in payload.get("seasons") or [] if item.get("strSeason")]
+
+    def _parse_players(self, payload: Dict[str, Any]) -> List[PlayerStats]:
+        return PLAYER_DECODER.decode_many(payload.get("players"))
+
+    def _parse_odds(self, event_id: str, payload: Dict[str, Any]) -> Optional[Odds]:
+        odds_list = payload.get("odds", []) or []
+        if not odds_list:
+            return None
+        market = odds_list[0]
+        return Odds(
+            event_id=event_id,
+            home_moneyline=to_float(market.get("homeWinOdds")),
+            away_moneyline=to_float(market.get("awayWinOdds")),
+            spread=to_float(market.get("pointSpread")),
+            home_spread_odds=to_float(market.get("homeSpreadOdds")),
+            away_spread_odds=to_float(market.get("awaySpreadOdds")),
+            total=to_float(market.get("total")),
+            over_odds=to_float(market.get("overOdds")),
+            under_odds=to_float(market.get("underOdds")),
         )
-        teams = []
-        for item in payload.get("teams", []) or []:
-            teams.append(
-                TeamStats(
-                    team_id=item.get("idTeam", ""),
-                    name=item.get("strTeam", ""),
-                    league=item.get("strLeague"),
-                    season=item.get("strSeason"),
-                    wins=self._safe_int(item.get("intWins")),
-                    losses=self._safe_int(item.get("intLosses")),
-                    points_for=self._safe_float(item.get("intPointsFor")),
-                    points_against=self._safe_float(item.get("intPointsAgainst")),
-                )
-            )
-        return teams
 
-    def get_events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
+    @staticmethod
+    def _events_params(league_id: str, from_date: Optional[date]) -> Dict[str, str]:
         params = {"id": league_id}
         if from_date:
             params["d"] = from_date.strftime("%Y-%m-%d")
-        payload = self._client.get_json(
-            f"{self._base_url}/eventsnextleague.php",
-            params=params,
-            cache_ttl=600,
-        )
-        events = []
-        for item in payload.get("events", []) or []:
-            events.append(self._build_event(item))
-        return events
+        return params
+
+
+class TheSportsDBProvider(_TheSportsDBPayloads, SportsDataProvider):
+    """Fetch data from TheSportsDB public API."""
+
+    def __init__(
+        self,
+        *,
+        client: Optional[APIClient] = None,
+        cache_policies: Optional[Mapping[str, CachePolicy]] = None,
+    ) -> None:
+        self._settings = get_settings()
+        if cache_policies:
+            self._cache_policies = {**CACHE_POLICIES, **cache_policies}
+        self._client = client or APIClient()
+
+    def close(self) -> None:
+        self._client.close()
+
+    def search_teams(self, name: str) -> List[TeamStats]:
+        payload = self._client.get_json(**self._request("searchteams.php", {"t": name}))
+        return self._parse_teams(payload)
+
+    def get_events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
+        params = self._events_params(league_id, from_date)
+        payload = self._client.get_json(**self._request("eventsnextleague.php", params))
+        return self._parse_events(payload)
 
     def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
-        events: List[Event] = []
-        for event_id in event_ids:
-            payload = self._client.get_json(
-                f"{self._base_url}/lookupevent.php",
-                params={"id": event_id},
-                cache_ttl=600,
-            )
-            for item in payload.get("events", []) or []:
-                events.append(self._build_event(item))
-        return events
+        batch = self.lookup_events_batch(event_ids)
+        batch.raise_if_empty()
+        return [event for events in batch.values() for event in events]
+
+    def lookup_events_batch(self, event_ids: Iterable[str]) -> BatchResult[List[Event]]:
+        """Fetch events concurrently, keeping per-identifier failures separate."""
+
+        def fetch(event_id: str) -> List[Event]:
+            payload = self._client.get_json(**self._request("lookupevent.php", {"id": event_id}))
+            return self._parse_events(payload)
+
+        return fan_out(fetch, event_ids, concurrency=self._concurrency, what="event")
 
     def get_team(self, team_id: str) -> Optional[TeamStats]:
-        payload = self._client.get_json(
-            f"{self._base_url}/lookupteam.php",
-            params={"id": team_id},
-            cache_ttl=3600,
-        )
-        teams = payload.get("teams", []) or []
-        if not teams:
-            return None
-        team = teams[0]
-        return TeamStats(
-            team_id=team.get("idTeam", ""),
-            name=team.get("strTeam", ""),
-            league=team.get("strLeague"),
-            season=team.get("strSeason"),
-            wins=self._safe_int(team.get("intWins")),
-            losses=self._safe_int(team.get("intLosses")),
-            points_for=self._safe_float(team.get("intPointsFor")),
-            points_against=self._safe_float(team.get("intPointsAgainst")),
-        )
+        payload = self._client.get_json(**self._request("lookupteam.php", {"id": team_id}))
+        teams = self._parse_teams(payload)
+        return teams[0] if teams else None
 
     def get_player_stats(self, player_ids: Iterable[str]) -> List[PlayerStats]:
-        stats: List[PlayerStats] = []
-        for player_id in player_ids:
+        batch = self.get_player_stats_batch(player_ids)
+        batch.raise_if_empty()
+        return [player for players in batch.values() for player in players]
+
+    def get_player_stats_batch(self, player_ids: Iterable[str]) -> BatchResult[List[PlayerStats]]:
+        """Fetch player statistics concurrently, keeping per-identifier failures separate."""
+
+        def fetch(player_id: str) -> List[PlayerStats]:
+            payload = self._client.get_json(**self._request("lookupplayer.php", {"id": player_id}))
+            return self._parse_players(payload)
+
+        return fan_out(fetch, player_ids, concurrency=self._concurrency, what="player")
+
+    def get_odds(self, event_id: str) -> Optional[Odds]:
+        payload = self._client.get_json(**self._request("lookupeventodds.php", {"id": event_id}))
+        return self._parse_odds(event_id, payload)
+
+    def list_seasons(self, league_id: str) -> List[str]:
+        """Return the season labels TheSportsDB knows for ``league_id``, oldest first."""
+
+        payload = self._client.get_json(**self._request("search_all_seasons.php", {"id": league_id}))
+        return self._parse_seasons(payload)
+
+    def iter_season_events(
+        self, league_id: str, seasons: Optional[Iterable[str]] = None
+    ) -> Iterator[Event]:
+        """Yield every event of ``seasons`` (default: all seasons), one season at a time.
+
+        Only one season's payload is held at once and events are decoded as
+        they are consumed, so memory does not grow with the number of seasons.
+        """
+
+        for season in self.list_seasons(league_id) if seasons is None else seasons:
             payload = self._client.get_json(
-                f"{self._base_url}/lookupplayer.php",
-                params={"id": player_id},
-                cache_ttl=3600,
+                **self._stream_request("eventsseason.php", {"id": league_id, "s": season})
             )
-            for item in payload.get("players", []) or []:
-                stats.append(
-                    PlayerStats(
-                        player_id=item.get("idPlayer", ""),
-                        name=item.get("strPlayer", ""),
-                        team_id=item.get("idTeam"),
-                        position=item.get("strPosition"),
-                        games_played=self._safe_int(item.get("intGamesPlayed")),
-                        points_per_game=self._safe_float(item.get("strPointsPG")),
-                        rebounds_per_game=self._safe_float(item.get("strReboundsPG")),
-                        assists_per_game=self._safe_float(item.get("strAssistsPG")),
-                    )
-                )
-        return stats
+            yield from EVENT_DECODER.iter_decode(payload.get("events"))
 
-    def get_odds(self, event_id: str) -> Optional[Odds]:
-        payload = self._client.get_json(
-            f"{self._base_url}/lookupeventodds.php",
-            params={"id": event_id},
-            cache_ttl=300,
-        )
-        odds_list = payload.get("odds", []) or []
-        if not odds_list:
-            return None
-        market = odds_list[0]
-        return Odds(
-            event_id=event_id,
-            home_moneyline=self._safe_float(market.get("homeWinOdds")),
-            away_moneyline=self._safe_float(market.get("awayWinOdds")),
-            spread=self._safe_float(market.get("pointSpread")),
-            home_spread_odds=self._safe_float(market.get("homeSpreadOdds")),
-            away_spread_odds=self._safe_float(market.get("awaySpreadOdds")),
-            total=self._safe_float(market.get("total")),
-            over_odds=self._safe_float(market.get("overOdds")),
-            under_odds=self._safe_float(market.get("underOdds")),
-        )
+    def iter_past_events(self, league_id: str) -> Iterator[Event]:
+        """Yield the league's most recently completed events."""
 
-    @staticmethod
-    def _safe_int(value: Optional[str]) -> Optional[int]:
-        try:
-            return int(value) if value not in (None, "") else None
-        except (TypeError, ValueError):
-            return None
+        payload = self._client.get_json(**self._stream_request("eventspastleague.php", {"id": league_id}))
+        yield from EVENT_DECODER.iter_decode(payload.get("events"))
 
-    @staticmethod
-    def _safe_float(value: Optional[str]) -> Optional[float]:
-        try:
-            return float(value) if value not in (None, "") else None
-        except (TypeError, ValueError):
-            return None
 
-    def _build_event(self, item: dict) -> Event:
-        event_date = self._parse_event_date(item.get("dateEvent"))
-        return Event(
-            event_id=item.get("idEvent", ""),
-            league_id=item.get("idLeague"),
-            home_team_id=item.get("idHomeTeam", ""),
-            away_team_id=item.get("idAwayTeam", ""),
-            event_date=event_date,
-            venue=item.get("strVenue"),
-            status=item.get("strStatus"),
-            home_score=self._safe_int(item.get("intHomeScore")),
-            away_score=self._safe_int(item.get("intAwayScore")),
-            home_team_name=item.get("strHomeTeam"),
-            away_team_name=item.get("strAwayTeam"),
-        )
+class AsyncTheSportsDBProvider(_TheSportsDBPayloads, AsyncSportsDataProvider):
+    """Asyncio variant of :class:`TheSportsDBProvider` using :class:`AsyncAPIClient`.
 
-    @staticmethod
-    def _parse_event_date(value: Optional[str]) -> date:
-        if not value:
-            return date.today()
-        try:
-            return datetime.strptime(value, "%Y-%m-%d").date()
-        except (TypeError, ValueError):
-            return date.today()
+    Multi-identifier lookups are issued concurrently on the event loop, at most
+    ``settings.provider_concurrency`` at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Optional[AsyncAPIClient] = None,
+        cache_policies: Optional[Mapping[str, CachePolicy]] = None,
+    ) -> None:
+        self._settings = get_settings()
+        if cache_policies:
+            self._cache_policies = {**CACHE_POLICIES, **cache_policies}
+        self._client = client or AsyncAPIClient()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def search_teams(self, name: str) -> List[TeamStats]:
+        payload = await self._client.get_json(**self._request("searchteams.php", {"t": name}))
+        return self._parse_teams(payload)
+
+    async def get_events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
+        params = self._events_params(league_id, from_date)
+        payload = await self._client.get_json(**self._request("eventsnextleague.php", params))
+        return self._parse_events(payload)
+
+    async def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
+        batch = await self.lookup_events_batch(event_ids)
+        batch.raise_if_empty()
+        return [event for events in batch.values() for event in events]
+
+    async def lookup_events_batch(self, event_ids: Iterable[str]) -> BatchResult[List[Event]]:
+        async def fetch(event_id: str) -> List[Event]:
+            payload = await self._client.get_json(**self._request("lookupevent.php", {"id": event_id}))
+            return self._parse_events(payload)
+
+        return await async_fan_out(fetch, event_ids, concurrency=self._concurrency, what="event")
+
+    async def get_team(self, team_id: str) -> Optional[TeamStats]:
+        payload = await self._client.get_json(**self._request("lookupteam.php", {"id": team_id}))
+        teams = self._parse_teams(payload)
+        return teams[0] if teams else None
+
+    async def get_player_stats(self, player_ids: Iterable[str]) -> List[PlayerStats]:
+        batch = await self.get_player_stats_batch(player_ids)
+        batch.raise_if_empty()
+        return [player for players in batch.values() for player in players]
+
+    async def get_player_stats_batch(
+        self, player_ids: Iterable[str]
+    ) -> BatchResult[List[PlayerStats]]:
+        async def fetch(player_id: str) -> List[PlayerStats]:
+            payload = await self._client.get_json(**self._request("lookupplayer.php", {"id": player_id}))
+            return self._parse_players(payload)
+
+        return await async_fan_out(fetch, player_ids, concurrency=self._concurrency, what="player")
+
+    async def get_odds(self, event_id: str) -> Optional[Odds]:
+        payload = await self._client.get_json(**self._request("lookupeventodds.php", {"id": event_id}))
+        return self._parse_odds(event_id, payload)
+
+    async def list_seasons(self, league_id: str) -> List[str]:
+        payload = await self._client.get_json(**self._request("search_all_seasons.php", {"id": league_id}))
+        return self._parse_seasons(payload)
+
+    async def iter_season_events(
+        self, league_id: str, seasons: Optional[Iterable[str]] = None
+    ) -> AsyncIterator[Event]:
+        for season in await self.list_seasons(league_id) if seasons is None else seasons:
+            payload = await self._client.get_json(
+                **self._stream_request("eventsseason.php", {"id": league_id, "s": season})
+            )
+            for event in EVENT_DECODER.iter_decode(payload.get("events")):
+                yield event
+
+    async def iter_past_events(self, league_id: str) -> AsyncIterator[Event]:
+        payload = await self._client.get_json(**self._stream_request("eventspastleague.php", {"id": league_id}))
+        for event in EVENT_DECODER.iter_decode(payload.get("events")):
+            yield event
 
 
-__all__ = ["TheSportsDBProvider"]
+__all__ = ["AsyncTheSportsDBProvider", "TheSportsDBProvider"]
@@ -1,16 +1,34 @@
 """High-level service that orchestrates data collection and predictions."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Iterable, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from ..config import get_settings
 from ..models import Event, FantasyProjection, Odds, PlayerStats, TeamStats
-from ..providers.base import SportsDataProvider
+from ..providers.base import AsyncSportsDataProvider, SportsDataProvider
+from ..providers.batch import BatchResult, async_fan_out, fan_out
+from .entity_store import EntityStore, get_entity_store
 from .fantasy import FantasyProjector
-from .prediction import PredictionEngine, SpreadPrediction, TotalPrediction, ensemble_spread, ensemble_total
+from .league_sync import REMOVED, EventChange
+from .prediction import (
+    PredictionCache,
+    PredictionEngine,
+    SpreadPrediction,
+    TotalPrediction,
+    ensemble_spread,
+    ensemble_total,
+    get_prediction_cache,
+)
 from .stat_collector import StatCollector
 
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass
 class EventInsights:
@@ -22,42 +40,127 @@ class EventInsights:
     total_prediction: TotalPrediction
 
 
-class AnalyticsService:
-    """Provide insights by combining collectors, predictors, and fantasy tools."""
+@dataclass
+class InsightsReport:
+    """Insights plus per-stage wall-clock timings (seconds) of the pipeline."""
+
+    insights: List[EventInsights]
+    timings: Dict[str, float] = field(default_factory=dict)
+    unique_teams: int = 0
+
+
+def _unique_team_ids(events: Iterable[Event]) -> List[str]:
+    return list(
+        dict.fromkeys(team_id for event in events for team_id in (event.home_team_id, event.away_team_id))
+    )
+
+
+def _outcome(future: "Future[Any]", event: Event) -> Any:
+    """Result of a per-event lookup, or ``None`` (logged) when it failed."""
+
+    error = future.exception()
+    if error is not None:
+        LOGGER.warning("Lookup for event %s failed: %s", event.event_id, error)
+        return None
+    return future.result()
+
+
+def _latest_events(changes: Iterable[EventChange]) -> List[Event]:
+    latest: Dict[str, Event] = {}
+    for change in changes:
+        if change.kind == REMOVED:
+            latest.pop(change.event.event_id, None)
+        else:
+            latest[change.event.event_id] = change.event
+    return list(latest.values())
+
+
+@dataclass
+class LeagueInsightsBatch:
+    """Per-league insights and error messages from a multi-league run."""
+
+    results: Dict[str, List[EventInsights]] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+def _merge_leagues(
+    fetched: BatchResult[List[Event]],
+) -> Tuple[LeagueInsightsBatch, Dict[str, str], List[Event]]:
+    """Start a batch from per-league fixtures and flatten them into one event list."""
+
+    batch = LeagueInsightsBatch(errors={league_id: str(error) for league_id, error in fetched.errors.items()})
+    league_of: Dict[str, str] = {}
+    events: List[Event] = []
+    for league_id, league_events in fetched.results:
+        batch.results[league_id] = []
+        for event in league_events:
+            if event.event_id not in league_of:
+                league_of[event.event_id] = league_id
+                events.append(event)
+    return batch, league_of, events
+
+
+def _split_by_league(
+    insights: List[EventInsights], league_of: Dict[str, str], batch: LeagueInsightsBatch
+) -> LeagueInsightsBatch:
+    for insight in insights:
+        batch.results[league_of[insight.event.event_id]].append(insight)
+    return batch
+
+
+class _InsightsModels:
+    """Prediction and projection steps shared by the sync and async services.
+
+    Predictions are memoised in the process-wide :func:`get_prediction_cache`
+    unless a cache is passed in, so short-lived service instances (one per
+    request) still reuse results for unchanged inputs.
+    """
 
-    def __init__(self, provider: SportsDataProvider) -> None:
-        self.collector = StatCollector(provider)
-        self.predictor = PredictionEngine()
+    def __init__(self, prediction_cache: Optional[PredictionCache] = None) -> None:
+        cache = prediction_cache if prediction_cache is not None else get_prediction_cache()
+        self.predictor = PredictionEngine(cache=cache)
         self.fantasy_projector = FantasyProjector()
-        self.provider = provider
 
-    def insights_for_league(self, league_id: str, *, from_date: Optional[date] = None) -> List[EventInsights]:
-        events = self.collector.events(league_id, from_date=from_date)
-        insights: List[EventInsights] = []
-        for event in events:
-            home_team = self.collector.team(event.home_team_id) or self._fallback_team(event.home_team_id, "Home")
-            away_team = self.collector.team(event.away_team_id) or self._fallback_team(event.away_team_id, "Away")
-            odds = self.provider.get_odds(event.event_id)
-            spread = self.predictor.predict_spread(event, home_team, away_team, odds)
-            total = self.predictor.predict_total(event, home_team, away_team, odds)
-            insights.append(
-                EventInsights(
-                    event=event,
-                    home_team=home_team,
-                    away_team=away_team,
-                    odds=odds,
-                    spread_prediction=spread,
-                    total_prediction=total,
-                )
+    def _predict(
+        self,
+        events: List[Event],
+        teams: Dict[str, TeamStats],
+        odds_by_event: Dict[str, Odds],
+        timings: Dict[str, float],
+        unique_teams: int,
+    ) -> InsightsReport:
+        started = time.perf_counter()
+        insights = [
+            self._insight(
+                event,
+                teams.get(event.home_team_id),
+                teams.get(event.away_team_id),
+                odds_by_event.get(event.event_id),
             )
-        return insights
-
-    def fantasy_projections(self, player_ids: Iterable[str]) -> List[FantasyProjection]:
-        stats: List[PlayerStats] = self.collector.player_stats(player_ids)
-        return self.fantasy_projector.project(stats)
+            for event in events
+        ]
+        timings["predict"] = time.perf_counter() - started
+        LOGGER.debug("Insights for %d events (%d teams): %s", len(events), unique_teams, timings)
+        return InsightsReport(insights=insights, timings=timings, unique_teams=unique_teams)
 
-    def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
-        return self.collector.lookup_events(event_ids)
+    def _insight(
+        self,
+        event: Event,
+        home_team: Optional[TeamStats],
+        away_team: Optional[TeamStats],
+        odds: Optional[Odds],
+    ) -> EventInsights:
+        home_team = home_team or self._fallback_team(event.home_team_id, "Home")
+        away_team = away_team or self._fallback_team(event.away_team_id, "Away")
+        return EventInsights(
+            event=event,
+            home_team=home_team,
+            away_team=away_team,
+            odds=odds,
+            spread_prediction=self.predictor.predict_spread(event, home_team, away_team, odds),
+            total_prediction=self.predictor.predict_total(event, home_team, away_team, odds),
+        )
 
     @staticmethod
     def combine_spread_predictions(predictions: Iterable[SpreadPrediction]) -> SpreadPrediction:
@@ -72,4 +175,270 @@ class AnalyticsService:
         return TeamStats(team_id=team_id, name=f"Unknown {label}")
 
 
-__all__ = ["AnalyticsService", "EventInsights"]
+class AnalyticsService(_InsightsModels):
+    """Provide insights by combining collectors, predictors, and fantasy tools."""
+
+    def __init__(
+        self,
+        provider: SportsDataProvider,
+        *,
+        store: Optional[EntityStore] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+    ) -> None:
+        super().__init__(prediction_cache)
+        self.collector = StatCollector(provider, store if store is not None else get_entity_store())
+        self.provider = provider
+
+    def insights_for_league(self, league_id: str, *, from_date: Optional[date] = None) -> List[EventInsights]:
+        return self.insights_report(league_id, from_date=from_date).insights
+
+    def insights_for_events(self, events: Iterable[Event]) -> List[EventInsights]:
+        """Build insights for an explicit set of events, e.g. a sync delta."""
+
+        return self._pipeline(list(events), {}).insights
+
+    def insights_report(self, league_id: str, *, from_date: Optional[date] = None) -> InsightsReport:
+        """Run the insights pipeline for a league and report how long each stage took.
+
+        Stages: ``events`` fetches the fixtures; ``gather`` loads every unique
+        team and all odds in bulk, teams and odds concurrently; ``predict``
+        runs the models. Large leagues therefore cost roughly one round trip
+        per stage rather than three per event.
+        """
+
+        started = time.perf_counter()
+        events = self.collector.events(league_id, from_date=from_date)
+        return self._pipeline(events, {"events": time.perf_counter() - started})
+
+    def insights_for_leagues(
+        self, league_ids: Iterable[str], *, from_date: Optional[date] = None
+    ) -> LeagueInsightsBatch:
+        """Build insights for many leagues in one pass over shared caches.
+
+        Fixtures for every league are fetched concurrently; then the events of
+        all leagues go through a single gather stage, so a team appearing in
+        several leagues' fixtures is fetched once and the whole batch shares
+        one ``provider_concurrency`` budget. A league whose fixtures cannot be
+        fetched is reported in :attr:`LeagueInsightsBatch.errors`.
+        """
+
+        started = time.perf_counter()
+        fetched = fan_out(
+            lambda league_id: self.collector.events(league_id, from_date=from_date),
+            list(dict.fromkeys(league_ids)),
+            concurrency=get_settings().provider_concurrency,
+            what="league",
+        )
+        batch, league_of, events = _merge_leagues(fetched)
+        report = self._pipeline(events, {"events": time.perf_counter() - started})
+        batch.timings = report.timings
+        return _split_by_league(report.insights, league_of, batch)
+
+    def iter_insights(self, league_id: str, *, from_date: Optional[date] = None) -> Iterator[EventInsights]:
+        """Yield league insights one by one, each as soon as its teams and odds arrive."""
+
+        return self.iter_insights_for_events(self.collector.events(league_id, from_date=from_date))
+
+    def iter_insights_for_events(self, events: Iterable[Event]) -> Iterator[EventInsights]:
+        """Generator variant of :py:meth:`insights_for_events` yielding in readiness order.
+
+        Every unique team and each event's odds are fetched concurrently (at
+        most ``provider_concurrency`` at a time); an event is yielded the moment
+        its three inputs are available, so the first result does not wait for
+        the slowest lookup in the league.
+        """
+
+        waiting = list(events)
+        with ThreadPoolExecutor(max_workers=get_settings().provider_concurrency) as executor:
+            teams = {
+                team_id: executor.submit(self.collector.team, team_id) for team_id in _unique_team_ids(waiting)
+            }
+            odds = {event.event_id: executor.submit(self.provider.get_odds, event.event_id) for event in waiting}
+            pending: Set["Future[Any]"] = {*teams.values(), *odds.values()}
+            while waiting:
+                blocked: List[Event] = []
+                for event in waiting:
+                    inputs = (teams[event.home_team_id], teams[event.away_team_id], odds[event.event_id])
+                    if all(future.done() for future in inputs):
+                        home, away, event_odds = (_outcome(future, event) for future in inputs)
+                        yield self._insight(event, home, away, event_odds)
+                    else:
+                        blocked.append(event)
+                waiting = blocked
+                pending = {future for future in pending if not future.done()}
+                if waiting and pending:
+                    wait(pending, return_when=FIRST_COMPLETED)
+
+    def _pipeline(self, events: List[Event], timings: Dict[str, float]) -> InsightsReport:
+        started = time.perf_counter()
+        team_ids = _unique_team_ids(events)
+        event_ids = [event.event_id for event in events]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            teams_future = executor.submit(self.collector.teams_by_id, team_ids)
+            odds_future = executor.submit(self.provider.get_odds_many, event_ids)
+            teams = teams_future.result()
+            odds_by_event = odds_future.result()
+        timings["gather"] = time.perf_counter() - started
+
+        return self._predict(events, teams, odds_by_event, timings, len(team_ids))
+
+    def insights_for_changes(self, changes: Iterable[EventChange]) -> List[EventInsights]:
+        """Recompute insights only for events a :class:`LeagueSync` added or updated."""
+
+        return self.insights_for_events(_latest_events(changes))
+
+    def fantasy_projections(self, player_ids: Iterable[str]) -> List[FantasyProjection]:
+        stats: List[PlayerStats] = self.collector.player_stats(player_ids)
+        return self.fantasy_projector.project(stats)
+
+    def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
+        return self.collector.lookup_events(event_ids)
+
+
+class AsyncAnalyticsService(_InsightsModels):
+    """Asyncio counterpart of :class:`AnalyticsService` over an :class:`AsyncSportsDataProvider`.
+
+    Every upstream call is awaited on the event loop, so one process can
+    serve many concurrent requests without tying up worker threads. Teams are
+    shared with the synchronous service through the entity store.
+    """
+
+    def __init__(
+        self,
+        provider: AsyncSportsDataProvider,
+        *,
+        store: Optional[EntityStore] = None,
+        prediction_cache: Optional[PredictionCache] = None,
+    ) -> None:
+        super().__init__(prediction_cache)
+        self.provider = provider
+        self.store = store if store is not None else get_entity_store()
+
+    async def insights_for_league(self, league_id: str, *, from_date: Optional[date] = None) -> List[EventInsights]:
+        return (await self.insights_report(league_id, from_date=from_date)).insights
+
+    async def insights_for_events(self, events: Iterable[Event]) -> List[EventInsights]:
+        return (await self._pipeline(list(events), {})).insights
+
+    async def insights_for_changes(self, changes: Iterable[EventChange]) -> List[EventInsights]:
+        return await self.insights_for_events(_latest_events(changes))
+
+    async def insights_report(self, league_id: str, *, from_date: Optional[date] = None) -> InsightsReport:
+        """See :py:meth:`AnalyticsService.insights_report`."""
+
+        started = time.perf_counter()
+        events = await self.league_events(league_id, from_date=from_date)
+        return await self._pipeline(events, {"events": time.perf_counter() - started})
+
+    async def insights_for_leagues(
+        self, league_ids: Iterable[str], *, from_date: Optional[date] = None
+    ) -> LeagueInsightsBatch:
+        """See :py:meth:`AnalyticsService.insights_for_leagues`."""
+
+        started = time.perf_counter()
+        fetched = await async_fan_out(
+            lambda league_id: self.league_events(league_id, from_date=from_date),
+            list(dict.fromkeys(league_ids)),
+            concurrency=get_settings().provider_concurrency,
+            what="league",
+        )
+        batch, league_of, events = _merge_leagues(fetched)
+        report = await self._pipeline(events, {"events": time.perf_counter() - started})
+        batch.timings = report.timings
+        return _split_by_league(report.insights, league_of, batch)
+
+    async def league_events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
+        return self.store.put_many("event", await self.provider.get_events(league_id, from_date=from_date))
+
+    async def iter_insights(
+        self, league_id: str, *, from_date: Optional[date] = None
+    ) -> AsyncIterator[EventInsights]:
+        """Yield league insights one by one, each as soon as its teams and odds arrive."""
+
+        events = await self.league_events(league_id, from_date=from_date)
+        async for insight in self.iter_insights_for_events(events):
+            yield insight
+
+    async def iter_insights_for_events(self, events: Iterable[Event]) -> AsyncIterator[EventInsights]:
+        """Async-generator variant of :py:meth:`insights_for_events` yielding in readiness order.
+
+        Each unique team is requested once and shared by all of its events;
+        pending lookups are cancelled if the consumer stops early.
+        """
+
+        events = list(events)
+        teams = {team_id: asyncio.ensure_future(self._team(team_id)) for team_id in _unique_team_ids(events)}
+
+        async def build(event: Event) -> EventInsights:
+            home, away, odds = await asyncio.gather(
+                teams[event.home_team_id], teams[event.away_team_id], self._odds(event.event_id)
+            )
+            return self._insight(event, home, away, odds)
+
+        tasks = [asyncio.ensure_future(build(event)) for event in events]
+        try:
+            for next_ready in asyncio.as_completed(tasks):
+                yield await next_ready
+        finally:
+            for task in (*tasks, *teams.values()):
+                task.cancel()
+
+    async def _team(self, team_id: str) -> Optional[TeamStats]:
+        if not team_id:
+            return None
+        cached = self.store.get("team", team_id)
+        if cached is not None:
+            return cached
+        try:
+            team = await self.provider.get_team(team_id)
+        except Exception as exc:
+            LOGGER.warning("Failed to fetch team %s: %s", team_id, exc)
+            return None
+        return self.store.put("team", team) if team is not None else None
+
+    async def _odds(self, event_id: str) -> Optional[Odds]:
+        try:
+            return await self.provider.get_odds(event_id)
+        except Exception as exc:
+            LOGGER.warning("Failed to fetch odds %s: %s", event_id, exc)
+            return None
+
+    async def fantasy_projections(self, player_ids: Iterable[str]) -> List[FantasyProjection]:
+        stats = await self.provider.get_player_stats(list(player_ids))
+        return self.fantasy_projector.project(self.store.put_many("player", stats))
+
+    async def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
+        return self.store.put_many("event", await self.provider.lookup_events(list(event_ids)))
+
+    async def _pipeline(self, events: List[Event], timings: Dict[str, float]) -> InsightsReport:
+        started = time.perf_counter()
+        team_ids = _unique_team_ids(events)
+        teams, odds_by_event = await asyncio.gather(
+            self._teams_by_id(team_ids),
+            self.provider.get_odds_many([event.event_id for event in events]),
+        )
+        timings["gather"] = time.perf_counter() - started
+        return self._predict(events, teams, odds_by_event, timings, len(team_ids))
+
+    async def _teams_by_id(self, team_ids: List[str]) -> Dict[str, TeamStats]:
+        teams: Dict[str, TeamStats] = {}
+        missing: List[str] = []
+        for team_id in team_ids:
+            cached = self.store.get("team", team_id) if team_id else None
+            if cached is not None:
+                teams[team_id] = cached
+            elif team_id:
+                missing.append(team_id)
+        if missing:
+            for team_id, team in (await self.provider.get_teams(missing)).items():
+                teams[team_id] = self.store.put("team", team)
+        return teams
+
+
+__all__ = [
+    "AnalyticsService",
+    "AsyncAnalyticsService",
+    "EventInsights",
+    "InsightsReport",
+    "LeagueInsightsBatch",
+]
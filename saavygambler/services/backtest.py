@@ -0,0 +1,541 @@
+"""Replay past seasons through the prediction models and score them against the market."""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, time, timezone
+from itertools import groupby
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..models import Event, Odds
+from ..providers.thesportsdb import TheSportsDBProvider
+from .prediction import DEFAULT_HOME_ADVANTAGE, MatchupColumns, PredictionEngine
+from .ratings import EloParameters, EloRatings
+
+try:  # pragma: no cover - exercised implicitly when numpy is installed
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+DEFAULT_PRICE = -110.0
+CALIBRATION_BINS = 10
+
+
+@dataclass
+class SeasonData:
+    """Past events of one season with the odds history needed to bet them.
+
+    ``odds`` holds timestamped snapshots (``Odds.last_updated``); a game is
+    bet at the latest snapshot taken no later than the start of its event
+    day, and snapshots without a timestamp are never used, since they may be
+    lines published after the fact. ``closing_odds`` holds the last line
+    before kickoff and is only used to measure closing line value once the
+    bet is placed; when it has several snapshots per event the last one wins.
+    """
+
+    events: List[Event]
+    odds: List[Odds] = field(default_factory=list)
+    closing_odds: List[Odds] = field(default_factory=list)
+
+
+@dataclass
+class MarketResult:
+    """Flat one-unit betting record for one market."""
+
+    bets: int = 0
+    wins: int = 0
+    losses: int = 0
+    pushes: int = 0
+    profit: float = 0.0
+    clv_total: float = 0.0
+    clv_bets: int = 0
+
+    @property
+    def record(self) -> str:
+        return f"{self.wins}-{self.losses}-{self.pushes}"
+
+    @property
+    def roi(self) -> float:
+        """Profit per unit staked; pushes are refunded and not counted as staked."""
+
+        staked = self.wins + self.losses
+        return self.profit / staked if staked else 0.0
+
+    @property
+    def average_clv(self) -> Optional[float]:
+        """Mean closing line value of bets with a closing line (points, or probability for moneylines)."""
+
+        return self.clv_total / self.clv_bets if self.clv_bets else None
+
+    def __add__(self, other: "MarketResult") -> "MarketResult":
+        return MarketResult(
+            self.bets + other.bets,
+            self.wins + other.wins,
+            self.losses + other.losses,
+            self.pushes + other.pushes,
+            self.profit + other.profit,
+            self.clv_total + other.clv_total,
+            self.clv_bets + other.clv_bets,
+        )
+
+
+@dataclass
+class Calibration:
+    """Reliability of home win probabilities, kept as additive sums."""
+
+    counts: List[int] = field(default_factory=lambda: [0] * CALIBRATION_BINS)
+    predicted: List[float] = field(default_factory=lambda: [0.0] * CALIBRATION_BINS)
+    observed: List[float] = field(default_factory=lambda: [0.0] * CALIBRATION_BINS)
+    brier_total: float = 0.0
+    log_loss_total: float = 0.0
+    samples: int = 0
+
+    @property
+    def brier(self) -> Optional[float]:
+        return self.brier_total / self.samples if self.samples else None
+
+    @property
+    def log_loss(self) -> Optional[float]:
+        return self.log_loss_total / self.samples if self.samples else None
+
+    @property
+    def bins(self) -> List[Tuple[float, float, int]]:
+        """``(mean predicted, observed frequency, games)`` for every non-empty bin."""
+
+        return [
+            (predicted / count, observed / count, count)
+            for count, predicted, observed in zip(self.counts, self.predicted, self.observed)
+            if count
+        ]
+
+    def __add__(self, other: "Calibration") -> "Calibration":
+        return Calibration(
+            [a + b for a, b in zip(self.counts, other.counts)],
+            [a + b for a, b in zip(self.predicted, other.predicted)],
+            [a + b for a, b in zip(self.observed, other.observed)],
+            self.brier_total + other.brier_total,
+            self.log_loss_total + other.log_loss_total,
+            self.samples + other.samples,
+        )
+
+
+@dataclass
+class BacktestReport:
+    """Results of one or more backtested seasons.
+
+    ``unpriced`` counts games with no odds snapshot at bet time; they are
+    never bet but still count towards :attr:`calibration`.
+    """
+
+    label: str
+    games: int = 0
+    unpriced: int = 0
+    spread: MarketResult = field(default_factory=MarketResult)
+    total: MarketResult = field(default_factory=MarketResult)
+    moneyline: MarketResult = field(default_factory=MarketResult)
+    calibration: Calibration = field(default_factory=Calibration)
+
+    @classmethod
+    def combine(cls, reports: Iterable["BacktestReport"], label: str = "all") -> "BacktestReport":
+        combined = cls(label)
+        for report in reports:
+            combined.games += report.games
+            combined.unpriced += report.unpriced
+            combined.spread += report.spread
+            combined.total += report.total
+            combined.moneyline += report.moneyline
+            combined.calibration += report.calibration
+        return combined
+
+
+@dataclass
+class _Replay:
+    """Pre-game columns gathered while replaying a season."""
+
+    home_points_for: List[float] = field(default_factory=list)
+    home_points_against: List[float] = field(default_factory=list)
+    away_points_for: List[float] = field(default_factory=list)
+    away_points_against: List[float] = field(default_factory=list)
+    home_wins: List[int] = field(default_factory=list)
+    home_losses: List[int] = field(default_factory=list)
+    away_wins: List[int] = field(default_factory=list)
+    away_losses: List[int] = field(default_factory=list)
+    history: List[int] = field(default_factory=list)
+    elo_probability: List[float] = field(default_factory=list)
+
+
+@dataclass
+class _TeamRecord:
+    games: int = 0
+    points_for: float = 0.0
+    points_against: float = 0.0
+    wins: int = 0
+    losses: int = 0
+
+    def average(self, points: float) -> float:
+        return points / self.games if self.games else math.nan
+
+
+class Backtester:
+    """Score :class:`PredictionEngine` against historical lines without look-ahead.
+
+    A season is replayed in date order. Before any game of a given date is
+    priced, each team's record, points for and points against are rebuilt
+    from results strictly before that date, so no prediction can see its own
+    or a later outcome; with ``elo`` the moneyline probabilities come from an
+    :class:`EloRatings` replayed the same way. The pre-game statistics are
+    collected as :class:`MatchupColumns` and priced with the engine's batch
+    methods, and every market is settled with array operations.
+
+    Lines are held to the same rule: each game is priced from the latest
+    odds snapshot stamped at or before the start of its event day (see
+    :class:`SeasonData`), and games without one are not bet. Games where
+    either team has fewer than ``min_history`` prior results are not bet
+    either. A bet is placed on the side the model prefers once its edge over
+    the market exceeds the market's threshold, at one unit and at the
+    snapshot's price (``-110`` when the snapshot has none).
+    """
+
+    def __init__(
+        self,
+        *,
+        home_advantage: float = DEFAULT_HOME_ADVANTAGE,
+        elo: Optional[EloParameters] = None,
+        min_history: int = 3,
+        min_spread_edge: float = 0.0,
+        min_total_edge: float = 0.0,
+        min_moneyline_edge: float = 0.0,
+        processes: int = 1,
+    ) -> None:
+        if np is None:
+            raise ModuleNotFoundError("Optional dependency 'numpy' is required for backtesting")
+        if processes < 1:
+            raise ValueError("processes must be at least one")
+        self.engine = PredictionEngine(home_advantage=home_advantage)
+        self.elo = elo
+        self.min_history = min_history
+        self.min_spread_edge = min_spread_edge
+        self.min_total_edge = min_total_edge
+        self.min_moneyline_edge = min_moneyline_edge
+        self.processes = processes
+
+    # ------------------------------------------------------------------
+    # Entry points
+    def run_many(self, seasons: Mapping[str, SeasonData]) -> Dict[str, BacktestReport]:
+        """Backtest every labelled season (for example ``"4328/2023-2024"``), in parallel."""
+
+        labels = list(seasons)
+        if self.processes == 1 or len(labels) <= 1:
+            reports = [self.run_season(seasons[label], label=label) for label in labels]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.processes, len(labels))) as executor:
+                jobs = ((label, seasons[label]) for label in labels)
+                reports = list(executor.map(self._run_labelled, jobs))
+        return dict(zip(labels, reports))
+
+    def _run_labelled(self, job: Tuple[str, SeasonData]) -> BacktestReport:
+        label, season = job
+        return self.run_season(season, label=label)
+
+    def run_season(self, season: SeasonData, *, label: str = "") -> BacktestReport:
+        games = sorted(
+            (
+                event
+                for event in season.events
+                if event.is_final and event.home_score is not None and event.away_score is not None
+            ),
+            key=lambda event: (event.event_date, event.event_id),
+        )
+        report = BacktestReport(label, games=len(games))
+        if not games:
+            return report
+        replay = self._replay(games)
+        columns, markets = self._columns(games, replay, season)
+        report.unpriced = int(np.count_nonzero(~markets["priced"]))
+        margin = np.array([event.home_score - event.away_score for event in games], dtype=np.float64)
+        total = np.array([event.home_score + event.away_score for event in games], dtype=np.float64)
+        eligible = np.array(replay.history) >= self.min_history
+
+        spread = self.engine.predict_spreads(columns).spread
+        projected_total = self.engine.predict_totals(columns).total
+        if self.elo is not None:
+            probability = np.array(replay.elo_probability)
+        else:
+            probability = self.engine.predict_moneylines(columns).home_win_probability
+
+        report.spread = self._settle_spreads(spread, margin, markets, eligible)
+        report.total = self._settle_totals(projected_total, total, markets, eligible)
+        report.moneyline = self._settle_moneylines(probability, margin, markets, eligible)
+        report.calibration = _calibration(probability[eligible], (margin > 0)[eligible])
+        return report
+
+    # ------------------------------------------------------------------
+    # Replay
+    def _replay(self, games: List[Event]) -> _Replay:
+        replay = _Replay()
+        records: Dict[str, _TeamRecord] = {}
+        ratings = EloRatings(self.elo) if self.elo is not None else None
+        for _, day in groupby(games, key=lambda event: event.event_date):
+            day = list(day)
+            for event in day:
+                home = records.setdefault(event.home_team_id, _TeamRecord())
+                away = records.setdefault(event.away_team_id, _TeamRecord())
+                replay.home_points_for.append(home.average(home.points_for))
+                replay.home_points_against.append(home.average(home.points_against))
+                replay.away_points_for.append(away.average(away.points_for))
+                replay.away_points_against.append(away.average(away.points_against))
+                replay.home_wins.append(home.wins)
+                replay.home_losses.append(home.losses)
+                replay.away_wins.append(away.wins)
+                replay.away_losses.append(away.losses)
+                replay.history.append(min(home.games, away.games))
+                if ratings is not None:
+                    replay.elo_probability.append(
+                        ratings.home_win_probability(event.home_team_id, event.away_team_id)
+                    )
+            # Results only become visible once the whole day has been priced.
+            for event in day:
+                _record(records[event.home_team_id], event.home_score, event.away_score)
+                _record(records[event.away_team_id], event.away_score, event.home_score)
+            if ratings is not None:
+                ratings.update_many(day)
+        return replay
+
+    def _columns(
+        self, games: List[Event], replay: _Replay, season: SeasonData
+    ) -> Tuple[MatchupColumns, Dict[str, np.ndarray]]:
+        opening = _bet_time_odds(games, season.odds)
+        closing = {odds.event_id: odds for odds in season.closing_odds}
+        markets = {
+            "priced": np.array([event.event_id in opening for event in games], dtype=bool),
+            "spread": _market(games, opening, "spread"),
+            "total": _market(games, opening, "total"),
+            "home_moneyline": _market(games, opening, "home_moneyline"),
+            "away_moneyline": _market(games, opening, "away_moneyline"),
+            "home_spread_odds": _market(games, opening, "home_spread_odds", DEFAULT_PRICE),
+            "away_spread_odds": _market(games, opening, "away_spread_odds", DEFAULT_PRICE),
+            "over_odds": _market(games, opening, "over_odds", DEFAULT_PRICE),
+            "under_odds": _market(games, opening, "under_odds", DEFAULT_PRICE),
+            "closing_spread": _market(games, closing, "spread"),
+            "closing_total": _market(games, closing, "total"),
+            "closing_home_moneyline": _market(games, closing, "home_moneyline"),
+            "closing_away_moneyline": _market(games, closing, "away_moneyline"),
+        }
+        columns = MatchupColumns(
+            replay.home_points_for,
+            replay.home_points_against,
+            replay.away_points_for,
+            replay.away_points_against,
+            replay.home_wins,
+            replay.home_losses,
+            replay.away_wins,
+            replay.away_losses,
+            markets["spread"],
+            markets["total"],
+            markets["home_moneyline"],
+            markets["away_moneyline"],
+        )
+        return columns, markets
+
+    # ------------------------------------------------------------------
+    # Settlement
+    def _settle_spreads(
+        self, spread: np.ndarray, margin: np.ndarray, markets: Dict[str, np.ndarray], eligible: np.ndarray
+    ) -> MarketResult:
+        line = markets["spread"]
+        priced = eligible & ~np.isnan(line)
+        # A home line of -3.5 implies a 3.5 point home margin.
+        edge = np.where(priced, spread + line, 0.0)
+        home = edge > self.min_spread_edge
+        away = edge < -self.min_spread_edge
+        outcome = np.sign(margin + line)
+        closing = markets["closing_spread"]
+        return _settle(
+            home,
+            away,
+            outcome,
+            markets["home_spread_odds"],
+            markets["away_spread_odds"],
+            home_clv=line - closing,
+            away_clv=closing - line,
+        )
+
+    def _settle_totals(
+        self, projected: np.ndarray, total: np.ndarray, markets: Dict[str, np.ndarray], eligible: np.ndarray
+    ) -> MarketResult:
+        line = markets["total"]
+        priced = eligible & ~np.isnan(line)
+        edge = np.where(priced, projected - line, 0.0)
+        over = edge > self.min_total_edge
+        under = edge < -self.min_total_edge
+        outcome = np.sign(total - line)
+        closing = markets["closing_total"]
+        return _settle(
+            over,
+            under,
+            outcome,
+            markets["over_odds"],
+            markets["under_odds"],
+            home_clv=closing - line,
+            away_clv=line - closing,
+        )
+
+    def _settle_moneylines(
+        self,
+        probability: np.ndarray,
+        margin: np.ndarray,
+        markets: Dict[str, np.ndarray],
+        eligible: np.ndarray,
+    ) -> MarketResult:
+        home_price, away_price = markets["home_moneyline"], markets["away_moneyline"]
+        priced = eligible & ~np.isnan(home_price) & ~np.isnan(away_price)
+        priced &= (home_price != 0) & (away_price != 0)
+        home_edge = np.where(priced, probability - _implied(home_price), -np.inf)
+        away_edge = np.where(priced, (1 - probability) - _implied(away_price), -np.inf)
+        home = (home_edge > self.min_moneyline_edge) & (home_edge >= away_edge)
+        away = (away_edge > self.min_moneyline_edge) & ~home
+        # Two-way moneylines have no push: a draw loses whichever side was bet.
+        outcome = np.where(away, np.where(margin < 0, -1.0, 1.0), np.where(margin > 0, 1.0, -1.0))
+        return _settle(
+            home,
+            away,
+            outcome,
+            home_price,
+            away_price,
+            home_clv=_implied(markets["closing_home_moneyline"]) - _implied(home_price),
+            away_clv=_implied(markets["closing_away_moneyline"]) - _implied(away_price),
+        )
+
+
+def _record(record: _TeamRecord, scored: int, conceded: int) -> None:
+    record.games += 1
+    record.points_for += scored
+    record.points_against += conceded
+    if scored > conceded:
+        record.wins += 1
+    elif scored < conceded:
+        record.losses += 1
+
+
+def _bet_time(event: Event) -> datetime:
+    """When ``event`` is bet: the start of its event day, compared against snapshot times in UTC."""
+
+    return datetime.combine(event.event_date, time.min)
+
+
+def _utc(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _bet_time_odds(games: List[Event], snapshots: Iterable[Odds]) -> Dict[str, Odds]:
+    """Latest timestamped snapshot per game taken no later than its bet time."""
+
+    cutoffs = {event.event_id: _bet_time(event) for event in games}
+    chosen: Dict[str, Tuple[datetime, Odds]] = {}
+    for odds in snapshots:
+        cutoff = cutoffs.get(odds.event_id)
+        if cutoff is None or odds.last_updated is None:
+            continue
+        taken = _utc(odds.last_updated)
+        current = chosen.get(odds.event_id)
+        if taken <= cutoff and (current is None or taken >= current[0]):
+            chosen[odds.event_id] = (taken, odds)
+    return {event_id: odds for event_id, (_, odds) in chosen.items()}
+
+
+def _market(games: List[Event], odds: Dict[str, Odds], name: str, default: float = math.nan) -> np.ndarray:
+    values = []
+    for event in games:
+        snapshot = odds.get(event.event_id)
+        value = getattr(snapshot, name) if snapshot is not None else None
+        values.append(default if value is None else value)
+    return np.array(values, dtype=np.float64)
+
+
+def _implied(price: np.ndarray) -> np.ndarray:
+    """Implied probability of American ``price`` (``NaN`` stays ``NaN``)."""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(price < 0, -price / (-price + 100), 100 / (price + 100))
+
+
+def _payout(price: np.ndarray) -> np.ndarray:
+    """Profit of a winning one-unit bet at American ``price``."""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(price < 0, 100 / -price, price / 100)
+
+
+def _settle(
+    home: np.ndarray,
+    away: np.ndarray,
+    outcome: np.ndarray,
+    home_price: np.ndarray,
+    away_price: np.ndarray,
+    *,
+    home_clv: np.ndarray,
+    away_clv: np.ndarray,
+) -> MarketResult:
+    """Settle bets on either side; ``outcome`` is +1/0/-1 from the home (or over) side."""
+
+    won = (home & (outcome > 0)) | (away & (outcome < 0))
+    pushed = (home | away) & (outcome == 0)
+    lost = (home | away) & ~won & ~pushed
+    payout = np.where(home, _payout(home_price), _payout(away_price))
+    clv = np.where(home, home_clv, away_clv)
+    with_clv = (home | away) & ~np.isnan(clv)
+    return MarketResult(
+        bets=int(np.count_nonzero(home | away)),
+        wins=int(np.count_nonzero(won)),
+        losses=int(np.count_nonzero(lost)),
+        pushes=int(np.count_nonzero(pushed)),
+        profit=float(payout[won].sum() - np.count_nonzero(lost)),
+        clv_total=float(clv[with_clv].sum()),
+        clv_bets=int(np.count_nonzero(with_clv)),
+    )
+
+
+def _calibration(probability: np.ndarray, home_won: np.ndarray) -> Calibration:
+    observed = home_won.astype(np.float64)
+    bins = np.minimum((probability * CALIBRATION_BINS).astype(np.int64), CALIBRATION_BINS - 1)
+    clipped = np.clip(probability, 1e-12, 1 - 1e-12)
+    log_loss = -(observed * np.log(clipped) + (1 - observed) * np.log(1 - clipped))
+    return Calibration(
+        counts=np.bincount(bins, minlength=CALIBRATION_BINS).tolist(),
+        predicted=np.bincount(bins, weights=probability, minlength=CALIBRATION_BINS).tolist(),
+        observed=np.bincount(bins, weights=observed, minlength=CALIBRATION_BINS).tolist(),
+        brier_total=float(((probability - observed) ** 2).sum()),
+        log_loss_total=float(log_loss.sum()),
+        samples=len(probability),
+    )
+
+
+def load_season(
+    provider: TheSportsDBProvider,
+    league_id: str,
+    season: str,
+    odds: Iterable[Odds] = (),
+    closing_odds: Iterable[Odds] = (),
+) -> SeasonData:
+    """Fetch one season's events and pair them with the given odds history.
+
+    The provider only serves the current line for an event, which for a past
+    game was published after any bet would have been placed, so no odds are
+    fetched here: ``odds`` must come from a timestamped snapshot archive.
+    """
+
+    events = list(provider.iter_season_events(league_id, [season]))
+    return SeasonData(events, list(odds), list(closing_odds))
+
+
+__all__ = [
+    "Backtester",
+    "BacktestReport",
+    "Calibration",
+    "MarketResult",
+    "SeasonData",
+    "load_season",
+]
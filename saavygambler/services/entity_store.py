@@ -0,0 +1,209 @@
+"""Process-wide identity map for teams, players and events."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import get_settings
+
+DEFAULT_MAX_ENTRIES = 50_000
+
+# Attribute holding the identifier for each entity kind.
+ENTITY_KEYS: Dict[str, str] = {"team": "team_id", "player": "player_id", "event": "event_id"}
+
+_UNSET: Any = object()
+
+
+@dataclass
+class _Record:
+    entity: Any
+    version: int
+    refreshed_at: float
+
+
+@dataclass
+class EntityStoreStats:
+    hits: int
+    misses: int
+    updates: int
+    entities: int
+    evictions: int = 0
+
+
+class EntityStore:
+    """Hold one canonical model instance per entity identifier.
+
+    :py:meth:`put` returns the canonical instance for an entity: the first
+    time an identifier is seen the given object becomes canonical; later
+    payloads are copied onto it in place, so every holder of a reference sees
+    the fresh values. Each change is stamped with a store-wide, monotonically
+    increasing version, which lets consumers ask what changed since a point
+    in time via :py:meth:`changed_since`.
+
+    Entries older than ``max_age`` seconds are treated as absent by
+    :py:meth:`get` so callers refetch them, and :py:meth:`purge_expired`
+    drops them; ``None`` keeps entries until evicted. At most ``max_entries``
+    entities are held: beyond that the least recently used one is evicted,
+    and a later ``put`` for it starts a new canonical instance.
+
+    Merges happen under the store lock and replace the changed attributes in
+    a single ``__dict__`` update, so a reader never observes a half-applied
+    payload in any one field. Readers that need several fields from the same
+    version should take a :py:meth:`snapshot` instead of reading the shared
+    instance field by field.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_age: Optional[float] = None,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least one")
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._clock = clock
+        self._records: "OrderedDict[Tuple[str, str], _Record]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._updates = 0
+        self._evictions = 0
+
+    @property
+    def version(self) -> int:
+        """The version stamp of the most recent change."""
+
+        return self._version
+
+    @property
+    def stats(self) -> EntityStoreStats:
+        return EntityStoreStats(self._hits, self._misses, self._updates, len(self._records), self._evictions)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, kind: str, key: str, *, max_age: Optional[float] = _UNSET) -> Optional[Any]:
+        """Return the canonical ``kind`` entity for ``key`` when fresh enough."""
+
+        limit = self.max_age if max_age is _UNSET else max_age
+        with self._lock:
+            record = self._records.get((kind, key))
+            if record is None or (limit is not None and self._clock() - record.refreshed_at > limit):
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._records.move_to_end((kind, key))
+            return record.entity
+
+    def snapshot(self, kind: str, key: str) -> Optional[Any]:
+        """Return a private copy of the canonical entity, consistent across all fields."""
+
+        with self._lock:
+            record = self._records.get((kind, key))
+            return replace(record.entity) if record is not None else None
+
+    def version_of(self, kind: str, key: str) -> Optional[int]:
+        record = self._records.get((kind, key))
+        return record.version if record else None
+
+    def put(self, kind: str, entity: Any) -> Any:
+        """Store ``entity`` and return the canonical instance for its identifier."""
+
+        key = getattr(entity, ENTITY_KEYS[kind])
+        now = self._clock()
+        with self._lock:
+            record = self._records.get((kind, key))
+            if record is None:
+                self._version += 1
+                self._records[(kind, key)] = _Record(entity, self._version, now)
+                self._evict()
+                return entity
+            self._records.move_to_end((kind, key))
+            record.refreshed_at = now
+            canonical = record.entity
+            if canonical is not entity and self._merge(canonical, entity):
+                self._version += 1
+                self._updates += 1
+                record.version = self._version
+            return canonical
+
+    def put_many(self, kind: str, entities: Iterable[Any]) -> List[Any]:
+        return [self.put(kind, entity) for entity in entities]
+
+    def ingest(self, kind: str, entities: Iterable[Any]) -> int:
+        """Store every entity from a (possibly streaming) iterable; return the count."""
+
+        count = 0
+        for entity in entities:
+            self.put(kind, entity)
+            count += 1
+        return count
+
+    def changed_since(self, version: int) -> List[Tuple[str, str, Any]]:
+        """Return ``(kind, key, entity)`` for entities changed after ``version``."""
+
+        with self._lock:
+            changed = [
+                (kind, key, record.entity)
+                for (kind, key), record in self._records.items()
+                if record.version > version
+            ]
+        return changed
+
+    def purge_expired(self) -> int:
+        """Drop entries older than ``max_age`` and return how many were removed."""
+
+        if self.max_age is None:
+            return 0
+        cutoff = self._clock() - self.max_age
+        with self._lock:
+            expired = [key for key, record in self._records.items() if record.refreshed_at < cutoff]
+            for key in expired:
+                del self._records[key]
+            self._evictions += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def _evict(self) -> None:
+        # Called with the lock held.
+        if self.max_entries is None:
+            return
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
+            self._evictions += 1
+
+    @staticmethod
+    def _merge(target: Any, source: Any) -> bool:
+        changes = {
+            spec.name: getattr(source, spec.name)
+            for spec in fields(target)
+            if getattr(target, spec.name) != getattr(source, spec.name)
+        }
+        if changes:
+            target.__dict__.update(changes)
+        return bool(changes)
+
+
+@lru_cache()
+def get_entity_store() -> EntityStore:
+    """Return the process-wide store, expiring entries per the settings."""
+
+    settings = get_settings()
+    return EntityStore(
+        max_age=settings.entity_max_age_seconds or None,
+        max_entries=settings.entity_max_entries or None,
+    )
+
+
+__all__ = ["DEFAULT_MAX_ENTRIES", "ENTITY_KEYS", "EntityStore", "EntityStoreStats", "get_entity_store"]
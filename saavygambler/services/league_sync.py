@@ -0,0 +1,179 @@
+"""Incremental league synchronisation producing a change feed of events."""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from ..models import Event
+from ..providers.base import SportsDataProvider
+from .entity_store import EntityStore
+
+LOGGER = logging.getLogger(__name__)
+
+EVENT_FIELDS: Tuple[str, ...] = tuple(spec.name for spec in fields(Event))
+
+ADDED = "added"
+UPDATED = "updated"
+REMOVED = "removed"
+
+
+@dataclass
+class EventChange:
+    """One entry of the change feed."""
+
+    sequence: int
+    kind: str
+    league_id: str
+    event: Event
+    changed_fields: Tuple[str, ...] = ()
+    previous: Optional[Event] = None
+
+
+@dataclass
+class _Snapshot:
+    hashes: Dict[str, int] = field(default_factory=dict)
+    events: Dict[str, Event] = field(default_factory=dict)
+
+
+def _fingerprint(event: Event) -> Tuple[object, ...]:
+    return tuple(getattr(event, name) for name in EVENT_FIELDS)
+
+
+class LeagueSync:
+    """Poll tracked leagues and report what changed since the previous poll.
+
+    Every poll fetches the league's event list, hashes each event's fields
+    and compares it with the stored snapshot by ``event_id``. Events whose
+    hash is new or different are reported as ``added``/``updated`` (with the
+    fields that changed, such as ``home_score``, ``status`` or ``venue``) and
+    events that dropped out of the list as ``removed``. Unchanged events cost
+    one hash comparison and are not reported.
+
+    Changes are delivered to subscribers and kept in a bounded feed that can
+    be replayed with :py:meth:`changes_since`.
+    """
+
+    def __init__(
+        self,
+        provider: SportsDataProvider,
+        *,
+        store: Optional[EntityStore] = None,
+        history: int = 10_000,
+    ) -> None:
+        self.provider = provider
+        self.store = store
+        self._snapshots: Dict[str, _Snapshot] = {}
+        self._feed: Deque[EventChange] = deque(maxlen=history)
+        self._subscribers: List[Callable[[List[EventChange]], None]] = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    @property
+    def leagues(self) -> List[str]:
+        return list(self._snapshots)
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the latest change in the feed."""
+
+        return self._sequence
+
+    def track(self, league_id: str) -> None:
+        self._snapshots.setdefault(league_id, _Snapshot())
+
+    def untrack(self, league_id: str) -> None:
+        self._snapshots.pop(league_id, None)
+
+    def subscribe(self, callback: Callable[[List[EventChange]], None]) -> None:
+        """Call ``callback`` with the non-empty change list of every poll."""
+
+        self._subscribers.append(callback)
+
+    def snapshot(self, league_id: str) -> List[Event]:
+        return list(self._snapshots[league_id].events.values())
+
+    def poll(self, league_id: str) -> List[EventChange]:
+        """Fetch ``league_id`` once and return the changes against its snapshot."""
+
+        self.track(league_id)
+        events = self.provider.get_events(league_id)
+        if self.store is not None:
+            events = self.store.put_many("event", events)
+        changes = self._apply(league_id, events)
+        if changes:
+            for callback in self._subscribers:
+                callback(changes)
+        return changes
+
+    def poll_all(self) -> List[EventChange]:
+        """Poll every tracked league, skipping (and logging) leagues that fail."""
+
+        changes: List[EventChange] = []
+        for league_id in self.leagues:
+            try:
+                changes.extend(self.poll(league_id))
+            except Exception:
+                LOGGER.exception("Failed to sync league %s", league_id)
+        return changes
+
+    def run(self, interval: float, stop: threading.Event) -> None:
+        """Poll all tracked leagues every ``interval`` seconds until ``stop`` is set."""
+
+        while not stop.is_set():
+            self.poll_all()
+            stop.wait(interval)
+
+    def changes_since(self, sequence: int) -> List[EventChange]:
+        """Return retained feed entries with a sequence number above ``sequence``."""
+
+        with self._lock:
+            return [change for change in self._feed if change.sequence > sequence]
+
+    def _apply(self, league_id: str, events: Iterable[Event]) -> List[EventChange]:
+        with self._lock:
+            snapshot = self._snapshots[league_id]
+            previous_events = snapshot.events
+            hashes: Dict[str, int] = {}
+            current: Dict[str, Event] = {}
+            changes: List[EventChange] = []
+            for event in events:
+                fingerprint = _fingerprint(event)
+                digest = hash(fingerprint)
+                hashes[event.event_id] = digest
+                # Keep an immutable copy: the store may update ``event`` in place.
+                current[event.event_id] = Event(*fingerprint)
+                old_digest = snapshot.hashes.get(event.event_id)
+                if old_digest is None:
+                    changes.append(self._change(ADDED, league_id, event))
+                elif old_digest != digest:
+                    before = previous_events[event.event_id]
+                    changed = tuple(
+                        name
+                        for name, old, new in zip(EVENT_FIELDS, _fingerprint(before), fingerprint)
+                        if old != new
+                    )
+                    changes.append(self._change(UPDATED, league_id, event, changed, before))
+            for event_id, before in previous_events.items():
+                if event_id not in hashes:
+                    changes.append(self._change(REMOVED, league_id, before, previous=before))
+            snapshot.hashes = hashes
+            snapshot.events = current
+            self._feed.extend(changes)
+            return changes
+
+    def _change(
+        self,
+        kind: str,
+        league_id: str,
+        event: Event,
+        changed_fields: Tuple[str, ...] = (),
+        previous: Optional[Event] = None,
+    ) -> EventChange:
+        self._sequence += 1
+        return EventChange(self._sequence, kind, league_id, event, changed_fields, previous)
+
+
+__all__ = ["ADDED", "REMOVED", "UPDATED", "EventChange", "LeagueSync"]
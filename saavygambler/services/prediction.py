@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import math
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
 from statistics import mean
-from typing import Iterable, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple
 
+from ..config import get_settings
 from ..models import Event, Odds, TeamStats
+from .ratings import EloRatings
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
 
 DEFAULT_HOME_ADVANTAGE = 2.5
 MIN_SAMPLE_SIZE = 5
@@ -21,6 +30,15 @@ def logistic(x: float) -> float:
     return 1.0 / (1.0 + math.exp(-x))
 
 
+def _numpy() -> Any:
+    try:
+        return import_module("numpy")
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError(
+            "Optional dependency 'numpy' is required for batch predictions",
+        ) from exc
+
+
 @dataclass
 class SpreadPrediction:
     event_id: str
@@ -43,11 +61,212 @@ class MoneylinePrediction:
     edge_vs_market: Optional[float] = None
 
 
+@dataclass
+class MatchupColumns:
+    """Columnar home/away statistics and market lines for many matchups.
+
+    Every column is a ``float64`` array of the same length; ``NaN`` marks a
+    missing value exactly where the scalar methods would see ``None``. Market
+    columns that are omitted are filled with ``NaN``. The optional team
+    identifier lists are needed when the engine prices moneylines from Elo
+    ratings.
+    """
+
+    home_points_for: np.ndarray
+    home_points_against: np.ndarray
+    away_points_for: np.ndarray
+    away_points_against: np.ndarray
+    home_wins: Optional[np.ndarray] = None
+    home_losses: Optional[np.ndarray] = None
+    away_wins: Optional[np.ndarray] = None
+    away_losses: Optional[np.ndarray] = None
+    spread: Optional[np.ndarray] = None
+    total: Optional[np.ndarray] = None
+    home_moneyline: Optional[np.ndarray] = None
+    away_moneyline: Optional[np.ndarray] = None
+    home_team_ids: Optional[List[str]] = None
+    away_team_ids: Optional[List[str]] = None
+
+    def __post_init__(self) -> None:
+        np = _numpy()
+        size = len(self.home_points_for)
+        for name in ("home_team_ids", "away_team_ids"):
+            ids = getattr(self, name)
+            if ids is not None:
+                ids = list(ids)
+                if len(ids) != size:
+                    raise ValueError(f"{name} must hold {size} identifiers")
+                setattr(self, name, ids)
+        for name in self.__dataclass_fields__:
+            if name in ("home_team_ids", "away_team_ids"):
+                continue
+            value = getattr(self, name)
+            column = np.full(size, np.nan) if value is None else np.asarray(value, dtype=np.float64)
+            if column.shape != (size,):
+                raise ValueError(f"{name} must be a one-dimensional column of length {size}")
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return len(self.home_points_for)
+
+    @classmethod
+    def from_matchups(
+        cls, matchups: Iterable[Tuple[TeamStats, TeamStats, Optional[Odds]]]
+    ) -> "MatchupColumns":
+        """Build columns from ``(home, away, odds)`` triples."""
+
+        def value(item: Any, name: str) -> float:
+            raw = getattr(item, name) if item is not None else None
+            return math.nan if raw is None else raw
+
+        matchups = list(matchups)
+        rows = [
+            (
+                value(home, "points_for"),
+                value(home, "points_against"),
+                value(away, "points_for"),
+                value(away, "points_against"),
+                value(home, "wins"),
+                value(home, "losses"),
+                value(away, "wins"),
+                value(away, "losses"),
+                value(odds, "spread"),
+                value(odds, "total"),
+                value(odds, "home_moneyline"),
+                value(odds, "away_moneyline"),
+            )
+            for home, away, odds in matchups
+        ]
+        np = _numpy()
+        table = np.array(rows, dtype=np.float64).reshape(len(rows), 12)
+        return cls(
+            *table.T,
+            home_team_ids=[home.team_id for home, _, _ in matchups],
+            away_team_ids=[away.team_id for _, away, _ in matchups],
+        )
+
+    @classmethod
+    def pairwise(cls, teams: Sequence[TeamStats]) -> "MatchupColumns":
+        """Every ordered ``(home, away)`` pairing of distinct ``teams``, without odds.
+
+        Rows are ordered by home team, then away team, matching the order of
+        :func:`itertools.permutations` over ``teams`` taken two at a time.
+        """
+
+        np = _numpy()
+        stats = cls.from_matchups((team, team, None) for team in teams)
+        count = len(teams)
+        home, away = np.divmod(np.arange(count * count), count)
+        keep = home != away
+        home, away = home[keep], away[keep]
+        return cls(
+            stats.home_points_for[home],
+            stats.home_points_against[home],
+            stats.home_points_for[away],
+            stats.home_points_against[away],
+            stats.home_wins[home],
+            stats.home_losses[home],
+            stats.home_wins[away],
+            stats.home_losses[away],
+            home_team_ids=[teams[index].team_id for index in home.tolist()],
+            away_team_ids=[teams[index].team_id for index in away.tolist()],
+        )
+
+
+@dataclass
+class SpreadBatch:
+    spread: np.ndarray
+    confidence: np.ndarray
+
+
+@dataclass
+class TotalBatch:
+    total: np.ndarray
+    confidence: np.ndarray
+
+
+@dataclass
+class MoneylineBatch:
+    home_win_probability: np.ndarray
+    away_win_probability: np.ndarray
+    edge_vs_market: np.ndarray  # NaN where the scalar method returns ``None``
+
+
+class PredictionCache:
+    """Bounded LRU memo of model outputs keyed by an input fingerprint.
+
+    Keys contain every value the model reads (team stat fields, market lines
+    and engine parameters), so a changed input simply produces a new key and
+    outdated results age out of the LRU order.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache()
+def get_prediction_cache() -> Optional[PredictionCache]:
+    """Return the process-wide prediction cache, or ``None`` when disabled by the settings."""
+
+    size = get_settings().prediction_cache_size
+    return PredictionCache(size) if size else None
+
+
 class PredictionEngine:
-    """Run predictive algorithms using historical statistics."""
+    """Run predictive algorithms using historical statistics.
+
+    Pass ``cache`` to memoise results: repeated calls with unchanged team
+    stats, odds and ``home_advantage`` skip model evaluation entirely, while
+    any changed input produces a new fingerprint and is evaluated afresh.
 
-    def __init__(self, *, home_advantage: float = DEFAULT_HOME_ADVANTAGE) -> None:
+    With ``ratings``, :py:meth:`predict_moneyline` takes win probabilities
+    from the Elo ratings (and their own home advantage) instead of deriving a
+    rating from each team's season record.
+    """
+
+    def __init__(
+        self,
+        *,
+        home_advantage: float = DEFAULT_HOME_ADVANTAGE,
+        cache: Optional[PredictionCache] = None,
+        ratings: Optional[EloRatings] = None,
+    ) -> None:
         self.home_advantage = home_advantage
+        self.cache = cache
+        self.ratings = ratings
+
+    def _memo(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        if self.cache is None:
+            return compute()
+        return self.cache.get_or_compute(key, compute)
 
     def predict_spread(
         self,
@@ -56,6 +275,22 @@ class PredictionEngine:
         away_team: TeamStats,
         odds: Optional[Odds] = None,
     ) -> SpreadPrediction:
+        market_spread = odds.spread if odds else None
+        key = (
+            "spread",
+            self.home_advantage,
+            home_team.points_for,
+            home_team.points_against,
+            away_team.points_for,
+            away_team.points_against,
+            market_spread,
+        )
+        spread, confidence = self._memo(key, lambda: self._spread(home_team, away_team, market_spread))
+        return SpreadPrediction(event_id=event.event_id, spread=spread, confidence=confidence)
+
+    def _spread(
+        self, home_team: TeamStats, away_team: TeamStats, market_spread: Optional[float]
+    ) -> Tuple[float, float]:
         home_ppg = _safe_mean([home_team.points_for], default=100.0)
         away_ppg = _safe_mean([away_team.points_for], default=100.0)
         defensive_factor = _safe_mean(
@@ -64,11 +299,10 @@ class PredictionEngine:
         )
         expected_margin = (home_ppg - defensive_factor / 2) - (away_ppg - defensive_factor / 2)
         expected_margin += self.home_advantage
-        market_spread = odds.spread if odds else None
         confidence = 0.5
         if market_spread is not None:
             confidence = min(0.95, 0.5 + abs(expected_margin - market_spread) / 20)
-        return SpreadPrediction(event_id=event.event_id, spread=expected_margin, confidence=confidence)
+        return expected_margin, confidence
 
     def predict_total(
         self,
@@ -77,17 +311,32 @@ class PredictionEngine:
         away_team: TeamStats,
         odds: Optional[Odds] = None,
     ) -> TotalPrediction:
+        market_total = odds.total if odds else None
+        key = (
+            "total",
+            home_team.points_for,
+            home_team.points_against,
+            away_team.points_for,
+            away_team.points_against,
+            market_total,
+        )
+        total, confidence = self._memo(key, lambda: self._total(home_team, away_team, market_total))
+        return TotalPrediction(event_id=event.event_id, total=total, confidence=confidence)
+
+    @staticmethod
+    def _total(
+        home_team: TeamStats, away_team: TeamStats, market_total: Optional[float]
+    ) -> Tuple[float, float]:
         offensive_mean = _safe_mean([home_team.points_for, away_team.points_for], default=100)
         defensive_mean = _safe_mean([home_team.points_against, away_team.points_against], default=100)
         pace_factor = offensive_mean / defensive_mean if defensive_mean else 1.0
         projected_total = offensive_mean * 2 * pace_factor
         if projected_total <= 0:
             projected_total = 200.0
-        market_total = odds.total if odds else None
         confidence = 0.5
         if market_total is not None:
             confidence = min(0.95, 0.5 + abs(projected_total - market_total) / 40)
-        return TotalPrediction(event_id=event.event_id, total=projected_total, confidence=confidence)
+        return projected_total, confidence
 
     def predict_moneyline(
         self,
@@ -96,15 +345,33 @@ class PredictionEngine:
         away_team: TeamStats,
         odds: Optional[Odds] = None,
     ) -> MoneylinePrediction:
-        home_rating = self._rating_from_record(home_team)
-        away_rating = self._rating_from_record(away_team)
-        diff = home_rating - away_rating + self.home_advantage
-        home_prob = logistic(diff / 10)
-        away_prob = 1 - home_prob
-        edge = None
-        if odds and odds.home_moneyline and odds.away_moneyline:
-            market_home_prob = self._prob_from_moneyline(odds.home_moneyline)
-            edge = home_prob - market_home_prob
+        home_moneyline = odds.home_moneyline if odds else None
+        away_moneyline = odds.away_moneyline if odds else None
+        if self.ratings is not None:
+            home_prob = self.ratings.home_win_probability(home_team.team_id, away_team.team_id)
+            return MoneylinePrediction(
+                event_id=event.event_id,
+                home_win_probability=home_prob,
+                away_win_probability=1 - home_prob,
+                edge_vs_market=self._edge(home_prob, home_moneyline, away_moneyline),
+            )
+        key = (
+            "moneyline",
+            self.home_advantage,
+            home_team.wins,
+            home_team.losses,
+            home_team.points_for,
+            home_team.points_against,
+            away_team.wins,
+            away_team.losses,
+            away_team.points_for,
+            away_team.points_against,
+            home_moneyline,
+            away_moneyline,
+        )
+        home_prob, away_prob, edge = self._memo(
+            key, lambda: self._moneyline(home_team, away_team, home_moneyline, away_moneyline)
+        )
         return MoneylinePrediction(
             event_id=event.event_id,
             home_win_probability=home_prob,
@@ -112,6 +379,27 @@ class PredictionEngine:
             edge_vs_market=edge,
         )
 
+    def _moneyline(
+        self,
+        home_team: TeamStats,
+        away_team: TeamStats,
+        home_moneyline: Optional[float],
+        away_moneyline: Optional[float],
+    ) -> Tuple[float, float, Optional[float]]:
+        home_rating = self._rating_from_record(home_team)
+        away_rating = self._rating_from_record(away_team)
+        diff = home_rating - away_rating + self.home_advantage
+        home_prob = logistic(diff / 10)
+        away_prob = 1 - home_prob
+        return home_prob, away_prob, self._edge(home_prob, home_moneyline, away_moneyline)
+
+    def _edge(
+        self, home_prob: float, home_moneyline: Optional[float], away_moneyline: Optional[float]
+    ) -> Optional[float]:
+        if home_moneyline and away_moneyline:
+            return home_prob - self._prob_from_moneyline(home_moneyline)
+        return None
+
     @staticmethod
     def _rating_from_record(team: TeamStats) -> float:
         wins = team.wins or 0
@@ -129,6 +417,128 @@ class PredictionEngine:
             return (-moneyline) / ((-moneyline) + 100)
         return 100 / (moneyline + 100)
 
+    # ------------------------------------------------------------------
+    # Batch predictions
+    #
+    # The batch methods evaluate the scalar formulas above over whole
+    # columns with the same operations in the same order, so every element
+    # is bit-for-bit equal to the corresponding scalar prediction.
+    def predict_spreads(self, columns: MatchupColumns) -> SpreadBatch:
+        """Vectorised :py:meth:`predict_spread` over ``columns``."""
+
+        np = _numpy()
+        home_ppg = np.where(np.isnan(columns.home_points_for), 100.0, columns.home_points_for)
+        away_ppg = np.where(np.isnan(columns.away_points_for), 100.0, columns.away_points_for)
+        defensive_factor = _nan_mean(np, columns.away_points_against, columns.home_points_against)
+        expected_margin = (home_ppg - defensive_factor / 2) - (away_ppg - defensive_factor / 2)
+        expected_margin += self.home_advantage
+        confidence = _confidence(np, expected_margin, columns.spread, scale=20)
+        return SpreadBatch(expected_margin, confidence)
+
+    def predict_totals(self, columns: MatchupColumns) -> TotalBatch:
+        """Vectorised :py:meth:`predict_total` over ``columns``."""
+
+        np = _numpy()
+        offensive_mean = _nan_mean(np, columns.home_points_for, columns.away_points_for)
+        defensive_mean = _nan_mean(np, columns.home_points_against, columns.away_points_against)
+        pace_factor = np.ones_like(offensive_mean)
+        np.divide(offensive_mean, defensive_mean, out=pace_factor, where=defensive_mean != 0)
+        projected_total = offensive_mean * 2 * pace_factor
+        projected_total[projected_total <= 0] = 200.0
+        confidence = _confidence(np, projected_total, columns.total, scale=40)
+        return TotalBatch(projected_total, confidence)
+
+    def predict_moneylines(self, columns: MatchupColumns, *, exact: bool = True) -> MoneylineBatch:
+        """Vectorised :py:meth:`predict_moneyline` over ``columns``.
+
+        ``numpy.exp`` may differ from :func:`math.exp` in the last bit, so by
+        default the logistic uses ``math.exp`` per element to reproduce the
+        scalar probabilities exactly; ``exact=False`` switches to ``numpy.exp``
+        (within one ulp) for roughly twice the throughput.
+
+        With Elo ``ratings`` on the engine the probabilities come from the
+        ratings, as in the scalar method, which requires the team identifier
+        columns; without them a :class:`ValueError` is raised rather than
+        silently falling back to the record-based model.
+        """
+
+        np = _numpy()
+        if self.ratings is not None:
+            home_prob = self._elo_probabilities(np, columns, exact=exact)
+        else:
+            home_prob = self._record_probabilities(np, columns, exact=exact)
+        away_prob = 1 - home_prob
+        home_line, away_line = columns.home_moneyline, columns.away_moneyline
+        priced = ~np.isnan(home_line) & ~np.isnan(away_line) & (home_line != 0) & (away_line != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            market_home_prob = np.where(
+                home_line < 0, -home_line / (-home_line + 100), 100 / (home_line + 100)
+            )
+        edge = np.where(priced, home_prob - market_home_prob, np.nan)
+        return MoneylineBatch(home_prob, away_prob, edge)
+
+    def _record_probabilities(self, np: Any, columns: MatchupColumns, *, exact: bool) -> np.ndarray:
+        home_rating = _ratings(
+            np, columns.home_wins, columns.home_losses, columns.home_points_for, columns.home_points_against
+        )
+        away_rating = _ratings(
+            np, columns.away_wins, columns.away_losses, columns.away_points_for, columns.away_points_against
+        )
+        diff = home_rating - away_rating + self.home_advantage
+        exponent = -(diff / 10)
+        if exact:
+            growth = np.fromiter(map(math.exp, exponent.tolist()), dtype=np.float64, count=len(exponent))
+        else:
+            growth = np.exp(exponent)
+        return 1.0 / (1.0 + growth)
+
+    def _elo_probabilities(self, np: Any, columns: MatchupColumns, *, exact: bool) -> np.ndarray:
+        if columns.home_team_ids is None or columns.away_team_ids is None:
+            raise ValueError("Elo moneylines need home_team_ids and away_team_ids on the columns")
+        if exact:
+            pairs = zip(columns.home_team_ids, columns.away_team_ids)
+            probabilities = [self.ratings.home_win_probability(home, away) for home, away in pairs]
+            return np.array(probabilities, dtype=np.float64).reshape(len(columns))
+        rating = self.ratings.rating
+        home = np.array([rating(team) for team in columns.home_team_ids], dtype=np.float64)
+        away = np.array([rating(team) for team in columns.away_team_ids], dtype=np.float64)
+        difference = home + self.ratings.parameters.home_advantage - away
+        return 1.0 / (1.0 + np.power(10.0, -difference / 400))
+
+
+def _nan_mean(np: Any, first: np.ndarray, second: np.ndarray, default: float = 100.0) -> np.ndarray:
+    """Element-wise :func:`_safe_mean` of two columns with ``NaN`` as ``None``."""
+
+    first_missing = np.isnan(first)
+    second_missing = np.isnan(second)
+    result = (first + second) / 2
+    result = np.where(first_missing, second, result)
+    result = np.where(second_missing, first, result)
+    return np.where(first_missing & second_missing, default, result)
+
+
+def _confidence(np: Any, projection: np.ndarray, market: np.ndarray, *, scale: float) -> np.ndarray:
+    edge_confidence = np.minimum(0.95, 0.5 + np.abs(projection - market) / scale)
+    return np.where(np.isnan(market), 0.5, edge_confidence)
+
+
+def _ratings(
+    np: Any,
+    wins: np.ndarray,
+    losses: np.ndarray,
+    points_for: np.ndarray,
+    points_against: np.ndarray,
+) -> np.ndarray:
+    """Element-wise :py:meth:`PredictionEngine._rating_from_record`."""
+
+    wins = np.nan_to_num(wins, nan=0.0)
+    losses = np.nan_to_num(losses, nan=0.0)
+    games = wins + losses
+    enough = games >= MIN_SAMPLE_SIZE
+    win_pct = np.divide(wins, games, out=np.zeros_like(games), where=enough)
+    margin = np.nan_to_num(points_for, nan=0.0) - np.nan_to_num(points_against, nan=0.0)
+    return np.where(enough, 1500 + (win_pct - 0.5) * 400 + margin, 1500.0)
+
 
 def ensemble_spread(predictions: Sequence[SpreadPrediction]) -> SpreadPrediction:
     event_id = predictions[0].event_id
@@ -151,10 +561,16 @@ def ensemble_total(predictions: Sequence[TotalPrediction]) -> TotalPrediction:
 
 
 __all__ = [
+    "MatchupColumns",
+    "MoneylineBatch",
     "MoneylinePrediction",
+    "PredictionCache",
     "PredictionEngine",
+    "SpreadBatch",
     "SpreadPrediction",
+    "TotalBatch",
     "TotalPrediction",
     "ensemble_spread",
     "ensemble_total",
+    "get_prediction_cache",
 ]
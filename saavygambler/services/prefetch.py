@@ -0,0 +1,292 @@
+"""Background warm-up of upcoming events, teams and odds."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models import Event
+from ..providers.base import SportsDataProvider
+from ..providers.batch import DEFAULT_CONCURRENCY, fan_out
+from .entity_store import EntityStore
+
+LOGGER = logging.getLogger(__name__)
+
+LEAGUE = "league"
+TEAM = "team"
+ODDS = "odds"
+
+# Re-fetch intervals in seconds. Odds are refreshed more often the closer an
+# event is to kickoff, keyed by the number of days until the event.
+LEAGUE_REFRESH_SECONDS = 600.0
+TEAM_REFRESH_SECONDS = 3600.0
+ODDS_REFRESH_SECONDS: Tuple[Tuple[int, float], ...] = ((0, 60.0), (1, 300.0), (3, 900.0))
+ODDS_REFRESH_FALLBACK_SECONDS = 3600.0
+# First retry after a failed task; doubled per consecutive failure up to the
+# task's normal refresh interval.
+FAILURE_RETRY_SECONDS = 30.0
+
+
+def odds_refresh_interval(days_to_kickoff: int) -> float:
+    for max_days, interval in ODDS_REFRESH_SECONDS:
+        if days_to_kickoff <= max_days:
+            return interval
+    return ODDS_REFRESH_FALLBACK_SECONDS
+
+
+@dataclass(order=True)
+class _Task:
+    due_at: float
+    days_to_kickoff: int
+    sequence: int
+    kind: str = field(compare=False)
+    key: str = field(compare=False)
+
+
+@dataclass
+class PrefetchStats:
+    runs: int = 0
+    fetched: int = 0
+    failures: int = 0
+    queued: int = 0
+
+
+class PrefetchScheduler:
+    """Keep the caches behind ``provider`` warm for upcoming fixtures.
+
+    Each configured league's upcoming events within ``horizon_days`` are
+    loaded periodically; for every event the home and away teams and the odds
+    are queued for refresh. Due work is executed nearest-kickoff first, and
+    odds for imminent events are refreshed most often (see
+    :data:`ODDS_REFRESH_SECONDS`), so the user-facing path finds fresh entries
+    in the HTTP cache and, when ``store`` is given, in the entity store. Odds
+    and team tasks are retired once none of their events lies ahead, and
+    failed tasks are retried with exponential backoff.
+
+    The refresh intervals are shorter than the provider's cache lifetimes, so
+    ``provider`` should sit on a client created with ``always_revalidate``;
+    otherwise a refresh is answered from the cache it is meant to refresh.
+    """
+
+    def __init__(
+        self,
+        provider: SportsDataProvider,
+        league_ids: Iterable[str],
+        *,
+        store: Optional[EntityStore] = None,
+        horizon_days: int = 7,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        self.provider = provider
+        self.store = store
+        self.horizon_days = horizon_days
+        self.concurrency = concurrency
+        self.stats = PrefetchStats()
+        self._clock = clock
+        self._today = today
+        self._heap: List[_Task] = []
+        self._scheduled: Dict[Tuple[str, str], _Task] = {}
+        self._kickoffs: Dict[str, date] = {}
+        self._team_events: Dict[str, Set[str]] = {}
+        self._failures: Dict[Tuple[str, str], int] = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        for league_id in league_ids:
+            self._schedule(LEAGUE, league_id, self._clock(), days_to_kickoff=-1)
+
+    # ------------------------------------------------------------------
+    # Execution
+    def run_once(self) -> int:
+        """Run every task that is due and return how many were executed."""
+
+        now = self._clock()
+        due: List[_Task] = []
+        with self._lock:
+            while self._heap and self._heap[0].due_at <= now:
+                task = heapq.heappop(self._heap)
+                if self._scheduled.get((task.kind, task.key)) is task:
+                    del self._scheduled[(task.kind, task.key)]
+                    due.append(task)
+        if not due:
+            return 0
+        # Leagues run first so the teams and odds they enqueue are picked up
+        # by the next run; the remaining work goes nearest kickoff first.
+        due.sort(key=lambda task: task.days_to_kickoff)
+        leagues = [task for task in due if task.kind == LEAGUE]
+        others = [task for task in due if task.kind != LEAGUE]
+        for batch in (leagues, others):
+            if not batch:
+                continue
+            tasks = {f"{task.kind}:{task.key}": task for task in batch}
+            outcome = fan_out(
+                lambda name: self._execute(tasks[name]),
+                tasks,
+                concurrency=self.concurrency,
+                what="prefetch task",
+            )
+            self.stats.fetched += len(outcome.results)
+            self.stats.failures += len(outcome.errors)
+            for name, _ in outcome.results:
+                self._failures.pop((tasks[name].kind, tasks[name].key), None)
+            for name in outcome.errors:
+                self._reschedule_after_failure(tasks[name])
+        self.stats.runs += 1
+        self.stats.queued = len(self._scheduled)
+        return len(due)
+
+    def run_until_idle(self, *, max_passes: int = 10) -> int:
+        """Run passes until nothing is due; return how many tasks were executed.
+
+        One pass loads fixtures and queues their teams and odds for the next,
+        so a one-off warm-up needs several. ``max_passes`` bounds the loop in
+        case tasks keep rescheduling themselves as due immediately.
+        """
+
+        executed = 0
+        for _ in range(max_passes):
+            ran = self.run_once()
+            if not ran:
+                break
+            executed += ran
+        return executed
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next task is due, or ``None`` when idle."""
+
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0].due_at - self._clock())
+
+    def run(self, stop: Optional[threading.Event] = None, *, idle_wait: float = 60.0) -> None:
+        """Run due tasks until ``stop`` is set."""
+
+        stop = stop or self._stop
+        while not stop.is_set():
+            self.run_once()
+            wait = self.next_due_in()
+            stop.wait(idle_wait if wait is None else min(wait, idle_wait))
+
+    def start(self) -> None:
+        """Run the scheduler on a daemon thread."""
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="prefetch-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Tasks
+    def _execute(self, task: _Task) -> None:
+        if task.kind == LEAGUE:
+            self._refresh_league(task.key)
+        elif task.kind == TEAM:
+            team = self.provider.get_team(task.key)
+            if team is not None and self.store is not None:
+                self.store.put(TEAM, team)
+            days = self._team_days_to_kickoff(task.key)
+            if days is not None:
+                self._schedule(TEAM, task.key, self._clock() + TEAM_REFRESH_SECONDS, days)
+        else:
+            self.provider.get_odds(task.key)
+            days = self._days_to_kickoff(task.key)
+            if days is not None and days >= 0:
+                self._schedule(ODDS, task.key, self._clock() + odds_refresh_interval(days), days)
+
+    def _refresh_league(self, league_id: str) -> None:
+        events = self.provider.get_events(league_id)
+        if self.store is not None:
+            events = self.store.put_many("event", events)
+        now = self._clock()
+        for event in self._upcoming(events):
+            days = (event.event_date - self._today()).days
+            self._kickoffs[event.event_id] = event.event_date
+            self._schedule(ODDS, event.event_id, now, days, replace=False)
+            for team_id in (event.home_team_id, event.away_team_id):
+                if team_id:
+                    with self._lock:
+                        self._team_events.setdefault(team_id, set()).add(event.event_id)
+                    self._schedule(TEAM, team_id, now, days, replace=False)
+        self._schedule(LEAGUE, league_id, now + LEAGUE_REFRESH_SECONDS, days_to_kickoff=-1)
+
+    def _upcoming(self, events: Iterable[Event]) -> List[Event]:
+        today = self._today()
+        horizon = today + timedelta(days=self.horizon_days)
+        return [event for event in events if today <= event.event_date <= horizon]
+
+    def _days_to_kickoff(self, event_id: str) -> Optional[int]:
+        kickoff = self._kickoffs.get(event_id)
+        if kickoff is None:
+            return None
+        days = (kickoff - self._today()).days
+        if days < 0:
+            self._kickoffs.pop(event_id, None)
+        return days
+
+    def _team_days_to_kickoff(self, team_id: str) -> Optional[int]:
+        """Days until ``team_id``'s next known event, or ``None`` once none lies ahead."""
+
+        with self._lock:
+            event_ids = list(self._team_events.get(team_id, ()))
+        upcoming = []
+        for event_id in event_ids:
+            days = self._days_to_kickoff(event_id)
+            if days is not None and days >= 0:
+                upcoming.append(days)
+        with self._lock:
+            if upcoming:
+                self._team_events[team_id] = {event_id for event_id in event_ids if event_id in self._kickoffs}
+                return min(upcoming)
+            self._team_events.pop(team_id, None)
+        return None
+
+    def _reschedule_after_failure(self, task: _Task) -> None:
+        if task.kind == LEAGUE:
+            interval = LEAGUE_REFRESH_SECONDS
+            days = task.days_to_kickoff
+        elif task.kind == TEAM:
+            interval = TEAM_REFRESH_SECONDS
+            days = self._team_days_to_kickoff(task.key)
+        else:
+            days = self._days_to_kickoff(task.key)
+            if days is not None and days < 0:
+                days = None
+            interval = odds_refresh_interval(days) if days is not None else 0.0
+        if days is None:
+            self._failures.pop((task.kind, task.key), None)
+            return
+        failures = self._failures.get((task.kind, task.key), 0) + 1
+        self._failures[(task.kind, task.key)] = failures
+        delay = min(interval, FAILURE_RETRY_SECONDS * 2 ** (failures - 1))
+        self._schedule(task.kind, task.key, self._clock() + delay, days)
+
+    def _schedule(
+        self, kind: str, key: str, due_at: float, days_to_kickoff: int, *, replace: bool = True
+    ) -> None:
+        """Queue ``(kind, key)`` at ``due_at``; with ``replace=False`` keep an existing entry."""
+
+        with self._lock:
+            if not replace and (kind, key) in self._scheduled:
+                return
+            task = _Task(due_at, days_to_kickoff, next(self._sequence), kind, key)
+            self._scheduled[(kind, key)] = task
+            heapq.heappush(self._heap, task)
+
+
+__all__ = ["FAILURE_RETRY_SECONDS", "PrefetchScheduler", "PrefetchStats", "odds_refresh_interval"]
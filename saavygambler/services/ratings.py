@@ -0,0 +1,276 @@
+"""Incremental Elo ratings built from final event results."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Union
+
+from ..models import Event
+
+LOGGER = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT = 3
+
+
+@dataclass(frozen=True)
+class EloParameters:
+    """Tuning of :class:`EloRatings`.
+
+    ``home_advantage`` is expressed in rating points and added to the home
+    side's rating whenever a win probability is computed.
+    """
+
+    initial_rating: float = 1500.0
+    k_factor: float = 20.0
+    home_advantage: float = 65.0
+
+
+@dataclass
+class UpdateSummary:
+    """Outcome of :py:meth:`EloRatings.update_many`.
+
+    ``late`` counts new final results dated before the watermark, which are
+    not applied (see :class:`EloRatings`).
+    """
+
+    applied: int = 0
+    late: int = 0
+
+
+def expected_score(rating_difference: float) -> float:
+    """Win probability of a side rated ``rating_difference`` points higher."""
+
+    return 1.0 / (1.0 + 10 ** (-rating_difference / 400))
+
+
+def margin_multiplier(margin: int, winner_rating_difference: float) -> float:
+    """Scale the update for the margin of victory.
+
+    Large wins move ratings more, with diminishing returns, and the
+    multiplier shrinks when the favourite wins, so lopsided results between
+    mismatched teams do not inflate the stronger side's rating.
+    """
+
+    if margin == 0:
+        return 1.0
+    return (abs(margin) + 3) ** 0.8 / (7.5 + 0.006 * winner_rating_difference)
+
+
+class EloRatings:
+    """Team ratings updated one final result at a time.
+
+    Each call to :py:meth:`update` costs O(1): it reads two ratings and
+    applies the Elo update scaled by :func:`margin_multiplier`. Results must
+    be applied in chronological order, so :py:meth:`update_many` sorts each
+    stream by date before applying it. Progress is tracked as a date
+    watermark plus the IDs applied in the current :py:attr:`season`:
+    replaying a stream never double counts, and a result of that season
+    dated before the watermark that was never applied (a game reported late,
+    say) is counted and logged as late rather than applied out of order.
+
+    With ``checkpoint_path`` the state is written there after every
+    ``checkpoint_interval`` applied results (and on :py:meth:`save`). The
+    checkpoint holds the ratings, the watermark and the last :py:attr:`season`
+    fed through :py:meth:`update_many` with its applied IDs, so its size is
+    bounded by one season rather than the whole history, and :py:meth:`load`
+    plus :py:attr:`season` let a caller resume fetching from the season it
+    stopped in.
+    """
+
+    def __init__(
+        self,
+        parameters: Optional[EloParameters] = None,
+        *,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_interval: int = 100,
+    ) -> None:
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least one")
+        self.parameters = parameters or EloParameters()
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        self.checkpoint_interval = checkpoint_interval
+        self._ratings: Dict[str, float] = {}
+        self._games: Dict[str, int] = {}
+        self._applied = 0
+        self._watermark: Optional[date] = None
+        self._season_ids: Set[str] = set()
+        self.season: Optional[str] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Queries
+    def rating(self, team_id: str) -> float:
+        return self._ratings.get(team_id, self.parameters.initial_rating)
+
+    def games(self, team_id: str) -> int:
+        return self._games.get(team_id, 0)
+
+    @property
+    def ratings(self) -> Dict[str, float]:
+        return dict(self._ratings)
+
+    @property
+    def processed(self) -> int:
+        """Number of results applied so far."""
+
+        return self._applied
+
+    @property
+    def watermark(self) -> Optional[date]:
+        """Date of the most recent applied result."""
+
+        return self._watermark
+
+    def home_win_probability(self, home_team_id: str, away_team_id: str) -> float:
+        difference = self.rating(home_team_id) + self.parameters.home_advantage - self.rating(away_team_id)
+        return expected_score(difference)
+
+    # ------------------------------------------------------------------
+    # Updates
+    def update(self, event: Event) -> bool:
+        """Apply ``event``'s result; return ``False`` when it is skipped.
+
+        Events that are not final, lack a score, were already applied or fall
+        behind the watermark (see the class docstring) are skipped.
+        """
+
+        return self._update(event) is True
+
+    def _update(self, event: Event) -> Optional[bool]:
+        """Like :py:meth:`update`, but return ``None`` for a late result."""
+
+        if not event.is_final or event.home_score is None or event.away_score is None:
+            return False
+        with self._lock:
+            if event.event_id in self._season_ids:
+                return False
+            if self._watermark is not None and event.event_date < self._watermark:
+                LOGGER.warning(
+                    "Result %s dated %s is behind the rating watermark %s; not applied",
+                    event.event_id,
+                    event.event_date,
+                    self._watermark,
+                )
+                return None
+            self._apply(event)
+            self._watermark = event.event_date
+            self._season_ids.add(event.event_id)
+            self._applied += 1
+            self._pending += 1
+            due = self.checkpoint_path is not None and self._pending >= self.checkpoint_interval
+        if due:
+            self.save()
+        return True
+
+    def update_many(self, events: Iterable[Event], *, season: Optional[str] = None) -> UpdateSummary:
+        """Apply every result in ``events`` in date order and summarise the outcome.
+
+        ``season`` labels the stream and is recorded in checkpoints; starting
+        a new season forgets the previous season's applied IDs.
+        """
+
+        if season is not None and season != self.season:
+            with self._lock:
+                self.season = season
+                self._season_ids = set()
+        summary = UpdateSummary()
+        for event in sorted(events, key=lambda event: (event.event_date, event.event_id)):
+            outcome = self._update(event)
+            if outcome is None:
+                summary.late += 1
+            elif outcome:
+                summary.applied += 1
+        return summary
+
+    def _apply(self, event: Event) -> None:
+        params = self.parameters
+        home = self._ratings.get(event.home_team_id, params.initial_rating)
+        away = self._ratings.get(event.away_team_id, params.initial_rating)
+        difference = home + params.home_advantage - away
+        margin = event.home_score - event.away_score
+        if margin > 0:
+            actual = 1.0
+        elif margin < 0:
+            actual = 0.0
+        else:
+            actual = 0.5
+        winner_difference = difference if margin >= 0 else -difference
+        multiplier = margin_multiplier(margin, winner_difference)
+        shift = params.k_factor * multiplier * (actual - expected_score(difference))
+        self._ratings[event.home_team_id] = home + shift
+        self._ratings[event.away_team_id] = away - shift
+        self._games[event.home_team_id] = self._games.get(event.home_team_id, 0) + 1
+        self._games[event.away_team_id] = self._games.get(event.away_team_id, 0) + 1
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    def save(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """Atomically write the current state to ``path`` (default: ``checkpoint_path``)."""
+
+        target = Path(path) if path is not None else self.checkpoint_path
+        if target is None:
+            raise ValueError("No checkpoint path configured")
+        with self._lock:
+            state = {
+                "format": CHECKPOINT_FORMAT,
+                "parameters": asdict(self.parameters),
+                "ratings": self._ratings,
+                "games": self._games,
+                "applied": self._applied,
+                "season": self.season,
+                "watermark": self._watermark.isoformat() if self._watermark else None,
+                "season_ids": sorted(self._season_ids),
+            }
+            payload = json.dumps(state, separators=(",", ":"))
+            self._pending = 0
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary.write_text(payload, encoding="utf-8")
+        os.replace(temporary, target)
+        return target
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        parameters: Optional[EloParameters] = None,
+        *,
+        checkpoint_interval: int = 100,
+    ) -> "EloRatings":
+        """Resume from the checkpoint at ``path``, or start empty when it does not exist.
+
+        The checkpoint's parameters are used unless ``parameters`` is given; a
+        checkpoint written with different parameters is discarded, since its
+        ratings would not be comparable.
+        """
+
+        path = Path(path)
+        engine = cls(parameters, checkpoint_path=path, checkpoint_interval=checkpoint_interval)
+        if not path.exists():
+            return engine
+        state = json.loads(path.read_text(encoding="utf-8"))
+        if state.get("format") != CHECKPOINT_FORMAT:
+            LOGGER.warning("Ignoring rating checkpoint %s with unknown format %r", path, state.get("format"))
+            return engine
+        stored = EloParameters(**state["parameters"])
+        if parameters is None:
+            engine.parameters = stored
+        elif stored != parameters:
+            LOGGER.warning("Ignoring rating checkpoint %s written with different parameters", path)
+            return engine
+        engine._ratings = {team: float(value) for team, value in state["ratings"].items()}
+        engine._games = {team: int(value) for team, value in state["games"].items()}
+        engine._applied = int(state["applied"])
+        engine.season = state["season"]
+        engine._watermark = date.fromisoformat(state["watermark"]) if state["watermark"] else None
+        engine._season_ids = set(state["season_ids"])
+        return engine
+
+
+__all__ = ["EloParameters", "EloRatings", "UpdateSummary", "expected_score", "margin_multiplier"]
@@ -0,0 +1,194 @@
+"""Monte Carlo simulation of game scores."""
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..models import Odds, TeamStats
+from .prediction import MatchupColumns, PredictionEngine
+
+try:  # pragma: no cover - exercised implicitly when numpy is installed
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+NORMAL = "normal"
+POISSON = "poisson"
+DISTRIBUTIONS = (NORMAL, POISSON)
+
+DEFAULT_SIMULATIONS = 10_000
+DEFAULT_CHUNK_SIZE = 2_500
+
+Line = Union[float, Sequence[float], "np.ndarray"]
+
+
+def _simulate_chunk(
+    home_mean: np.ndarray,
+    away_mean: np.ndarray,
+    distribution: str,
+    score_sd: float,
+    correlation: float,
+    simulations: int,
+    seed: np.random.SeedSequence,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw ``simulations`` scores per matchup and return ``(margins, totals)``.
+
+    Module level so that it can be shipped to worker processes.
+    """
+
+    rng = np.random.default_rng(seed)
+    shape = (len(home_mean), simulations)
+    if distribution == POISSON:
+        home = rng.poisson(np.maximum(home_mean, 0.0)[:, None], shape)
+        away = rng.poisson(np.maximum(away_mean, 0.0)[:, None], shape)
+    else:
+        first = rng.standard_normal(shape)
+        second = rng.standard_normal(shape)
+        second *= math.sqrt(1.0 - correlation * correlation)
+        second += correlation * first
+        home = np.rint(home_mean[:, None] + score_sd * first).clip(min=0)
+        away = np.rint(away_mean[:, None] + score_sd * second).clip(min=0)
+    return (home - away).astype(np.int32), (home + away).astype(np.int32)
+
+
+@dataclass
+class SimulationResult:
+    """Simulated margins (home minus away) and totals, one row per matchup."""
+
+    margins: np.ndarray
+    totals: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.margins)
+
+    @property
+    def simulations(self) -> int:
+        return self.margins.shape[1]
+
+    def home_win_probability(self) -> np.ndarray:
+        """Probability the home side wins, counting half of every tie."""
+
+        wins = (self.margins > 0).mean(axis=1)
+        return wins + (self.margins == 0).mean(axis=1) / 2
+
+    def cover_probability(self, line: Line) -> np.ndarray:
+        """Probability the home side covers its spread ``line`` (``-3.5`` = favoured by 3.5).
+
+        Pushes count as neither; see :py:meth:`push_probability`.
+        """
+
+        return (self.margins + self._column(line) > 0).mean(axis=1)
+
+    def push_probability(self, line: Line) -> np.ndarray:
+        return (self.margins + self._column(line) == 0).mean(axis=1)
+
+    def over_probability(self, total: Line) -> np.ndarray:
+        return (self.totals > self._column(total)).mean(axis=1)
+
+    def under_probability(self, total: Line) -> np.ndarray:
+        return (self.totals < self._column(total)).mean(axis=1)
+
+    def margin_quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """Margin quantiles with shape ``(matchups, len(quantiles))``."""
+
+        return np.quantile(self.margins, quantiles, axis=1).T
+
+    def total_quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        """Total quantiles with shape ``(matchups, len(quantiles))``."""
+
+        return np.quantile(self.totals, quantiles, axis=1).T
+
+    def _column(self, line: Line) -> np.ndarray:
+        values = np.asarray(line, dtype=np.float64)
+        return values[:, None] if values.ndim else values
+
+
+class GameSimulator:
+    """Sample full score distributions for many matchups at once.
+
+    Expected home and away scores come from ``engine``'s batch spread and
+    total predictions. Scores are drawn either from correlated normals
+    (``score_sd`` per side, ``correlation`` between the sides, rounded to
+    whole points; suited to high-scoring sports) or from independent Poisson
+    distributions for low-scoring ones.
+
+    Simulations are drawn in chunks of ``chunk_size``, each with its own
+    generator spawned from ``numpy.random.SeedSequence(seed)``. With
+    ``processes`` above one the chunks run on a process pool; because the
+    chunking does not depend on the pool, results for a given ``seed`` are
+    identical however many processes are used.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[PredictionEngine] = None,
+        *,
+        simulations: int = DEFAULT_SIMULATIONS,
+        distribution: str = NORMAL,
+        score_sd: float = 12.0,
+        correlation: float = 0.3,
+        seed: int = 0,
+        processes: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if np is None:
+            raise ModuleNotFoundError("Optional dependency 'numpy' is required for game simulation")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {DISTRIBUTIONS}")
+        if simulations < 1 or chunk_size < 1 or processes < 1:
+            raise ValueError("simulations, chunk_size and processes must be at least one")
+        if not -1.0 < correlation < 1.0:
+            raise ValueError("correlation must lie strictly between -1 and 1")
+        self.engine = engine or PredictionEngine()
+        self.simulations = simulations
+        self.distribution = distribution
+        self.score_sd = score_sd
+        self.correlation = correlation
+        self.seed = seed
+        self.processes = processes
+        self.chunk_size = chunk_size
+
+    def expected_scores(self, columns: MatchupColumns) -> Tuple[np.ndarray, np.ndarray]:
+        """Expected ``(home, away)`` scores implied by the predicted spread and total."""
+
+        spread = self.engine.predict_spreads(columns).spread
+        total = self.engine.predict_totals(columns).total
+        return (total + spread) / 2, (total - spread) / 2
+
+    def simulate(self, columns: MatchupColumns) -> SimulationResult:
+        home_mean, away_mean = self.expected_scores(columns)
+        return self.simulate_scores(home_mean, away_mean)
+
+    def simulate_matchups(
+        self, matchups: Iterable[Tuple[TeamStats, TeamStats, Optional[Odds]]]
+    ) -> SimulationResult:
+        return self.simulate(MatchupColumns.from_matchups(matchups))
+
+    def simulate_scores(self, home_mean: Any, away_mean: Any) -> SimulationResult:
+        """Simulate matchups with the given expected home and away scores."""
+
+        home_mean = np.asarray(home_mean, dtype=np.float64)
+        away_mean = np.asarray(away_mean, dtype=np.float64)
+        sizes = self._chunks()
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        jobs = [
+            (home_mean, away_mean, self.distribution, self.score_sd, self.correlation, size, seed)
+            for size, seed in zip(sizes, seeds)
+        ]
+        if self.processes == 1 or len(jobs) == 1:
+            chunks = [_simulate_chunk(*job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.processes, len(jobs))) as executor:
+                chunks = list(executor.map(_simulate_chunk, *zip(*jobs)))
+        margins = np.concatenate([margin for margin, _ in chunks], axis=1)
+        totals = np.concatenate([total for _, total in chunks], axis=1)
+        return SimulationResult(margins, totals)
+
+    def _chunks(self) -> List[int]:
+        full, remainder = divmod(self.simulations, self.chunk_size)
+        return [self.chunk_size] * full + ([remainder] if remainder else [])
+
+
+__all__ = ["DISTRIBUTIONS", "NORMAL", "POISSON", "GameSimulator", "SimulationResult"]
@@ -3,32 +3,88 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..models import Event, PlayerStats, TeamStats
 from ..providers.base import SportsDataProvider
+from .entity_store import EntityStore
 
 
 @dataclass
 class StatCollector:
-    """Collects statistics from a :class:`SportsDataProvider`."""
+    """Collects statistics from a :class:`SportsDataProvider`.
+
+    With a :class:`~saavygambler.services.entity_store.EntityStore` attached,
+    every model returned is the store's canonical instance and repeat lookups
+    of teams, players and events by identifier are answered from the store.
+    """
 
     provider: SportsDataProvider
+    store: Optional[EntityStore] = None
 
     def teams(self, name: str) -> List[TeamStats]:
-        return self.provider.search_teams(name)
+        return self._canonical("team", self.provider.search_teams(name))
 
     def team(self, team_id: str) -> Optional[TeamStats]:
-        return self.provider.get_team(team_id)
+        if self.store is not None:
+            cached = self.store.get("team", team_id)
+            if cached is not None:
+                return cached
+        team = self.provider.get_team(team_id)
+        if team is None or self.store is None:
+            return team
+        return self.store.put("team", team)
+
+    def teams_by_id(self, team_ids: Iterable[str]) -> Dict[str, TeamStats]:
+        """Return the known teams among ``team_ids``, fetching only store misses in bulk."""
+
+        if self.store is None:
+            return self.provider.get_teams(team_ids)
+        team_ids = list(team_ids)
+        teams = self._known("team", team_ids)
+        missing = [team_id for team_id in dict.fromkeys(team_ids) if team_id and team_id not in teams]
+        if missing:
+            for team_id, team in self.provider.get_teams(missing).items():
+                teams[team_id] = self.store.put("team", team)
+        return teams
 
     def events(self, league_id: str, *, from_date: Optional[date] = None) -> List[Event]:
-        return self.provider.get_events(league_id, from_date=from_date)
+        return self._canonical("event", self.provider.get_events(league_id, from_date=from_date))
 
     def lookup_events(self, event_ids: Iterable[str]) -> List[Event]:
-        return self.provider.lookup_events(event_ids)
+        if self.store is None:
+            return self.provider.lookup_events(event_ids)
+        event_ids = list(event_ids)
+        known = self._known("event", event_ids)
+        missing = [event_id for event_id in dict.fromkeys(event_ids) if event_id not in known]
+        if missing:
+            for event in self._canonical("event", self.provider.lookup_events(missing)):
+                known[event.event_id] = event
+        return [known[event_id] for event_id in event_ids if event_id in known]
 
     def player_stats(self, player_ids: Iterable[str]) -> List[PlayerStats]:
-        return self.provider.get_player_stats(player_ids)
+        if self.store is None:
+            return self.provider.get_player_stats(player_ids)
+        player_ids = list(player_ids)
+        known = self._known("player", player_ids)
+        missing = [player_id for player_id in dict.fromkeys(player_ids) if player_id not in known]
+        if missing:
+            for player in self._canonical("player", self.provider.get_player_stats(missing)):
+                known[player.player_id] = player
+        return [known[player_id] for player_id in player_ids if player_id in known]
+
+    def _known(self, kind: str, keys: Iterable[str]) -> Dict[str, object]:
+        found: Dict[str, object] = {}
+        for key in dict.fromkeys(keys):
+            entity = self.store.get(kind, key)
+            if entity is not None:
+                found[key] = entity
+        return found
+
+    def _canonical(self, kind: str, entities: List) -> List:
+        if self.store is None:
+            return entities
+        return self.store.put_many(kind, entities)
 
 
 __all__ = ["StatCollector"]
@@ -79,3 +79,87 @@ def test_insights_and_fantasy_from_stub_provider():
     projections = service.fantasy_projections(["P1"])
     assert projections
     assert projections[0].player_id == "P1"
+
+
+def test_insights_for_changes_skips_removed_events():
+    from saavygambler.services.league_sync import ADDED, REMOVED, EventChange
+
+    service = AnalyticsService(StubProvider())
+    event = Event(event_id="E9", league_id="999", home_team_id="1", away_team_id="2", event_date=date.today())
+    gone = Event(event_id="E8", league_id="999", home_team_id="1", away_team_id="2", event_date=date.today())
+
+    insights = service.insights_for_changes(
+        [EventChange(1, ADDED, "999", event), EventChange(2, REMOVED, "999", gone, previous=gone)]
+    )
+
+    assert [item.event.event_id for item in insights] == ["E9"]
+
+
+def test_insights_report_fetches_each_team_once():
+    from saavygambler.services.entity_store import EntityStore
+
+    class LeagueProvider(StubProvider):
+        def __init__(self):
+            super().__init__()
+            self.team_calls = []
+
+        def get_events(self, league_id, *, from_date=None):
+            pairs = [("1", "2"), ("2", "3"), ("3", "1"), ("1", "2")]
+            return [
+                Event(event_id=f"E{index}", league_id=league_id, home_team_id=home, away_team_id=away, event_date=date.today())
+                for index, (home, away) in enumerate(pairs)
+            ]
+
+        def get_team(self, team_id):
+            self.team_calls.append(team_id)
+            return TeamStats(team_id=team_id, name=f"Team {team_id}")
+
+    provider = LeagueProvider()
+    report = AnalyticsService(provider, store=EntityStore()).insights_report("999")
+
+    assert sorted(provider.team_calls) == ["1", "2", "3"]
+    assert report.unique_teams == 3
+    assert [item.away_team.name for item in report.insights] == ["Team 2", "Team 3", "Team 1", "Team 2"]
+    assert set(report.timings) == {"events", "gather", "predict"}
+
+
+def test_iter_insights_yields_fast_events_first():
+    import time
+
+    from saavygambler.services.entity_store import EntityStore
+
+    class SlowOddsProvider(StubProvider):
+        def get_events(self, league_id, *, from_date=None):
+            return [
+                Event(event_id=event_id, league_id=league_id, home_team_id="1", away_team_id="2", event_date=date.today())
+                for event_id in ("slow", "fast")
+            ]
+
+        def get_odds(self, event_id):
+            if event_id == "slow":
+                time.sleep(0.2)
+            return super().get_odds(event_id)
+
+    insights = AnalyticsService(SlowOddsProvider(), store=EntityStore()).iter_insights("999")
+
+    assert [item.event.event_id for item in insights] == ["fast", "slow"]
+
+
+def test_insights_for_leagues_reports_results_and_errors_per_league():
+    from saavygambler.services.entity_store import EntityStore
+
+    class MultiLeagueProvider(StubProvider):
+        def get_events(self, league_id, *, from_date=None):
+            if league_id == "bad":
+                raise RuntimeError("league unavailable")
+            return [
+                Event(event_id=f"{league_id}-E", league_id=league_id, home_team_id="1", away_team_id="2", event_date=date.today())
+            ]
+
+    batch = AnalyticsService(MultiLeagueProvider(), store=EntityStore()).insights_for_leagues(["A", "bad", "B", "A"])
+
+    assert {league: [item.event.event_id for item in items] for league, items in batch.results.items()} == {
+        "A": ["A-E"],
+        "B": ["B-E"],
+    }
+    assert batch.errors == {"bad": "league unavailable"}
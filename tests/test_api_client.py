@@ -0,0 +1,100 @@
+import asyncio
+import threading
+
+import httpx
+
+from saavygambler.providers.api_client import APIClient, AsyncAPIClient
+from saavygambler.providers.cache import CachedResponse, DiskCache
+
+
+def _counting_transport(payload):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json=payload)
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_disk_cache_survives_new_client(tmp_path):
+    transport, calls = _counting_transport({"teams": [{"idTeam": "1"}]})
+    first = APIClient(disk_cache=DiskCache.in_directory(tmp_path), transport=transport)
+    assert first.get_json("https://example.test/lookupteam.php", params={"id": "1"}, cache_ttl=60)
+    first.close()
+
+    second = APIClient(disk_cache=DiskCache.in_directory(tmp_path), transport=transport)
+    data = second.get_json("https://example.test/lookupteam.php", params={"id": "1"}, cache_ttl=60)
+    second.close()
+
+    assert data == {"teams": [{"idTeam": "1"}]}
+    assert len(calls) == 1
+
+
+def test_disk_cache_respects_ttl_and_size_budget(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=200)
+    cache.set("expired", CachedResponse(200, {}, b'{"v": 1}', timestamp=0.0, expires_in=1.0))
+    assert cache.get("expired") is not None
+    assert not cache.get("expired").is_valid()
+
+    for index in range(20):
+        cache.set(f"key-{index}", CachedResponse(200, {}, b"x" * 50, timestamp=1e12, expires_in=None))
+
+    assert cache.total_bytes() <= 200
+    assert cache.get("key-19") is not None
+    assert cache.get("key-0") is None
+    cache.close()
+
+
+def test_async_client_caches_and_retries_request_errors():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, json={"events": []})
+
+    async def scenario():
+        async with AsyncAPIClient(transport=httpx.MockTransport(handler)) as client:
+            first = await client.get_json("https://example.test/e", cache_ttl=60, backoff_factor=0)
+            second = await client.get_json("https://example.test/e", cache_ttl=60, backoff_factor=0)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second == {"events": []}
+    assert len(attempts) == 2
+
+
+class ThreadRecordingDiskCache(DiskCache):
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, entry):
+        self.threads.append(threading.get_ident())
+        super().set(key, entry)
+
+
+def test_async_client_keeps_disk_cache_io_off_the_event_loop(tmp_path):
+    transport, calls = _counting_transport({"ok": True})
+
+    async def scenario(cache):
+        async with AsyncAPIClient(disk_cache=cache, transport=transport) as client:
+            payload = await client.get_json("https://example.test/e", cache_ttl=60)
+        return payload, threading.get_ident()
+
+    writer = ThreadRecordingDiskCache(tmp_path / "cache.sqlite3")
+    first, first_loop = asyncio.run(scenario(writer))
+    reader = ThreadRecordingDiskCache(tmp_path / "cache.sqlite3")
+    second, second_loop = asyncio.run(scenario(reader))
+
+    assert first == second == {"ok": True}
+    assert len(calls) == 1
+    assert len(writer.threads) == 2 and len(reader.threads) == 1
+    assert not {first_loop, second_loop} & set(writer.threads + reader.threads)
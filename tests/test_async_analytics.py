@@ -0,0 +1,156 @@
+import asyncio
+from datetime import date
+
+from saavygambler.models import Event, PlayerStats, TeamStats
+from saavygambler.providers.base import AsyncSportsDataProvider
+from saavygambler.services.analytics import AsyncAnalyticsService
+from saavygambler.services.entity_store import EntityStore
+
+
+class AsyncStubProvider(AsyncSportsDataProvider):
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def search_teams(self, name):
+        return []
+
+    async def get_events(self, league_id, *, from_date=None):
+        return [Event(f"E{index}", league_id, f"H{index}", f"A{index}", date(2024, 1, 1)) for index in range(3)]
+
+    async def lookup_events(self, event_ids):
+        return []
+
+    async def get_team(self, team_id):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return TeamStats(team_id=team_id, name=f"Team {team_id}", points_for=100, points_against=98)
+
+    async def get_player_stats(self, player_ids):
+        return [PlayerStats(player_id=player_id, name=player_id, points_per_game=10) for player_id in player_ids]
+
+    async def get_odds(self, event_id):
+        return None
+
+
+def test_async_service_gathers_teams_concurrently():
+    provider = AsyncStubProvider()
+    service = AsyncAnalyticsService(provider, store=EntityStore())
+
+    insights = asyncio.run(service.insights_for_league("L1"))
+    projections = asyncio.run(service.fantasy_projections(["P1"]))
+
+    assert [item.home_team.name for item in insights] == ["Team H0", "Team H1", "Team H2"]
+    assert provider.peak > 1
+    assert projections[0].player_id == "P1"
+
+
+def test_stream_endpoint_emits_one_ndjson_line_per_event():
+    import json
+
+    import httpx
+
+    from saavygambler.app import main
+
+    async def service():
+        return AsyncAnalyticsService(AsyncStubProvider(), store=EntityStore())
+
+    async def scenario():
+        main.app.dependency_overrides[main.get_analytics_service] = service
+        try:
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/leagues/L1/insights/stream")
+        finally:
+            main.app.dependency_overrides.clear()
+
+    response = asyncio.run(scenario())
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["event"]["event_id"] for line in lines) == ["E0", "E1", "E2"]
+
+
+def test_batch_endpoint_groups_insights_by_league():
+    import httpx
+
+    from saavygambler.app import main
+
+    async def service():
+        return AsyncAnalyticsService(AsyncStubProvider(), store=EntityStore())
+
+    async def scenario():
+        main.app.dependency_overrides[main.get_analytics_service] = service
+        try:
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post("/insights/batch", json={"league_ids": ["L1"]})
+        finally:
+            main.app.dependency_overrides.clear()
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["results"]["L1"]) == 3
+    assert body["errors"] == {}
+
+
+def test_repeated_requests_share_the_prediction_cache(monkeypatch):
+    import httpx
+
+    from saavygambler.app import main
+    from saavygambler.services import analytics
+    from saavygambler.services.prediction import get_prediction_cache
+
+    monkeypatch.setattr(main, "get_async_provider", AsyncStubProvider)
+    monkeypatch.setattr(analytics, "get_entity_store", EntityStore)
+    get_prediction_cache.cache_clear()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/leagues/L1/insights")
+            after_first = (get_prediction_cache().hits, get_prediction_cache().misses)
+            second = await client.get("/leagues/L1/insights")
+        return first, second, after_first
+
+    try:
+        first, second, (hits, misses) = asyncio.run(scenario())
+        cache = get_prediction_cache()
+        assert first.json() == second.json()
+        # Every team in the stub has the same stats, so one spread and one total are evaluated.
+        assert misses == 2 and cache.misses == 2
+        assert cache.hits == hits + 6
+    finally:
+        get_prediction_cache.cache_clear()
+
+
+def test_lifespan_closes_the_shared_sync_provider(monkeypatch):
+    from functools import lru_cache
+
+    from saavygambler.app import main
+
+    class ClosingProvider:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    @lru_cache()
+    def get_provider():
+        return ClosingProvider()
+
+    monkeypatch.setattr(main, "get_provider", get_provider)
+    provider = get_provider()
+
+    async def scenario():
+        async with main.lifespan(main.app):
+            pass
+
+    asyncio.run(scenario())
+
+    assert provider.closed
+    assert get_provider.cache_info().currsize == 0
@@ -0,0 +1,71 @@
+from datetime import date, datetime
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from saavygambler.models import Event, Odds
+from saavygambler.services.backtest import Backtester, BacktestReport, SeasonData
+from saavygambler.services.ratings import EloParameters
+
+
+def _game(event_id, day, home, away, home_score, away_score):
+    return Event(
+        event_id=event_id,
+        league_id="4328",
+        home_team_id=home,
+        away_team_id=away,
+        event_date=date(2024, 1, day),
+        status="Match Finished",
+        home_score=home_score,
+        away_score=away_score,
+    )
+
+
+def _season():
+    events = [
+        _game("2", 2, "A", "B", 100, 105),
+        _game("1", 1, "A", "B", 110, 100),
+        Event(event_id="3", league_id="4328", home_team_id="B", away_team_id="A", event_date=date(2024, 1, 3)),
+    ]
+    odds = [
+        # Untimed lines may have been published after the game, so game 1 has no bet-time line.
+        Odds("1", -150, 130, -3.0, -110, -110, 200.0, -110, -110),
+        Odds("2", -150, 130, -3.0, -110, -110, 200.0, -110, -110, last_updated=datetime(2024, 1, 1, 18)),
+        Odds("2", -900, 600, -20.0, -110, -110, 230.0, -110, -110, last_updated=datetime(2024, 1, 2, 12)),
+        Odds("2", -900, 600, -20.0, -110, -110, 230.0, -110, -110),
+    ]
+    closing = [Odds("2", -170, 150, -4.0, -110, -110, 204.0, -110, -110)]
+    return SeasonData(events, odds, closing)
+
+
+def test_backtest_prices_each_game_from_earlier_results_only():
+    report = Backtester(min_history=1).run_season(_season(), label="4328/2024")
+
+    assert (report.games, report.unpriced) == (2, 1)
+    # Only game 1 is known before game 2: projected A by 12.5 against A -3, so A is bet and loses.
+    assert (report.spread.bets, report.spread.record, report.spread.profit) == (1, "0-1-0", -1.0)
+    assert report.spread.average_clv == pytest.approx(1.0)
+    assert report.total.record == "1-0-0"
+    assert report.total.roi == pytest.approx(100 / 110)
+    assert report.total.average_clv == pytest.approx(4.0)
+    # Both teams sit on the record fallback, so +130 on B is the value side.
+    assert report.moneyline.record == "1-0-0"
+    assert report.moneyline.profit == pytest.approx(1.3)
+    assert report.moneyline.average_clv == pytest.approx(100 / 250 - 100 / 230)
+    assert report.calibration.samples == 1
+
+
+def test_backtest_runs_seasons_in_parallel_and_combines_reports():
+    seasons = {"4328/2023": _season(), "4328/2024": _season()}
+    backtester = Backtester(min_history=1, elo=EloParameters(), processes=2)
+
+    parallel = backtester.run_many(seasons)
+    serial = {label: backtester.run_season(season, label=label) for label, season in seasons.items()}
+    combined = BacktestReport.combine(parallel.values())
+
+    assert parallel == serial
+    assert (combined.games, combined.unpriced) == (4, 2)
+    assert combined.spread.bets == 2
+    assert combined.calibration.samples == 2
+    assert combined.calibration.brier == parallel["4328/2023"].calibration.brier
@@ -0,0 +1,38 @@
+import json
+
+import httpx
+import pytest
+
+from saavygambler.providers.api_client import APIClient
+from saavygambler.providers.codec import available_backends, get_decoder
+from saavygambler.providers.rate_limit import TokenBucket
+
+
+def test_get_decoder_resolves_backends():
+    assert get_decoder("json") is json.loads
+    assert "json" in available_backends()
+    assert get_decoder("auto")(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+def test_client_caches_raw_bytes_and_decodes_once():
+    body = b'{"teams": [{"idTeam": "1", "strTeam": "Alpha"}]}'
+    client = APIClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body)),
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+        json_backend="json",
+    )
+
+    first = client.get_json("https://example.test/lookupteam.php", cache_ttl=60)
+    second = client.get_json("https://example.test/lookupteam.php", cache_ttl=60)
+    name = client.get_json(
+        "https://example.test/lookupteam.php",
+        cache_ttl=60,
+        decoder=lambda raw: json.loads(raw)["teams"][0]["strTeam"],
+    )
+
+    assert second is first
+    assert name == "Alpha"
+    assert client.metrics.parse_count == 2
+    assert client.metrics.parse_seconds >= 0
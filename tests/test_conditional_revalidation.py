@@ -0,0 +1,72 @@
+import time
+
+import httpx
+import pytest
+
+from saavygambler.providers.api_client import APIClient
+from saavygambler.providers.rate_limit import TokenBucket
+
+URL = "https://example.test/eventsnextleague.php"
+
+
+def test_expired_entry_is_revalidated_with_etag():
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"events": [{"idEvent": "1"}]}, headers={"ETag": '"v1"'})
+
+    client = APIClient(
+        transport=httpx.MockTransport(handler),
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+    )
+    first = client.get_json(URL, cache_ttl=0.01)
+    time.sleep(0.02)
+    second = client.get_json(URL, cache_ttl=0.01)
+
+    assert second is first
+    assert seen_headers == [None, '"v1"']
+    assert client.metrics.not_modified == 1
+    assert client.metrics.bytes_saved > 0
+
+
+def test_always_revalidate_asks_upstream_even_for_fresh_entries():
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"events": []}, headers={"ETag": '"v1"'})
+
+    client = APIClient(
+        transport=httpx.MockTransport(handler),
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+        always_revalidate=True,
+    )
+    first = client.get_json(URL, cache_ttl=300, stale_while_revalidate=60)
+    second = client.get_json(URL, cache_ttl=300, stale_while_revalidate=60)
+
+    assert second is first
+    assert seen_headers == [None, '"v1"']
+    assert client.metrics.not_modified == 1
+
+
+def test_unexpected_not_modified_is_an_error_and_never_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(304)
+
+    client = APIClient(
+        transport=httpx.MockTransport(handler),
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+    )
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get_json(URL, cache_ttl=300)
+
+    assert len(calls) == 2
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from saavygambler.providers.decoding import FieldSpec, RecordDecoder, parse_date, to_float, to_int
+
+
+@dataclass
+class Row:
+    key: str
+    count: Optional[int] = None
+    ratio: Optional[float] = None
+    day: Optional[date] = None
+
+
+def test_record_decoder_maps_and_converts_fields():
+    decoder = RecordDecoder(
+        Row,
+        [
+            FieldSpec("key", "id", default=""),
+            FieldSpec("count", "n", to_int),
+            FieldSpec("ratio", "r", to_float),
+            FieldSpec("day", "d", lambda value: parse_date(value) if value else None),
+        ],
+    )
+
+    rows = decoder.decode_many([{"id": "a", "n": "3", "r": "0.5", "d": "2024-05-01"}, {"n": "x", "r": ""}])
+
+    assert rows == [Row("a", 3, 0.5, date(2024, 5, 1)), Row("", None, None, None)]
+    assert decoder.decode_many(None) == []
+
+
+def test_parse_date_caches_and_rejects_garbage():
+    parse_date.cache_clear()
+
+    assert parse_date("2024-01-10") is parse_date("2024-01-10")
+    assert parse_date("not-a-date") is None
+    assert parse_date.cache_info().hits == 1
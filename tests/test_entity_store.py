@@ -0,0 +1,77 @@
+from datetime import date
+
+from saavygambler.models import Event, TeamStats
+from saavygambler.services.entity_store import EntityStore
+from saavygambler.services.stat_collector import StatCollector
+
+
+def test_put_keeps_one_canonical_instance_and_versions_changes():
+    store = EntityStore()
+    first = store.put("team", TeamStats(team_id="1", name="Alpha", wins=3))
+    start = store.version
+
+    same = store.put("team", TeamStats(team_id="1", name="Alpha", wins=3))
+    assert same is first
+    assert store.changed_since(start) == []
+
+    updated = store.put("team", TeamStats(team_id="1", name="Alpha", wins=4))
+    assert updated is first and first.wins == 4
+    assert store.changed_since(start) == [("team", "1", first)]
+    assert store.version_of("team", "1") == store.version
+
+
+def test_entries_expire_after_max_age():
+    now = [0.0]
+    store = EntityStore(max_age=10, clock=lambda: now[0])
+    store.put("team", TeamStats(team_id="1", name="Alpha"))
+
+    now[0] = 11.0
+
+    assert store.get("team", "1") is None
+    assert store.get("team", "1", max_age=None) is not None
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def get_team(self, team_id):
+        self.calls.append(("team", team_id))
+        return TeamStats(team_id=team_id, name=f"Team {team_id}")
+
+    def lookup_events(self, event_ids):
+        self.calls.append(("events", tuple(event_ids)))
+        return [Event(event_id, "L", "1", "2", date(2024, 1, 1)) for event_id in event_ids]
+
+
+def test_collector_answers_repeat_lookups_from_store():
+    provider = CountingProvider()
+    collector = StatCollector(provider, EntityStore())
+
+    team = collector.team("7")
+    assert collector.team("7") is team
+    collector.lookup_events(["E1", "E2"])
+    events = collector.lookup_events(["E2", "E3"])
+
+    assert [event.event_id for event in events] == ["E2", "E3"]
+    assert provider.calls == [("team", "7"), ("events", ("E1", "E2")), ("events", ("E3",))]
+
+
+def test_store_evicts_least_recently_used_and_expired_entries():
+    now = [0.0]
+    store = EntityStore(max_age=10, max_entries=2, clock=lambda: now[0])
+    store.put("team", TeamStats(team_id="1", name="Alpha"))
+    store.put("team", TeamStats(team_id="2", name="Beta"))
+    store.get("team", "1")
+    store.put("team", TeamStats(team_id="3", name="Gamma"))
+
+    assert store.get("team", "2") is None and len(store) == 2
+    assert store.stats.evictions == 1
+
+    now[0] = 5.0
+    store.put("team", TeamStats(team_id="3", name="Gamma"))
+    now[0] = 12.0
+    assert store.purge_expired() == 1
+    assert store.get("team", "1", max_age=None) is None
+    assert store.snapshot("team", "3") == store.get("team", "3")
+    assert store.snapshot("team", "3") is not store.get("team", "3")
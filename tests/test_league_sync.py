@@ -0,0 +1,42 @@
+from dataclasses import replace
+from datetime import date
+
+from saavygambler.models import Event
+from saavygambler.services.entity_store import EntityStore
+from saavygambler.services.league_sync import ADDED, REMOVED, UPDATED, LeagueSync
+
+
+class FeedProvider:
+    def __init__(self, events):
+        self.events = events
+
+    def get_events(self, league_id, *, from_date=None):
+        return [replace(event) for event in self.events]
+
+
+def _event(event_id, **overrides):
+    return replace(Event(event_id, "L1", "1", "2", date(2024, 5, 1), status="Scheduled"), **overrides)
+
+
+def test_poll_reports_added_updated_and_removed_events():
+    provider = FeedProvider([_event("E1"), _event("E2")])
+    sync = LeagueSync(provider, store=EntityStore())
+    received = []
+    sync.subscribe(received.extend)
+
+    first = sync.poll("L1")
+    assert [(change.kind, change.event.event_id) for change in first] == [(ADDED, "E1"), (ADDED, "E2")]
+    assert sync.poll("L1") == []
+
+    provider.events = [_event("E1", home_score=3, status="Final"), _event("E3")]
+    second = sync.poll("L1")
+
+    assert [(change.kind, change.event.event_id) for change in second] == [
+        (UPDATED, "E1"),
+        (ADDED, "E3"),
+        (REMOVED, "E2"),
+    ]
+    assert second[0].changed_fields == ("status", "home_score")
+    assert second[0].previous.status == "Scheduled"
+    assert sync.changes_since(first[-1].sequence) == second
+    assert len(received) == 5
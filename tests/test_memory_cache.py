@@ -0,0 +1,47 @@
+import time
+
+from saavygambler.providers.cache import CachedResponse, MemoryCache
+
+
+def _entry(*, size=10, expires_in=None, timestamp=None):
+    return CachedResponse(
+        status_code=200,
+        headers={},
+        body=b" " * size,
+        timestamp=time.time() if timestamp is None else timestamp,
+        expires_in=expires_in,
+    )
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2, max_bytes=None)
+    cache.set("a", _entry())
+    cache.set("b", _entry())
+    assert cache.get("a") is not None
+    cache.set("c", _entry())
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_enforces_byte_budget():
+    cache = MemoryCache(max_entries=100, max_bytes=25)
+    for key in ("a", "b", "c"):
+        cache.set(key, _entry(size=10))
+
+    assert len(cache) == 2
+    assert cache.total_bytes == 20
+
+
+def test_memory_cache_sweeps_expired_entries_and_counts_lookups():
+    cache = MemoryCache(max_entries=10, max_bytes=None)
+    cache.set("stale", _entry(expires_in=1.0, timestamp=time.time() - 5))
+    cache.set("fresh", _entry(expires_in=60.0))
+
+    assert cache.get("fresh") is not None
+    assert "stale" not in cache
+    assert cache.get("stale") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.expirations == 1
@@ -1,7 +1,10 @@
+import math
 from datetime import date
 
-from saavygambler.models import Event, TeamStats
-from saavygambler.services.prediction import PredictionEngine
+import pytest
+
+from saavygambler.models import Event, Odds, TeamStats
+from saavygambler.services.prediction import MatchupColumns, PredictionCache, PredictionEngine
 
 
 def test_predict_spread_uses_basic_stats():
@@ -38,3 +41,63 @@ def test_predict_moneyline_handles_small_sample():
     prediction = engine.predict_moneyline(event, home, away)
     assert 0 < prediction.home_win_probability < 1
     assert prediction.away_win_probability == 1 - prediction.home_win_probability
+
+
+def test_prediction_cache_reuses_results_until_inputs_change():
+    cache = PredictionCache(max_entries=2)
+    engine = PredictionEngine(cache=cache)
+    uncached = PredictionEngine()
+    first = Event(event_id="1", league_id="123", home_team_id="H", away_team_id="A", event_date=date.today())
+    second = Event(event_id="2", league_id="123", home_team_id="H", away_team_id="A", event_date=date.today())
+    home = TeamStats(team_id="H", name="Home", points_for=110, points_against=100)
+    away = TeamStats(team_id="A", name="Away", points_for=100, points_against=105)
+    odds = Odds("1", -150, 130, -3.5, -110, -110, 215.5, -110, -110)
+
+    assert engine.predict_spread(first, home, away, odds) == uncached.predict_spread(first, home, away, odds)
+    repeat = engine.predict_spread(second, home, away, odds)
+    assert repeat.event_id == "2"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    home.points_for = 115
+    changed = engine.predict_spread(first, home, away, odds)
+    assert changed == uncached.predict_spread(first, home, away, odds)
+    engine.home_advantage = 0.0
+    engine.predict_spread(first, home, away, odds)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_batch_predictions_match_scalar_methods():
+    pytest.importorskip("numpy")
+    engine = PredictionEngine(home_advantage=3.0)
+    event = Event(event_id="1", league_id="123", home_team_id="H", away_team_id="A", event_date=date.today())
+    teams = [
+        TeamStats(team_id="1", name="One", points_for=112.5, points_against=101.25, wins=30, losses=12),
+        TeamStats(team_id="2", name="Two", points_for=98, points_against=None, wins=3, losses=1),
+        TeamStats(team_id="3", name="Three"),
+    ]
+    matchups = [
+        (teams[0], teams[1], Odds("1", -150, 130, -3.5, -110, -110, 215.5, -110, -110)),
+        (teams[1], teams[2], Odds("1", None, 120, None, None, None, 199.0, None, None)),
+        (teams[2], teams[0], None),
+    ]
+
+    columns = MatchupColumns.from_matchups(matchups)
+    spreads = engine.predict_spreads(columns)
+    totals = engine.predict_totals(columns)
+    moneylines = engine.predict_moneylines(columns)
+
+    for index, (home, away, odds) in enumerate(matchups):
+        spread = engine.predict_spread(event, home, away, odds)
+        total = engine.predict_total(event, home, away, odds)
+        moneyline = engine.predict_moneyline(event, home, away, odds)
+        assert (spreads.spread[index], spreads.confidence[index]) == (spread.spread, spread.confidence)
+        assert (totals.total[index], totals.confidence[index]) == (total.total, total.confidence)
+        assert moneylines.home_win_probability[index] == moneyline.home_win_probability
+        assert moneylines.away_win_probability[index] == moneyline.away_win_probability
+    assert moneylines.edge_vs_market[0] == engine.predict_moneyline(event, *matchups[0]).edge_vs_market
+    assert math.isnan(moneylines.edge_vs_market[1])
+
+    pairs = MatchupColumns.pairwise(teams)
+    assert len(pairs) == 6
+    assert engine.predict_spreads(pairs).spread[1] == engine.predict_spread(event, teams[0], teams[2]).spread
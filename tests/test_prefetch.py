@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+
+from saavygambler.models import Event, TeamStats
+from saavygambler.services.entity_store import EntityStore
+from saavygambler.services.prefetch import (
+    FAILURE_RETRY_SECONDS,
+    TEAM,
+    TEAM_REFRESH_SECONDS,
+    PrefetchScheduler,
+    odds_refresh_interval,
+)
+
+TODAY = date(2024, 5, 1)
+
+
+class RecordingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def get_events(self, league_id, *, from_date=None):
+        self.calls.append(("events", league_id))
+        return [
+            Event("soon", league_id, "A", "B", TODAY),
+            Event("later", league_id, "C", "A", TODAY + timedelta(days=5)),
+            Event("far", league_id, "D", "E", TODAY + timedelta(days=30)),
+        ]
+
+    def get_team(self, team_id):
+        self.calls.append(("team", team_id))
+        return TeamStats(team_id=team_id, name=team_id)
+
+    def get_odds(self, event_id):
+        self.calls.append(("odds", event_id))
+        return None
+
+
+def test_scheduler_warms_upcoming_events_nearest_kickoff_first():
+    now = [0.0]
+    provider = RecordingProvider()
+    store = EntityStore()
+    scheduler = PrefetchScheduler(
+        provider, ["L1"], store=store, concurrency=1, clock=lambda: now[0], today=lambda: TODAY
+    )
+
+    assert scheduler.run_once() == 1
+    assert scheduler.run_once() == 5
+
+    assert provider.calls[1:] == [("odds", "soon"), ("team", "A"), ("team", "B"), ("odds", "later"), ("team", "C")]
+    assert store.get("team", "C") is not None
+
+    now[0] = odds_refresh_interval(0)
+    provider.calls.clear()
+    scheduler.run_once()
+    assert provider.calls == [("odds", "soon")]
+
+
+def test_run_until_idle_drains_fixtures_and_the_work_they_queue():
+    provider = RecordingProvider()
+    scheduler = PrefetchScheduler(provider, ["L1"], concurrency=1, clock=lambda: 0.0, today=lambda: TODAY)
+
+    assert scheduler.run_until_idle() == 6
+    assert scheduler.run_once() == 0
+    assert scheduler.stats.runs == 2
+
+
+def test_team_tasks_retire_once_their_events_have_passed():
+    now, today = [0.0], [TODAY]
+    provider = RecordingProvider()
+    scheduler = PrefetchScheduler(provider, ["L1"], concurrency=1, clock=lambda: now[0], today=lambda: today[0])
+    scheduler.run_until_idle()
+    assert scheduler.stats.queued == 6
+
+    today[0] = TODAY + timedelta(days=6)
+    now[0] = TEAM_REFRESH_SECONDS
+    scheduler.run_until_idle()
+
+    # Only the league itself is still scheduled.
+    assert scheduler.stats.queued == 1
+
+
+class FlakyTeamProvider(RecordingProvider):
+    def get_team(self, team_id):
+        if team_id == "A":
+            raise RuntimeError("upstream down")
+        return super().get_team(team_id)
+
+
+def test_failed_team_refreshes_back_off_up_to_the_team_interval():
+    now = [0.0]
+    scheduler = PrefetchScheduler(
+        FlakyTeamProvider(), ["L1"], concurrency=1, clock=lambda: now[0], today=lambda: TODAY
+    )
+    scheduler.run_until_idle()
+
+    delays = []
+    for _ in range(3):
+        due_at = scheduler._scheduled[(TEAM, "A")].due_at
+        delays.append(due_at - now[0])
+        now[0] = due_at
+        scheduler.run_once()
+
+    assert delays == [FAILURE_RETRY_SECONDS, 2 * FAILURE_RETRY_SECONDS, 4 * FAILURE_RETRY_SECONDS]
+    assert scheduler.stats.failures == 4
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+from saavygambler.models import Odds, PlayerStats, TeamStats
+from saavygambler.providers.base import AsyncSportsDataProvider, SportsDataProvider
+
+
+class CountingProvider(SportsDataProvider):
+    def __init__(self) -> None:
+        self.team_calls = []
+        self._lock = threading.Lock()
+
+    def search_teams(self, name):
+        return []
+
+    def get_events(self, league_id, *, from_date=None):
+        return []
+
+    def lookup_events(self, event_ids):
+        return []
+
+    def get_team(self, team_id):
+        with self._lock:
+            self.team_calls.append(team_id)
+        if team_id == "broken":
+            raise RuntimeError("boom")
+        if team_id == "missing":
+            return None
+        return TeamStats(team_id=team_id, name=f"Team {team_id}")
+
+    def get_player_stats(self, player_ids):
+        return [PlayerStats(player_id=player_id, name=player_id) for player_id in player_ids]
+
+    def get_odds(self, event_id):
+        return Odds(event_id, -110, -110, None, None, None, None, None, None) if event_id != "E2" else None
+
+
+def test_default_batch_methods_deduplicate_and_skip_failures():
+    provider = CountingProvider()
+
+    teams = provider.get_teams(["1", "2", "1", "missing", "broken", "2", ""])
+
+    assert list(teams) == ["1", "2"]
+    assert sorted(provider.team_calls) == ["1", "2", "broken", "missing"]
+    assert list(provider.get_odds_many(["E1", "E2", "E1"])) == ["E1"]
+    assert provider.lookup_players_many(["P1", "P2"])["P2"].name == "P2"
+
+
+class AsyncCountingProvider(AsyncSportsDataProvider):
+    async def search_teams(self, name):
+        return []
+
+    async def get_events(self, league_id, *, from_date=None):
+        return []
+
+    async def lookup_events(self, event_ids):
+        return []
+
+    async def get_team(self, team_id):
+        await asyncio.sleep(0)
+        return TeamStats(team_id=team_id, name=f"Team {team_id}")
+
+    async def get_player_stats(self, player_ids):
+        return []
+
+    async def get_odds(self, event_id):
+        return None
+
+
+def test_async_default_get_teams_returns_mapping():
+    teams = asyncio.run(AsyncCountingProvider().get_teams(["A", "B", "A"]))
+
+    assert {team_id: team.name for team_id, team in teams.items()} == {"A": "Team A", "B": "Team B"}
@@ -0,0 +1,78 @@
+import httpx
+import pytest
+
+from saavygambler.config import AppSettings
+from saavygambler.providers import rate_limit
+from saavygambler.providers.api_client import APIClient
+from saavygambler.providers.rate_limit import TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock.now += 5
+    bucket.pause(3.0)
+    assert bucket.reserve() == pytest.approx(3.0)
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_client_retries_throttled_and_server_errors():
+    statuses = [429, 503, 200]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses[len(seen)]
+        seen.append(status)
+        headers = {"Retry-After": "0"} if status == 429 else {}
+        return httpx.Response(status, json={"ok": status == 200}, headers=headers)
+
+    limiter = TokenBucket(rate=1000, burst=1000)
+    client = APIClient(transport=httpx.MockTransport(handler), rate_limiter=limiter)
+
+    assert client.get_json("https://example.test/x", backoff_factor=0) == {"ok": True}
+    assert seen == [429, 503, 200]
+
+
+def test_client_raises_when_retries_exhausted():
+    client = APIClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_json("https://example.test/x", max_retries=1, backoff_factor=0)
+
+
+def test_default_rate_limit_is_on_and_zero_opts_out(monkeypatch):
+    settings = AppSettings()
+    monkeypatch.setattr(rate_limit, "get_settings", lambda: settings)
+    rate_limit.get_rate_limiter.cache_clear()
+    try:
+        limiter = rate_limit.get_rate_limiter()
+        assert isinstance(limiter, TokenBucket)
+        # The default burst plus a minute of refill stays within 30 requests a minute.
+        assert limiter.burst + 60 * limiter.rate <= 30
+
+        settings.rate_limit_per_second = 0
+        rate_limit.get_rate_limiter.cache_clear()
+        assert rate_limit.get_rate_limiter() is None
+    finally:
+        rate_limit.get_rate_limiter.cache_clear()
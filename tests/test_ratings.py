@@ -0,0 +1,157 @@
+import json
+from datetime import date
+
+import pytest
+
+from saavygambler import cli
+from saavygambler.models import Event, TeamStats
+from saavygambler.services.prediction import MatchupColumns, PredictionEngine
+from saavygambler.services.ratings import EloParameters, EloRatings
+
+
+def _result(event_id, home, away, home_score, away_score, status="Match Finished", day=1):
+    return Event(
+        event_id=event_id,
+        league_id="4328",
+        home_team_id=home,
+        away_team_id=away,
+        event_date=date(2024, 1, day),
+        status=status,
+        home_score=home_score,
+        away_score=away_score,
+    )
+
+
+def test_elo_applies_each_final_result_once_with_margin_of_victory():
+    ratings = EloRatings(EloParameters(home_advantage=0.0))
+    summary = ratings.update_many(
+        [
+            _result("1", "A", "B", 3, 0),
+            _result("1", "A", "B", 3, 0),
+            _result("2", "C", "D", 1, 0),
+            _result("3", "A", "C", None, None, status="Not Started"),
+        ]
+    )
+
+    assert (summary.applied, summary.late) == (2, 0)
+    assert ratings.processed == 2
+    assert ratings.rating("A") > ratings.rating("C") > 1500.0 > ratings.rating("D") > ratings.rating("B")
+    assert ratings.rating("A") + ratings.rating("B") == 3000.0
+    assert ratings.games("A") == 1 and ratings.games("E") == 0
+
+
+def test_elo_checkpoint_resumes_without_replaying(tmp_path):
+    path = tmp_path / "ratings.json"
+    ratings = EloRatings(checkpoint_path=path, checkpoint_interval=2)
+    ratings.update_many([_result("1", "A", "B", 2, 1), _result("2", "B", "A", 0, 0)])
+    assert path.exists()
+
+    resumed = EloRatings.load(path)
+    assert resumed.ratings == ratings.ratings
+    assert not resumed.update(_result("1", "A", "B", 2, 1))
+    assert EloRatings.load(path, EloParameters(k_factor=40.0)).processed == 0
+
+
+def test_predict_moneyline_uses_elo_ratings():
+    ratings = EloRatings()
+    ratings.update_many(_result(str(index), "H", "A", 5, 1) for index in range(10))
+    engine = PredictionEngine(ratings=ratings)
+    event = Event(event_id="next", league_id="4328", home_team_id="H", away_team_id="A", event_date=date.today())
+    home = TeamStats(team_id="H", name="Home")
+    away = TeamStats(team_id="A", name="Away")
+
+    prediction = engine.predict_moneyline(event, home, away)
+
+    assert prediction.home_win_probability == ratings.home_win_probability("H", "A")
+    assert prediction.home_win_probability > EloRatings().home_win_probability("H", "A") > 0.5
+    assert prediction.away_win_probability == 1 - prediction.home_win_probability
+
+
+def test_elo_watermark_skips_replayed_and_stale_results(tmp_path):
+    path = tmp_path / "ratings.json"
+    ratings = EloRatings(checkpoint_path=path)
+    played = [_result("1", "A", "B", 2, 1, day=1), _result("2", "A", "B", 2, 1, day=3)]
+    ratings.update_many(played, season="2024")
+
+    assert not ratings.update(_result("3", "B", "A", 1, 0, day=2))
+    assert ratings.update(_result("4", "B", "A", 1, 0, day=3))
+    ratings.save()
+
+    state = json.loads(path.read_text())
+    assert (state["season"], state["watermark"], state["season_ids"]) == ("2024", "2024-01-03", ["1", "2", "4"])
+    resumed = EloRatings.load(path)
+    summary = resumed.update_many([played[0], played[1], _result("5", "A", "B", 1, 0, day=4)], season="2024")
+    assert (summary.applied, summary.late) == (1, 0)
+
+
+def test_elo_applies_out_of_order_streams_by_date_and_reports_late_results(caplog):
+    stream = [
+        _result("3", "A", "B", 1, 0, day=3),
+        _result("1", "A", "B", 0, 4, day=1),
+        _result("2", "B", "A", 2, 2, day=2),
+    ]
+    ordered = EloRatings()
+    for event in sorted(stream, key=lambda event: event.event_date):
+        ordered.update(event)
+
+    shuffled = EloRatings()
+    assert shuffled.update_many(stream, season="2024").applied == 3
+    assert shuffled.ratings == ordered.ratings
+
+    with caplog.at_level("WARNING", logger="saavygambler.services.ratings"):
+        summary = shuffled.update_many([*stream, _result("late", "B", "A", 1, 0, day=2)], season="2024")
+
+    assert (summary.applied, summary.late) == (0, 1)
+    assert shuffled.ratings == ordered.ratings
+    assert any("late" in message and "watermark" in message for message in caplog.messages)
+
+
+def test_ratings_command_resumes_from_checkpointed_season(tmp_path, monkeypatch, capsys):
+    fetched = []
+
+    class SeasonProvider:
+        def list_seasons(self, league_id):
+            return ["2022", "2023", "2024"]
+
+        def iter_season_events(self, league_id, seasons):
+            (season,) = seasons
+            fetched.append(season)
+            day = {"2022": 1, "2023": 10, "2024": 20}[season]
+            return iter([_result(season, "A", "B", 3, 1, day=day)])
+
+    monkeypatch.setattr(cli, "TheSportsDBProvider", SeasonProvider)
+    checkpoint = tmp_path / "ratings.json"
+    ratings = EloRatings(checkpoint_path=checkpoint)
+    ratings.update_many([_result("2022", "A", "B", 3, 1, day=1)], season="2022")
+    ratings.update_many([_result("2023", "A", "B", 3, 1, day=10)], season="2023")
+    ratings.save()
+
+    assert cli.main(["ratings", "4328", "--checkpoint", str(checkpoint)]) == 0
+
+    assert fetched == ["2023", "2024"]
+    output = json.loads(capsys.readouterr().out)
+    assert (output["applied"], output["late"]) == (1, 0)
+    assert EloRatings.load(checkpoint).season == "2024"
+
+
+def test_batch_moneylines_use_elo_ratings_like_the_scalar_method():
+    pytest.importorskip("numpy")
+    ratings = EloRatings()
+    ratings.update_many(_result(str(index), "H", "A", 5, 1, day=index + 1) for index in range(5))
+    engine = PredictionEngine(ratings=ratings)
+    event = Event(event_id="next", league_id="4328", home_team_id="H", away_team_id="A", event_date=date.today())
+    teams = [TeamStats(team_id="H", name="Home"), TeamStats(team_id="A", name="Away")]
+
+    columns = MatchupColumns.pairwise(teams)
+    batch = engine.predict_moneylines(columns)
+    scalar = [engine.predict_moneyline(event, home, away) for home, away in (teams, teams[::-1])]
+
+    assert batch.home_win_probability.tolist() == [prediction.home_win_probability for prediction in scalar]
+    assert engine.predict_moneylines(columns, exact=False).home_win_probability == pytest.approx(
+        batch.home_win_probability
+    )
+    anonymous = MatchupColumns(
+        columns.home_points_for, columns.home_points_against, columns.away_points_for, columns.away_points_against
+    )
+    with pytest.raises(ValueError):
+        engine.predict_moneylines(anonymous)
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from saavygambler.models import TeamStats
+from saavygambler.providers.router import RoutingProvider
+
+
+class StubBackend:
+    def __init__(self, label, *, latency=0.0, fail=False):
+        self.label = label
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+
+    def get_team(self, team_id):
+        self.calls += 1
+        time.sleep(self.latency)
+        if self.fail:
+            raise RuntimeError(f"{self.label} down")
+        return TeamStats(team_id=team_id, name=self.label)
+
+
+def test_slow_primary_is_hedged_to_secondary():
+    primary = StubBackend("primary", latency=0.5)
+    secondary = StubBackend("secondary", latency=0.01)
+    router = RoutingProvider([primary, secondary], initial_hedge_delay=0.05)
+
+    started = time.perf_counter()
+    team = router.get_team("1")
+    elapsed = time.perf_counter() - started
+    router.close()
+
+    assert team.name == "secondary"
+    assert elapsed < 0.4
+    assert primary.calls == secondary.calls == 1
+
+
+def test_failing_backend_fails_over_and_trips_circuit():
+    primary = StubBackend("primary", fail=True)
+    secondary = StubBackend("secondary")
+    router = RoutingProvider(
+        [primary, secondary], names=["primary", "secondary"], failure_threshold=1, reset_timeout=60
+    )
+
+    names = [router.get_team(str(index)).name for index in range(5)]
+    stats = {entry.name: entry for entry in router.backend_stats()}
+    router.close()
+
+    assert names == ["secondary"] * 5
+    assert primary.calls == 1
+    assert stats["primary"].circuit == "open"
+    assert stats["secondary"].circuit == "closed" and stats["secondary"].calls == 5
+
+
+def test_circuit_state_is_read_under_the_backend_lock():
+    router = RoutingProvider([StubBackend("primary")], failure_threshold=1, reset_timeout=60)
+    backend = router._backends[0]
+    states = []
+
+    with backend.lock:
+        backend.opened_at = time.monotonic()
+        reader = threading.Thread(target=lambda: states.append(router._circuit_state(backend)))
+        reader.start()
+        reader.join(0.05)
+        assert reader.is_alive() and not states
+        backend.opened_at = None
+    reader.join()
+    router.close()
+
+    assert states == ["closed"]
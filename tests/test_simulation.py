@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from saavygambler.models import Odds, TeamStats
+from saavygambler.services.prediction import MatchupColumns, PredictionEngine
+from saavygambler.services.simulation import POISSON, GameSimulator
+
+
+def _matchups():
+    strong = TeamStats(team_id="S", name="Strong", points_for=118, points_against=102)
+    weak = TeamStats(team_id="W", name="Weak", points_for=101, points_against=114)
+    odds = Odds("1", -200, 170, -6.5, -110, -110, 221.5, -110, -110)
+    return [(strong, weak, odds), (weak, strong, None)]
+
+
+def test_simulation_is_reproducible_across_process_counts():
+    columns = MatchupColumns.from_matchups(_matchups())
+    serial = GameSimulator(simulations=5_000, chunk_size=1_000, seed=42).simulate(columns)
+    pooled = GameSimulator(simulations=5_000, chunk_size=1_000, seed=42, processes=2).simulate(columns)
+    other = GameSimulator(simulations=5_000, chunk_size=1_000, seed=7).simulate(columns)
+
+    assert serial.margins.shape == (2, 5_000)
+    np.testing.assert_array_equal(serial.margins, pooled.margins)
+    np.testing.assert_array_equal(serial.totals, pooled.totals)
+    assert not np.array_equal(serial.margins, other.margins)
+
+
+def test_simulated_distribution_is_centred_on_predictions():
+    engine = PredictionEngine()
+    simulator = GameSimulator(engine, simulations=20_000, seed=1)
+    columns = MatchupColumns.from_matchups(_matchups())
+    result = simulator.simulate(columns)
+    spread = engine.predict_spreads(columns).spread
+    total = engine.predict_totals(columns).total
+
+    win = result.home_win_probability()
+    assert win[0] > 0.5 > win[1]
+    np.testing.assert_allclose(result.cover_probability(-spread), 0.5, atol=0.03)
+    np.testing.assert_allclose(result.over_probability(total), 0.5, atol=0.03)
+    covers = result.cover_probability([-6.5, 3.0])
+    pushes = result.push_probability([-6.5, 3.0])
+    assert pushes[0] == 0.0 and pushes[1] > 0.0
+    assert covers[0] < result.home_win_probability()[0]
+    quantiles = result.margin_quantiles([0.1, 0.5, 0.9])
+    assert quantiles.shape == (2, 3)
+    assert np.all(np.diff(quantiles, axis=1) >= 0)
+
+
+def test_poisson_scores_for_low_scoring_sports():
+    result = GameSimulator(distribution=POISSON, simulations=20_000, seed=3).simulate_scores([1.6], [1.1])
+
+    assert result.totals.min() >= 0
+    np.testing.assert_allclose(result.totals.mean(), 2.7, atol=0.05)
+    assert 0.0 < result.under_probability(2.5)[0] < 1.0
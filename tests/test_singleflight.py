@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from saavygambler.providers.api_client import APIClient, AsyncAPIClient
+
+
+def test_concurrent_threads_share_one_request():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        time.sleep(0.2)
+        return httpx.Response(200, json={"teams": []})
+
+    client = APIClient(transport=httpx.MockTransport(handler))
+    barrier = threading.Barrier(5)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(client.get_json("https://example.test/lookupteam.php", params={"id": "7"}))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [{"teams": []}] * 5
+    assert len(calls) == 1
+    assert client.coalesced_requests == 4
+
+
+def test_concurrent_tasks_share_one_request():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"events": []})
+
+    async def scenario():
+        async with AsyncAPIClient(transport=httpx.MockTransport(handler)) as client:
+            return await asyncio.gather(
+                *(client.get_json("https://example.test/lookupevent.php", params={"id": "1"}) for _ in range(10))
+            )
+
+    results = asyncio.run(scenario())
+
+    assert results == [{"events": []}] * 10
+    assert len(calls) == 1
+
+
+def test_requests_with_different_headers_are_not_coalesced():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("authorization"))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"user": request.headers.get("authorization")})
+
+    async def scenario():
+        async with AsyncAPIClient(transport=httpx.MockTransport(handler)) as client:
+            url = "https://example.test/lookupevent.php"
+            return await asyncio.gather(
+                client.get_json(url, headers={"Authorization": "alice"}),
+                client.get_json(url, headers={"authorization": "alice"}),
+                client.get_json(url, headers={"Authorization": "bob"}),
+            )
+
+    results = asyncio.run(scenario())
+
+    assert [result["user"] for result in results] == ["alice", "alice", "bob"]
+    assert sorted(calls) == ["alice", "bob"]
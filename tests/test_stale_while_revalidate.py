@@ -0,0 +1,52 @@
+import json
+import time
+
+import httpx
+
+from saavygambler.providers.api_client import APIClient
+from saavygambler.providers.cache import CachedResponse, MemoryCache
+from saavygambler.providers.rate_limit import TokenBucket
+
+URL = "https://example.test/lookupteam.php"
+
+
+def _client_with_stale_entry(handler):
+    cache = MemoryCache()
+    client = APIClient(
+        memory_cache=cache,
+        transport=httpx.MockTransport(handler),
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+    )
+    cache.set(
+        client._cache_key(URL, None),
+        CachedResponse(200, {}, b'{"version": "old"}', timestamp=time.time() - 70, expires_in=60, retain_for=120),
+    )
+    return client
+
+
+def test_stale_entry_is_served_while_refresh_runs_in_background():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"version": "new"})
+
+    client = _client_with_stale_entry(handler)
+
+    stale = client.get_json(URL, cache_ttl=60, stale_while_revalidate=30)
+    client.close()  # waits for the background refresh to finish
+
+    assert stale == {"version": "old"}
+    assert len(calls) == 1
+    assert json.loads(client._cache.get(client._cache_key(URL, None)).body) == {"version": "new"}
+
+
+def test_stale_entry_is_served_when_upstream_fails():
+    def handler(request):
+        return httpx.Response(500)
+
+    client = _client_with_stale_entry(handler)
+
+    data = client.get_json(URL, cache_ttl=60, stale_if_error=300, max_retries=0)
+
+    assert data == {"version": "old"}
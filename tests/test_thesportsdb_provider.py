@@ -1,4 +1,6 @@
+import asyncio
 import sys
+import time
 import types
 from datetime import date
 
@@ -33,7 +35,7 @@ sys.modules.setdefault("httpx", httpx_stub)
 from unittest import mock
 
 from saavygambler.models import Event
-from saavygambler.providers.thesportsdb import BASE_URL, TheSportsDBProvider
+from saavygambler.providers.thesportsdb import BASE_URL, AsyncTheSportsDBProvider, TheSportsDBProvider
 
 
 class DummyClient:
@@ -110,27 +112,26 @@ def test_get_events_includes_team_names():
     assert event.event_date == date(2024, 2, 1)
 
 
-def test_get_events_handles_invalid_dates_gracefully():
+def test_get_events_skips_and_logs_events_without_a_valid_date(caplog):
     league_payload = {
         "events": [
-            {
-                "idEvent": "9999",
-                "idLeague": "555",
-                "idHomeTeam": "100",
-                "idAwayTeam": "200",
-                "dateEvent": "not-a-date",
-                "strHomeTeam": "Alpha",
-                "strAwayTeam": "Beta",
-            }
+            {"idEvent": "9999", "idHomeTeam": "100", "idAwayTeam": "200", "dateEvent": "not-a-date"},
+            {"idEvent": "9998", "idHomeTeam": "100", "idAwayTeam": "200"},
+            {"idEvent": "9997", "idHomeTeam": "100", "idAwayTeam": "200", "dateEvent": "2024-02-01"},
         ]
     }
     provider = TheSportsDBProvider(client=DummyClient(league_payload=league_payload))
 
-    events = provider.get_events("555")
+    with caplog.at_level("WARNING", logger="saavygambler.providers.decoding"):
+        events = provider.get_events("555")
+        again = provider.get_events("555")
 
-    assert len(events) == 1
-    event = events[0]
-    assert event.event_date == date.today()
+    assert [event.event_id for event in events] == ["9997"]
+    assert events[0].event_date == date(2024, 2, 1)
+    assert [event.event_id for event in again] == ["9997"]
+    # Logged per record on every decode, not once per distinct cached value.
+    assert sum("'not-a-date'" in message for message in caplog.messages) == 2
+    assert sum("dateEvent=None" in message for message in caplog.messages) == 2
 
 
 def test_provider_uses_free_lookup_key_when_api_key_missing():
@@ -144,3 +145,79 @@ def test_provider_uses_free_lookup_key_when_api_key_missing():
     assert dummy_client.requests
     first_request = dummy_client.requests[0]
     assert first_request["url"].startswith(f"{BASE_URL}/1/")
+
+
+class AsyncDummyClient(DummyClient):
+    async def get_json(self, url, *, params=None, **kwargs):
+        return DummyClient.get_json(self, url, params=params, **kwargs)
+
+
+def test_async_provider_lookup_events_preserves_order():
+    payloads = {
+        event_id: {
+            "events": [
+                {
+                    "idEvent": event_id,
+                    "idHomeTeam": "1",
+                    "idAwayTeam": "2",
+                    "dateEvent": "2024-03-0" + event_id[-1],
+                }
+            ]
+        }
+        for event_id in ("E1", "E2", "E3")
+    }
+    provider = AsyncTheSportsDBProvider(client=AsyncDummyClient(event_payloads=payloads))
+
+    events = asyncio.run(provider.lookup_events(["E3", "E1", "E2"]))
+
+    assert [event.event_id for event in events] == ["E3", "E1", "E2"]
+    assert events[0].event_date == date(2024, 3, 3)
+
+
+class SlowFlakyClient(DummyClient):
+    def get_json(self, url, *, params=None, **kwargs):
+        event_id = params["id"]
+        time.sleep(0.05 if event_id == "E1" else 0)
+        if event_id == "bad":
+            raise RuntimeError("upstream exploded")
+        return {"events": [{"idEvent": event_id, "idHomeTeam": "1", "idAwayTeam": "2", "dateEvent": "2024-03-01"}]}
+
+
+def test_lookup_events_fans_out_in_order_and_isolates_errors():
+    provider = TheSportsDBProvider(client=SlowFlakyClient())
+
+    batch = provider.lookup_events_batch(["E1", "bad", "E2", "E3"])
+    events = provider.lookup_events(["E1", "bad", "E2", "E3"])
+
+    assert [event.event_id for event in events] == ["E1", "E2", "E3"]
+    assert list(batch.errors) == ["bad"]
+    assert isinstance(batch.errors["bad"], RuntimeError)
+
+
+class SeasonClient:
+    def __init__(self):
+        self.requests = []
+
+    def get_json(self, url, *, params=None, decoder=None, **kwargs):
+        self.requests.append((url.rsplit("/", 1)[-1], dict(params or {})))
+        if url.endswith("search_all_seasons.php"):
+            return {"seasons": [{"strSeason": "2022-2023"}, {"strSeason": "2023-2024"}]}
+        assert decoder is not None
+        season = params.get("s", "past")
+        return {"events": [{"idEvent": f"{season}-{index}", "dateEvent": "2023-01-0" + str(index + 1)} for index in range(2)]}
+
+
+def test_iter_season_events_streams_every_season_lazily():
+    client = SeasonClient()
+    provider = TheSportsDBProvider(client=client)
+
+    events = provider.iter_season_events("4328")
+    assert client.requests == []
+    first = next(events)
+    assert first.event_id == "2022-2023-0"
+    assert len(client.requests) == 2
+
+    rest = [event.event_id for event in events]
+    assert rest == ["2022-2023-1", "2023-2024-0", "2023-2024-1"]
+    assert client.requests[-1] == ("eventsseason.php", {"id": "4328", "s": "2023-2024"})
+    assert [event.event_id for event in provider.iter_past_events("4328")] == ["past-0", "past-1"]